@@ -0,0 +1,110 @@
+"""
+Benchmark cases. Every case is a setup function returning the zero-argument callable to be timed,
+so that fixtures (keys, encoded messages, signed payloads) are not part of the measurement.
+"""
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from cfx_account import Account
+from cfx_account.messages import encode_defunct, encode_structured_data
+
+Setup = Callable[[], Callable[[], Any]]
+
+PRIVATE_KEY = "0xcc7939276283a32f60d2fad7d16cac972300308fe99ec98d0e63765d02e24863"
+MNEMONIC = "faint also eye industry survey unhappy boil public lemon myself cube sense"
+TYPED_DATA = json.loads((Path(__file__).parent.parent / "tests" / "typed-data.json").read_text())
+# keystore KDF work factors used by the encrypt/decrypt cases,
+# lower than the defaults to keep a full run short while still dominated by the KDF
+SCRYPT_N = 2**14
+PBKDF2_ITERATIONS = 2**16
+
+LARGE_DATA = bytes(range(256)) * 512  # 128 KiB
+ACCESS_LIST = [
+    {
+        "address": "cfxtest:aak7fsws4u4yf38fk870218p1h3gxut3ku00u1k1da",
+        "storageKeys": ["0x%064x" % (address_index * 100 + key_index) for key_index in range(10)],
+    }
+    for address_index in range(20)
+]
+
+
+def legacy_transaction(**overrides: Any) -> Dict[str, Any]:
+    return {
+        "to": "cfxtest:aak7fsws4u4yf38fk870218p1h3gxut3ku00u1k1da",
+        "nonce": 1,
+        "value": 10**18,
+        "gas": 21000,
+        "gasPrice": 10**9,
+        "storageLimit": 0,
+        "epochHeight": 100,
+        "chainId": 1,
+        **overrides,
+    }
+
+
+def cip1559_transaction(**overrides: Any) -> Dict[str, Any]:
+    transaction = legacy_transaction(maxFeePerGas=2 * 10**9, maxPriorityFeePerGas=10**9, **overrides)
+    del transaction["gasPrice"]
+    return transaction
+
+
+def sign_transaction(transaction: Dict[str, Any]) -> Setup:
+    def setup() -> Callable[[], Any]:
+        return lambda: Account.sign_transaction(dict(transaction), PRIVATE_KEY)
+    return setup
+
+
+def recover_transaction(transaction: Dict[str, Any]) -> Setup:
+    def setup() -> Callable[[], Any]:
+        raw_transaction = Account.sign_transaction(dict(transaction), PRIVATE_KEY).raw_transaction
+        return lambda: Account.recover_transaction(raw_transaction)
+    return setup
+
+
+def recover_message() -> Callable[[], Any]:
+    message = encode_defunct(text="Hello World")
+    signature = Account.sign_message(message, PRIVATE_KEY).signature
+    return lambda: Account.recover_message(message, signature=signature)
+
+
+def encrypt(kdf: str, iterations: int) -> Setup:
+    def setup() -> Callable[[], Any]:
+        return lambda: Account.encrypt(PRIVATE_KEY, "password", kdf=kdf, iterations=iterations)  # type: ignore
+    return setup
+
+
+def decrypt(kdf: str, iterations: int) -> Setup:
+    def setup() -> Callable[[], Any]:
+        keyfile = Account.encrypt(PRIVATE_KEY, "password", kdf=kdf, iterations=iterations)  # type: ignore
+        return lambda: Account.decrypt(keyfile, "password")
+    return setup
+
+
+def local_account_address(network_id: Any) -> Setup:
+    def setup() -> Callable[[], Any]:
+        account = Account.from_key(PRIVATE_KEY, network_id)
+        return lambda: account.address
+    return setup
+
+
+CASES: Dict[str, Setup] = {
+    "sign_transaction/legacy": sign_transaction(legacy_transaction()),
+    "sign_transaction/legacy_large_data": sign_transaction(legacy_transaction(data=LARGE_DATA)),
+    "sign_transaction/cip1559": sign_transaction(cip1559_transaction()),
+    "sign_transaction/cip1559_access_list": sign_transaction(cip1559_transaction(accessList=ACCESS_LIST)),
+    "sign_transaction/cip1559_large_data": sign_transaction(cip1559_transaction(data=LARGE_DATA)),
+    "recover_transaction/legacy": recover_transaction(legacy_transaction()),
+    "recover_transaction/cip1559": recover_transaction(cip1559_transaction(accessList=ACCESS_LIST)),
+    "recover_message/defunct": recover_message,
+    "encode_structured_data": lambda: (lambda: encode_structured_data(TYPED_DATA)),
+    "encode_defunct": lambda: (lambda: encode_defunct(text="Hello World")),
+    "from_mnemonic": lambda: (lambda: Account.from_mnemonic(MNEMONIC)),
+    "create": lambda: Account.create,
+    "encrypt/scrypt": encrypt("scrypt", SCRYPT_N),
+    "encrypt/pbkdf2": encrypt("pbkdf2", PBKDF2_ITERATIONS),
+    "decrypt/scrypt": decrypt("scrypt", SCRYPT_N),
+    "decrypt/pbkdf2": decrypt("pbkdf2", PBKDF2_ITERATIONS),
+    "local_account_address/hex": local_account_address(None),
+    "local_account_address/base32": local_account_address(1029),
+}
@@ -0,0 +1,105 @@
+"""
+Runs the benchmark suite offline and optionally gates on a baseline.
+
+    python -m benchmarks.run --output current.json
+    python -m benchmarks.run --baseline baseline.json --max-slowdown 0.2
+
+The run exits with status 1 if any case is slower than its baseline by more than ``--max-slowdown``.
+Timings depend on the machine, so compare runs from the same host.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.cases import CASES
+
+
+def time_case(function: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, Any]:
+    """
+    Calibrates the number of loops so that one repetition lasts at least ``min_time`` seconds,
+    then returns per-operation timings in seconds.
+    """
+    timer = timeit.Timer(function)
+    loops, elapsed = timer.autorange()
+    while elapsed < min_time:
+        loops *= 2
+        elapsed = timer.timeit(loops)
+    per_op = sorted(seconds / loops for seconds in timer.repeat(repeat, loops))
+    return {
+        "best": per_op[0],
+        "median": per_op[len(per_op) // 2],
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run(names: List[str], min_time: float, repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name in names:
+        results[name] = time_case(CASES[name](), min_time, repeat)
+        print(f"{name:<45} {results[name]['best'] * 1e6:>12.1f} us", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_slowdown: float) -> List[str]:
+    """
+    Returns a description of every case whose best time regressed by more than ``max_slowdown``,
+    e.g. 0.2 allows cases to be 20% slower than the baseline.
+    Cases missing from either run are ignored.
+    """
+    regressions: List[str] = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        ratio = result["best"] / baseline["results"][name]["best"]
+        if ratio > 1 + max_slowdown:
+            regressions.append(f"{name}: {ratio:.2f}x the baseline")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this string")
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("-b", "--baseline", help="compare against results of a previous run")
+    parser.add_argument("--max-slowdown", type=float, default=0.2, help="allowed relative slowdown, default 0.2")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per repetition, default 0.2")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions, default 5")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    current = run(names, args.min_time, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.max_slowdown)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+def eth_eoa_address_bytes_to_cfx(canonical_address: bytes) -> bytes:
+    """
+    Byte-level counterpart of :func:`cfx_address.eth_eoa_address_to_cfx_hex`:
+    replaces the first nibble of a 20-byte ethereum EOA address with 0x1.
+    """
+    return bytes((canonical_address[0] & 0x0F | 0x10,)) + canonical_address[1:]
@@ -0,0 +1,55 @@
+import hashlib
+import os
+from typing import Callable, Iterable, List, Union
+
+from eth_hash.auto import keccak
+from eth_keys import keys
+from eth_keys.backends.coincurve import is_coincurve_available
+from eth_keys.datatypes import PrivateKey
+
+from cfx_account._utils.addresses import eth_eoa_address_bytes_to_cfx
+
+# order of the secp256k1 group, private keys are in [1, SECP256K1_N)
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
+def random_private_keys(count: int, extra_entropy: Union[str, bytes] = "") -> List[bytes]:
+    """
+    ``count`` private keys from a single ``os.urandom`` call.
+    ``extra_entropy`` is expanded with SHAKE-256 and xor-ed into the randomness.
+    """
+    randomness = os.urandom(32 * count)
+    if extra_entropy:
+        if isinstance(extra_entropy, str):
+            extra_entropy = extra_entropy.encode()
+        # salted, so the same extra entropy never gives the same stream
+        stream = hashlib.shake_256(os.urandom(32) + extra_entropy).digest(32 * count)
+        randomness = (int.from_bytes(randomness, "big") ^ int.from_bytes(stream, "big")).to_bytes(32 * count, "big")
+    private_keys = [randomness[offset:offset + 32] for offset in range(0, 32 * count, 32)]
+    for index, private_key in enumerate(private_keys):
+        # happens with probability ~2**-128
+        while not 0 < int.from_bytes(private_key, "big") < SECP256K1_N:
+            private_key = os.urandom(32)
+        private_keys[index] = private_key
+    return private_keys
+
+
+def _public_key_deriver() -> Callable[[bytes], bytes]:
+    # 64-byte uncompressed public key of a valid private key
+    if is_coincurve_available():
+        from coincurve import PublicKey
+
+        return lambda private_key: PublicKey.from_valid_secret(private_key).format(compressed=False)[1:]
+    backend = keys.backend
+    return lambda private_key: backend.private_key_to_public_key(PrivateKey(private_key)).to_bytes()
+
+
+def derive_address_bytes(private_keys: Iterable[bytes]) -> List[bytes]:
+    """
+    The 20-byte Conflux hex addresses of valid private keys, without building key objects.
+    Public keys are derived with coincurve if it is installed.
+    """
+    derive_public_key = _public_key_deriver()
+    return [
+        eth_eoa_address_bytes_to_cfx(keccak(derive_public_key(private_key))[12:]) for private_key in private_keys
+    ]
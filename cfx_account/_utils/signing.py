@@ -1,36 +1,75 @@
 from typing import (
+    Optional,
     Tuple,
 )
 from cfx_utils.types import TxParam
 from eth_keys.datatypes import PrivateKey
 
-from cfx_utils.token_unit import (
-    to_int_if_drip_units,
+from .units import (
+    drip_units_to_int,
 )
 
+from ..backends import (
+    SigningBackend,
+    warn_if_default_backend_is_slow,
+)
+from ..metrics import (
+    StageTimer,
+)
+from ..transactions.base import (
+    TransactionImplementation,
+)
 from ..transactions.transactions import (
     Transaction,
 )
 
 
 def sign_transaction_dict(
-    eth_key: PrivateKey, transaction_dict: TxParam
+    eth_key: PrivateKey,
+    transaction_dict: TxParam,
+    timer: Optional[StageTimer] = None,
+    backend: Optional[SigningBackend] = None,
 ) -> Tuple[int, int, int, bytes]:
-    if not transaction_dict.get("gasPrice") is None:
-        transaction_dict["gasPrice"] = to_int_if_drip_units(transaction_dict["gasPrice"])  # type: ignore
-    if not transaction_dict.get("value") is None:
-        transaction_dict["value"] = to_int_if_drip_units(transaction_dict["value"])  # type: ignore
-    if not transaction_dict.get("maxFeePerGas") is None:
-        transaction_dict["maxFeePerGas"] = to_int_if_drip_units(transaction_dict["maxFeePerGas"])  # type: ignore
-    if not transaction_dict.get("maxPriorityFeePerGas") is None:
-        transaction_dict["maxPriorityFeePerGas"] = to_int_if_drip_units(transaction_dict["maxPriorityFeePerGas"])  # type: ignore
+    transaction, transaction_hash = format_transaction(transaction_dict, timer)
+    return sign_formatted_transaction(eth_key, transaction, transaction_hash, timer, backend)
+
+
+def format_transaction(
+    transaction_dict: TxParam, timer: Optional[StageTimer] = None
+) -> Tuple[TransactionImplementation, bytes]:
+    """
+    Returns the transaction with defaults filled and its signing hash.
+    """
+    # returns a copy if any field is converted: the caller's dict may be shared with other threads
+    transaction_dict = drip_units_to_int(transaction_dict)
+    if timer:
+        timer.lap("drip_conversion")
     # generate RLP-serializable transaction, with defaults filled
     transaction = Transaction.from_dict(transaction_dict)
+    if timer:
+        timer.lap("formatting")
+
+    # same as transaction.hash(), split to time encoding and hashing separately
+    signing_payload = transaction.signing_payload()
+    if timer:
+        timer.lap("rlp_encode")
+    transaction_hash = signing_payload.keccak()
+    if timer:
+        timer.lap("keccak")
+    return transaction, transaction_hash
 
-    transaction_hash = transaction.hash()
 
+def sign_formatted_transaction(
+    eth_key: PrivateKey,
+    transaction: TransactionImplementation,
+    transaction_hash: bytes,
+    timer: Optional[StageTimer] = None,
+    backend: Optional[SigningBackend] = None,
+) -> Tuple[int, int, int, bytes]:
     # sign with private key
-    (v, r, s) = sign_transaction_hash(eth_key, transaction_hash)
+    (v, r, s) = sign_transaction_hash(eth_key, transaction_hash, backend)
+    if timer:
+        timer.lap("ecdsa")
 
     # serialize transaction with rlp
     raw_transaction = transaction.append_signature(v=v,r=r,s=s).encode()
@@ -39,7 +78,10 @@ def sign_transaction_dict(
 
 
 def sign_transaction_hash(
-    key: PrivateKey, transaction_hash: bytes
+    key: PrivateKey, transaction_hash: bytes, backend: Optional[SigningBackend] = None
 ) -> Tuple[int, int, int]:
+    if backend is not None:
+        return backend.sign(transaction_hash, key)
+    warn_if_default_backend_is_slow()
     signature = key.sign_msg_hash(transaction_hash)
     return signature.vrs
@@ -0,0 +1,90 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from cfx_utils.token_unit import AbstractTokenUnit, Drip
+from cfx_utils.exceptions import InvalidTokenValuePrecision
+from cfx_utils.types import TxParam
+
+# fields which accept token units, e.g. CFX(1) or GDrip(1)
+DRIP_UNIT_FIELDS = ("gasPrice", "value", "maxFeePerGas", "maxPriorityFeePerGas")
+
+# token unit class -> 10 ** (decimals of the class)
+_scales: Dict[Type[AbstractTokenUnit], int] = {}
+
+
+def to_int_if_drip_units(value: Any) -> Any:
+    """
+    Same as :func:`cfx_utils.token_unit.to_int_if_drip_units`:
+    converts Drip-based token units to an int in Drip and returns anything else unchanged.
+    Plain ints and hex strings are returned after a type check,
+    units are converted with integer arithmetic instead of ``unit.to(Drip)``.
+    """
+    value_type = type(value)
+    if value_type is int or value_type is str or not isinstance(value, AbstractTokenUnit):
+        return value
+    scale = _scales.get(value_type)
+    if scale is None:
+        base_unit = value_type(1).to_base_unit()
+        if type(base_unit) is not Drip:
+            # raises TokenUnitNotMatch
+            return value.to(Drip).value
+        scale = _scales[value_type] = base_unit.value
+    amount = value.value
+    if type(amount) is int:
+        return amount * scale
+    numerator, denominator = amount.as_integer_ratio()
+    drip, remainder = divmod(numerator * scale, denominator)
+    if remainder:
+        raise InvalidTokenValuePrecision(f"{value} can not be represented as an integer in Drip")
+    return drip
+
+
+def drip_units_to_int(transaction_dict: TxParam) -> TxParam:
+    """
+    Converts the token unit fields of a transaction to ints in Drip.
+    The transaction is returned as is if no field needs conversion, a converted copy otherwise.
+    """
+    converted = None
+    for field in DRIP_UNIT_FIELDS:
+        value = transaction_dict.get(field)
+        if value is None:
+            continue
+        drip = to_int_if_drip_units(value)
+        if drip is not value:
+            if converted is None:
+                converted = dict(transaction_dict)
+            converted[field] = drip
+    return transaction_dict if converted is None else converted  # type: ignore
+
+
+def drip_units_to_int_many(transactions: Iterable[TxParam]) -> List[TxParam]:
+    """
+    :func:`drip_units_to_int` for a batch.
+    Unit objects shared by several transactions, e.g. one ``GDrip(1)`` gas price, are converted once.
+    Items which are not dict-like are returned as is.
+    """
+    # id(unit object) -> (unit object, drip), keeping the object alive keeps its id unique
+    converted_units: Dict[int, Tuple[Any, int]] = {}
+    results: List[TxParam] = []
+    for transaction_dict in transactions:
+        if not isinstance(transaction_dict, Mapping):
+            results.append(transaction_dict)
+            continue
+        converted = None
+        for field in DRIP_UNIT_FIELDS:
+            value = transaction_dict.get(field)
+            if value is None or type(value) is int or type(value) is str:
+                continue
+            cached = converted_units.get(id(value))
+            if cached is None:
+                drip = to_int_if_drip_units(value)
+                if drip is value:
+                    continue
+                converted_units[id(value)] = (value, drip)
+            else:
+                drip = cached[1]
+            if converted is None:
+                converted = dict(transaction_dict)
+            converted[field] = drip
+        results.append(transaction_dict if converted is None else converted)  # type: ignore
+    return results
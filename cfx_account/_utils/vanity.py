@@ -0,0 +1,205 @@
+"""
+Search for private keys whose address matches a prefix or a predicate, see :meth:`Account.create_matching`.
+"""
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from cfx_address.utils import validate_network_id
+
+from cfx_account.addresses import encode_base32, network_id_from_prefix, to_checksum_address_bytes
+from cfx_account._utils.keygen import derive_address_bytes, random_private_keys
+
+# base32 payload alphabet, see cfx_account.addresses
+_ALPHABET = "abcdefghjkmnprstuvwxyz0123456789"
+
+AddressMatcher = Callable[[bytes], bool]
+ProgressCallback = Callable[[int, float], None]
+
+
+class PrefixMatcher:
+    """
+    Matches raw 20-byte addresses whose leading ``bits`` bits equal ``value``.
+    """
+
+    __slots__ = ("head", "tail_bits", "tail")
+
+    def __init__(self, value: int, bits: int):
+        head_bits = bits - bits % 8
+        self.head = (value >> (bits - head_bits)).to_bytes(head_bits // 8, "big")
+        self.tail_bits = bits - head_bits
+        self.tail = value & ((1 << self.tail_bits) - 1)
+
+    def __call__(self, address: bytes) -> bool:
+        if not address.startswith(self.head):
+            return False
+        return not self.tail_bits or address[len(self.head)] >> (8 - self.tail_bits) == self.tail
+
+
+class PredicateMatcher:
+    """
+    Matches raw 20-byte addresses for which ``predicate(address)`` is true,
+    ``address`` being a Base32Address if ``network_id`` is not None, else a checksum hex address.
+    """
+
+    __slots__ = ("predicate", "network_id")
+
+    def __init__(self, predicate: Callable[[str], bool], network_id: Optional[int]):
+        self.predicate = predicate
+        self.network_id = network_id
+
+    def __call__(self, address: bytes) -> bool:
+        if self.network_id is None:
+            return bool(self.predicate(to_checksum_address_bytes(address)))
+        return bool(self.predicate(encode_base32(address, self.network_id)))
+
+
+def _prefix_matcher(value: int, bits: int, prefix: str) -> PrefixMatcher:
+    # user addresses start with the bits 0001
+    fixed_bits = min(bits, 4)
+    if value >> (bits - fixed_bits) != 1 >> (4 - fixed_bits):
+        raise ValueError(f"No user address starts with {prefix}")
+    return PrefixMatcher(value, bits)
+
+
+def parse_prefix(prefix: str, network_id: Optional[int]) -> Tuple[PrefixMatcher, Optional[int]]:
+    """
+    Parses a hex prefix such as ``0x1abc`` or a base32 prefix such as ``cfx:aat``, case-insensitively.
+
+    :raises ValueError: the prefix is malformed, can not match a user address,
+        or is a base32 prefix of a network other than ``network_id``
+    :return Tuple[PrefixMatcher, Optional[int]]: the matcher and the network id of the account
+    """
+    lowered = prefix.lower()
+    if lowered.startswith("0x"):
+        digits = lowered[2:]
+        if not digits:
+            raise ValueError("The prefix should contain at least one hex digit")
+        try:
+            value = int(digits, 16)
+        except ValueError:
+            raise ValueError(f"Invalid hex prefix: {prefix}")
+        return _prefix_matcher(value, 4 * len(digits), prefix), network_id
+
+    network_prefix, separator, payload = lowered.partition(":")
+    if not separator or ":" in payload:
+        raise ValueError(f'Expecting a "0x" hex prefix or a "<network>:" base32 prefix, received {prefix}')
+    prefix_network_id = network_id_from_prefix(network_prefix)
+    if network_id is not None and network_id != prefix_network_id:
+        raise ValueError(f"The prefix {prefix} does not belong to network {network_id}")
+    if not payload or any(character not in _ALPHABET for character in payload):
+        raise ValueError(f"Invalid base32 prefix: {prefix}")
+    value = 0
+    for character in payload:
+        value = value << 5 | _ALPHABET.index(character)
+    bits = 5 * len(payload)
+    # the payload starts with the version byte 0
+    version_bits = min(bits, 8)
+    if value >> (bits - version_bits):
+        raise ValueError(f"No user address starts with {prefix}")
+    if bits <= 8:
+        return PrefixMatcher(0, 0), prefix_network_id
+    bits -= 8
+    return _prefix_matcher(value & ((1 << bits) - 1), bits, prefix), prefix_network_id
+
+
+def make_matcher(
+    predicate_or_prefix: Union[str, Callable[[str], bool]], network_id: Optional[int]
+) -> Tuple[AddressMatcher, Optional[int]]:
+    if network_id is not None:
+        validate_network_id(network_id)
+    if isinstance(predicate_or_prefix, str):
+        return parse_prefix(predicate_or_prefix, network_id)
+    if not callable(predicate_or_prefix):
+        raise TypeError(f"Expecting a prefix or a predicate, received {type(predicate_or_prefix)}")
+    return PredicateMatcher(predicate_or_prefix, network_id), network_id
+
+
+def _search_worker(matcher: AddressMatcher, batch_size: int, stop: Any, attempts: Any, results: Any) -> None:
+    # puts (private key, None) on a match, (None, exception) if the matcher raises
+    try:
+        while not stop.is_set():
+            private_keys = random_private_keys(batch_size)
+            for tried, (private_key, address) in enumerate(zip(private_keys, derive_address_bytes(private_keys)), 1):
+                if matcher(address):
+                    with attempts.get_lock():
+                        attempts.value += tried
+                    results.put((private_key, None))
+                    return
+            with attempts.get_lock():
+                attempts.value += batch_size
+    except Exception as e:
+        results.put((None, e))
+
+
+def search(
+    matcher: AddressMatcher,
+    workers: int,
+    batch_size: int,
+    timeout: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+    progress: Optional[ProgressCallback] = None,
+    progress_interval: float = 1.0,
+) -> Tuple[bytes, int, float]:
+    """
+    Generates keys in ``workers`` processes, or in a thread if ``workers`` is 1, until one matches.
+
+    :raises TimeoutError: no key matched within ``timeout`` seconds
+    :raises CancelledError: ``cancel`` was set
+    :return Tuple[bytes, int, float]: the private key, the number of keys tried and the elapsed seconds
+    """
+    context = multiprocessing.get_context()
+    attempts = context.Value("Q", 0)
+    stop: Any
+    results: Any
+    runners: List[Any]
+    if workers == 1:
+        stop, results = threading.Event(), queue.Queue()
+        arguments = (matcher, batch_size, stop, attempts, results)
+        runners = [threading.Thread(target=_search_worker, args=arguments, daemon=True)]
+    else:
+        stop, results = context.Event(), context.Queue()
+        arguments = (matcher, batch_size, stop, attempts, results)
+        runners = [context.Process(target=_search_worker, args=arguments, daemon=True) for _ in range(workers)]
+    started = time.perf_counter()
+    deadline = None if timeout is None else started + timeout
+    next_report = started + progress_interval
+    for runner in runners:
+        runner.start()
+    try:
+        while True:
+            now = time.perf_counter()
+            wait = next_report - now
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            if cancel is not None:
+                # cancel is not waited on, check it at least every 100ms
+                wait = min(wait, 0.1)
+            try:
+                private_key, error = results.get(timeout=max(wait, 0))
+                if error is not None:
+                    raise error
+                break
+            except queue.Empty:
+                pass
+            now = time.perf_counter()
+            if cancel is not None and cancel.is_set():
+                raise CancelledError()
+            if deadline is not None and now >= deadline:
+                raise TimeoutError(f"No matching address found in {timeout} seconds, {attempts.value} keys tried")
+            if progress is not None and now >= next_report:
+                progress(attempts.value, attempts.value / (now - started))
+                next_report = now + progress_interval
+    finally:
+        stop.set()
+        for runner in runners:
+            runner.join(1)
+            if not isinstance(runner, threading.Thread) and runner.is_alive():
+                runner.terminate()
+    elapsed = time.perf_counter() - started
+    if progress is not None:
+        progress(attempts.value, attempts.value / elapsed if elapsed else 0.0)
+    return private_key, attempts.value, elapsed
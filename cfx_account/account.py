@@ -1,3 +1,6 @@
+import os
+import threading
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Optional,
@@ -7,6 +10,11 @@ from typing import (
     Any,
     Tuple,
     TypeVar,
+    List,
+    Sequence,
+    Callable,
+    Iterable,
+    Iterator,
 )
 from typing_extensions import Literal
 from eth_keys import (
@@ -29,7 +37,10 @@ from eth_account.datastructures import (
 from eth_account.messages import (
     SignableMessage,
 )
-from cfx_account.signers.local import LocalAccount
+from cfx_account.messages import (
+    hash_signable_message,
+)
+from cfx_account.signers.local import CompactLocalAccount, LocalAccount
 from eth_utils.crypto import (
     keccak,
 )
@@ -43,15 +54,63 @@ from hexbytes import (
     HexBytes,
 )
 from eth_utils.address import to_checksum_address
+from eth_utils.conversions import to_bytes, to_int
+from eth_utils.curried import apply_formatters_to_dict, hexstr_if_str
 from eth_account.datastructures import (
     # SignedMessage,
     SignedTransaction,
 )
+from eth_account._utils.signing import (
+    to_eth_v,
+    to_standard_signature_bytes,
+    to_standard_v,
+)
+from cfx_account._utils.keygen import derive_address_bytes, random_private_keys
+from cfx_account._utils.vanity import make_matcher, search
+from cfx_account.addresses import to_checksum_address_bytes
+from cfx_account._utils.cache import (
+    CacheInfo,
+    LRUCache,
+)
 from cfx_account._utils.signing import (
+    format_transaction,
+    sign_formatted_transaction,
     sign_transaction_dict,
+    sign_transaction_hash,
+)
+from cfx_account import metrics
+from cfx_account.backends import (
+    BackendSpec,
+    SigningBackend,
+    default_backend,
+    warn_if_default_backend_is_slow,
+    get_backend,
+    self_test,
+)
+from cfx_account._utils.units import (
+    drip_units_to_int,
+)
+from cfx_account.transactions.columnar import (
+    ColumnarTransactions,
+    decode_transactions_columnar,
+)
+from cfx_account.transactions.encoding import (
+    encode_signed_rlp,
+)
+from cfx_account.transactions.prepared import (
+    PreparedTransaction,
+    attach_signature,
+    prepare_transaction,
+)
+from cfx_account.transactions.transaction_utils import (
+    TYPED_TRANSACTION_FORMATTERS,
+)
+from cfx_account.transactions.transactions import (
+    Transaction,
 )
-from cfx_account.transactions.legacy_transactions import (
-    LegacyTransaction,
+from cfx_account.transactions.views import (
+    BytesLike,
+    RawTransactionView,
 )
 from cfx_address import (
     Base32Address,
@@ -59,6 +118,7 @@ from cfx_address import (
 )
 from cfx_address.utils import (
     normalize_to,
+    validate_network_id,
 )
 from cfx_utils.types import (
     TxParam,
@@ -80,16 +140,192 @@ CONFLUX_DEFAULT_PATH = "m/44'/503'/0'/0/0"
 VRS = TypeVar("VRS", bytes, HexStr, int)
 
 
+def drop_matching_from(transaction_dict: TxDict, hex_address: ChecksumAddress) -> TxDict:
+    """
+    Returns the transaction without its from field, which is *only* allowed if it matches the signing key.
+
+    :raises ValueError: transaction's from field does not match hex_address
+    """
+    if "from" not in transaction_dict:
+        return transaction_dict
+    if normalize_to(transaction_dict["from"], None) == normalize_to(hex_address, None):
+        return cast(TxDict, dissoc(transaction_dict, "from"))
+    raise ValueError(
+        "transaction[from] does match key's hex address: "
+        f"from's hex address is {Base32Address(transaction_dict['from']).hex_address}, "
+        f"key's hex address is {hex_address}"
+    )
+
+
+def to_signed_transaction(v: int, r: int, s: int, raw_transaction: bytes) -> SignedTransaction:
+    return SignedTransaction(
+        raw_transaction=HexBytes(raw_transaction),
+        hash=HexBytes(keccak(raw_transaction)),
+        r=r,
+        s=s,
+        v=v,
+    )
+
+
+def _private_key_bytes(private_key: Union[bytes, str, PrivateKey]) -> bytes:
+    # the raw key without deriving the public key, as Account.parse_private_key would
+    if isinstance(private_key, PrivateKey):
+        return private_key.to_bytes()
+    key_bytes = bytes(HexBytes(private_key))
+    if len(key_bytes) != 32:
+        # raises the usual error
+        return Account.parse_private_key(private_key).to_bytes()
+    return key_bytes
+
+
+def _exact_transaction_key(transaction_dict: Mapping[str, Any]) -> Optional[Tuple[Tuple[str, type, Any], ...]]:
+    # the dict's items if every value has exactly one of these types, None otherwise:
+    # bools and token units compare equal to ints, access lists are unhashable
+    items = []
+    for field, value in transaction_dict.items():
+        if type(value) not in (int, str, bytes) and value is not None:
+            return None
+        items.append((field, type(value), value))
+    items.sort(key=itemgetter(0))
+    return tuple(items)
+
+
+def _format_overrides(overrides: Mapping[str, Any]) -> Dict[str, Any]:
+    # the same conversions sign_transaction applies, for the overridden fields only
+    return apply_formatters_to_dict(TYPED_TRANSACTION_FORMATTERS, drip_units_to_int(overrides))  # type: ignore
+
+
 class Account(EthAccount):
+    """
+    Class-level settings (``w3``, the signing backend and the caches) are changed under
+    ``_state_lock`` and every operation reads each setting once,
+    so Account can be shared by threads, including on free-threaded CPython.
+    """
+
+    # guards writes of the class-level settings below
+    _state_lock = threading.RLock()
 
     # _default_network_id: Optional[int]=None
     w3: Optional["Web3"] = None
 
     _use_unaudited_hdwallet_features = True
 
+    # maps signed transaction hashes and (message hash, signature) keys to recovered addresses
+    _recover_cache: Optional[LRUCache[ChecksumAddress]] = None
+
+    # maps (keccak of the private key, signing hash) to the signed transaction and the signer's hex address
+    _sign_cache: Optional[LRUCache[Tuple[SignedTransaction, ChecksumAddress]]] = None
+
+    # None means the eth_keys default backend, i.e. key.sign_msg_hash
+    _signing_backend: Optional[SigningBackend] = None
+
     @combomethod
     def set_w3(self, w3: "Web3") -> None:
-        self.w3 = w3
+        with self._state_lock:
+            self.w3 = w3
+
+    @classmethod
+    def enable_unaudited_hdwallet_features(cls) -> None:
+        with cls._state_lock:
+            cls._use_unaudited_hdwallet_features = True
+
+    @combomethod
+    def set_signing_backend(self, backend: Optional[BackendSpec], run_self_test: bool = True) -> SigningBackend:
+        """
+        Selects the secp256k1 backend used by this Account (class or instance) for signing and recovery.
+        Refer to :func:`cfx_account.backends.get_backend` for accepted values.
+
+        :param Optional[BackendSpec] backend: "auto", "coincurve", "pure-python", a callable or a backend object.
+            None restores the eth_keys default
+        :param bool run_self_test: check the backend against the reference implementation first, defaults to True
+        :raises ImportError: "coincurve" is requested but not installed
+        :raises cfx_account.backends.BackendSelfTestError: the backend failed its self test
+        :return SigningBackend: the active backend
+
+        >>> Account.set_signing_backend("coincurve").name
+        'coincurve'
+        """
+        resolved = None if backend is None else get_backend(backend)
+        if resolved is not None and run_self_test:
+            self_test(resolved)
+        with self._state_lock:
+            self._signing_backend = resolved
+        return resolved or default_backend()
+
+    @combomethod
+    def get_signing_backend(self) -> SigningBackend:
+        """
+        Returns the backend used for signing and recovery, reporting the eth_keys default if none is set.
+
+        >>> Account.get_signing_backend().name in ("coincurve", "pure-python")
+        True
+        """
+        return self._signing_backend or default_backend()
+
+    @combomethod
+    def enable_recover_cache(self, maxsize: int = 4096) -> None:
+        """
+        Memoizes :meth:`recover_transaction` and :meth:`recover_message` in a bounded, thread-safe LRU cache.
+        Transactions are keyed by the hash of the signed payload,
+        messages by the message hash and the signature.
+
+        :param int maxsize: maximum number of recovered addresses kept, defaults to 4096
+        """
+        with self._state_lock:
+            self._recover_cache = LRUCache(maxsize)
+
+    @combomethod
+    def disable_recover_cache(self) -> None:
+        """
+        Drops the cache enabled by :meth:`enable_recover_cache`.
+        """
+        with self._state_lock:
+            self._recover_cache = None
+
+    @combomethod
+    def recover_cache_info(self) -> Optional[CacheInfo]:
+        """
+        :return Optional[CacheInfo]: hits, misses, maxsize and currsize of the recover cache, None if it is disabled
+        """
+        cache = self._recover_cache
+        if cache is None:
+            return None
+        return cache.info()
+
+    @combomethod
+    def enable_sign_cache(self, maxsize: int = 4096, ttl: Optional[float] = None) -> None:
+        """
+        Memoizes :meth:`sign_transaction`, so that re-signing a transaction, e.g. when retrying a broadcast,
+        skips the ECDSA signature. Signatures are deterministic (RFC 6979), so a cached result is
+        identical to a fresh one. Entries are keyed by the keccak hash of the private key
+        and the signing hash of the formatted transaction: dicts which differ only in formatting,
+        e.g. hex or base32 receivers or token units, share an entry.
+        Dicts made of plain ints, strings and bytes also get an entry keyed by their items,
+        which skips formatting when the same dict is signed again.
+
+        :param int maxsize: maximum number of signed transactions kept, defaults to 4096
+        :param Optional[float] ttl: seconds an entry is kept, defaults to None, i.e. no expiry
+        """
+        with self._state_lock:
+            self._sign_cache = LRUCache(maxsize, ttl)
+
+    @combomethod
+    def disable_sign_cache(self) -> None:
+        """
+        Drops the cache enabled by :meth:`enable_sign_cache`.
+        """
+        with self._state_lock:
+            self._sign_cache = None
+
+    @combomethod
+    def sign_cache_info(self) -> Optional[CacheInfo]:
+        """
+        :return Optional[CacheInfo]: hits, misses, maxsize and currsize of the sign cache, None if it is disabled
+        """
+        cache = self._sign_cache
+        if cache is None:
+            return None
+        return cache.info()
 
     # def set_default_network_id(self, network_id: int):
     #     self._default_network_id = network_id
@@ -125,9 +361,26 @@ class Account(EthAccount):
             # use network_id is it is not None
             # then use None if self.w3 is not set
             # if self.w3 is set, use self.w3.cfx.chain_id
-            network_id or (self.w3 and self.w3.cfx.chain_id),
+            network_id or self._default_network_id(),
         )
 
+    @combomethod
+    def parse_private_key(self, private_key: Union[bytes, str, int, PrivateKey]) -> PrivateKey:
+        """
+        Returns ``private_key`` as an :class:`eth_keys.datatypes.PrivateKey`, deriving its public key.
+
+        :param Union[bytes,str,int,PrivateKey] private_key: the raw private key, or a key object returned as is
+        :raises ValueError: the key is not a valid private key
+        :return PrivateKey: the key object
+        """
+        return self._parse_private_key(private_key)
+
+    @combomethod
+    def _default_network_id(self) -> Optional[int]:
+        # read w3 once, it might be replaced by another thread
+        w3 = self.w3
+        return w3 and w3.cfx.chain_id
+
     @combomethod
     def sign_transaction(
         self, transaction_dict: TxParam, private_key: Union[bytes, str, PrivateKey],
@@ -175,23 +428,16 @@ class Account(EthAccount):
                 "transaction_dict must be dict-like, got %r" % transaction_dict
             )
 
+        timer = metrics.start("sign_transaction")
+        cache = self._sign_cache
+        if cache is not None:
+            return self._sign_transaction_cached(cache, transaction_dict, private_key, timer)
         account: LocalAccount = self.from_key(private_key)
-        transaction_dict = cast(TxDict, transaction_dict)
-        # allow from field, *only* if it matches the private key
-        if "from" in transaction_dict:
-            if normalize_to(transaction_dict["from"], None) == normalize_to(
-                account.address, None
-            ):
-                sanitized_transaction = cast(TxDict, dissoc(transaction_dict, "from"))
-            else:
-                raise ValueError(
-                    "transaction[from] does match key's hex address: "
-                    f"from's hex address is {Base32Address(transaction_dict['from']).hex_address}, "
-                    f"key's hex address is {account.hex_address}"
-                )
-
-        else:
-            sanitized_transaction = transaction_dict
+        if timer:
+            timer.lap("key_parse")
+        sanitized_transaction = drop_matching_from(cast(TxDict, transaction_dict), account.hex_address)
+        if timer:
+            timer.lap("from_check")
 
         # sign transaction
         (
@@ -200,18 +446,181 @@ class Account(EthAccount):
             s,
             raw_transaction,
         ) = sign_transaction_dict(
-            account._key_obj, sanitized_transaction
+            account.key_obj, sanitized_transaction, timer, self._signing_backend
         )  # type: ignore
 
-        transaction_hash = keccak(raw_transaction)
+        signed_transaction = to_signed_transaction(v, r, s, raw_transaction)
+        if timer:
+            timer.lap("build")
+            timer.finish()
+        return signed_transaction
 
-        return SignedTransaction(
-            raw_transaction=HexBytes(raw_transaction),
-            hash=HexBytes(transaction_hash),
-            r=r,
-            s=s,
-            v=v,
+    @combomethod
+    def _sign_transaction_cached(
+        self,
+        cache: LRUCache[Tuple[SignedTransaction, ChecksumAddress]],
+        transaction_dict: TxParam,
+        private_key: Union[bytes, str, PrivateKey],
+        timer: Optional[metrics.StageTimer],
+    ) -> SignedTransaction:
+        # the key is only parsed, which derives its public key, on a miss
+        key_id = keccak(_private_key_bytes(private_key))
+        # retries usually pass the same dict again: look it up as is before formatting it
+        exact_key = _exact_transaction_key(transaction_dict)
+        if exact_key is not None:
+            cached = cache.get((key_id, exact_key))
+            if cached is not None:
+                if timer:
+                    timer.lap("cache_lookup")
+                    timer.finish()
+                # the from field is part of the key, it matched when the entry was put
+                return cached[0]
+        unsigned_transaction = dissoc(transaction_dict, "from") if "from" in transaction_dict else transaction_dict  # type: ignore
+        transaction, transaction_hash = format_transaction(unsigned_transaction, timer)
+        cached = cache.get((key_id, transaction_hash))
+        if timer:
+            timer.lap("cache_lookup")
+        if cached is not None:
+            signed_transaction, hex_address = cached
+            drop_matching_from(cast(TxDict, transaction_dict), hex_address)
+            if exact_key is not None:
+                cache.put((key_id, exact_key), cached)
+            if timer:
+                timer.lap("from_check")
+                timer.finish()
+            return signed_transaction
+
+        account: LocalAccount = self.from_key(private_key)
+        if timer:
+            timer.lap("key_parse")
+        drop_matching_from(cast(TxDict, transaction_dict), account.hex_address)
+        if timer:
+            timer.lap("from_check")
+        v, r, s, raw_transaction = sign_formatted_transaction(
+            account.key_obj, transaction, transaction_hash, timer, self._signing_backend
         )
+        signed_transaction = to_signed_transaction(v, r, s, raw_transaction)
+        entry = (signed_transaction, account.hex_address)
+        cache.put((key_id, transaction_hash), entry)
+        if exact_key is not None:
+            cache.put((key_id, exact_key), entry)
+        if timer:
+            timer.lap("build")
+            timer.finish()
+        return signed_transaction
+
+    @combomethod
+    def prepare_digests(self, transactions: Sequence[TxParam]) -> List[PreparedTransaction]:
+        """
+        First phase of two-phase signing: formats and encodes the transactions and computes the digests to sign,
+        without any private key. The results can be pickled and sent to the process holding the key.
+
+        :param Sequence[TxParam] transactions: transactions as accepted by :meth:`sign_transaction`
+        :raises TypeError: a transaction is not a dict-like object
+        :return List[PreparedTransaction]: prepared transactions, ``prepared.digest`` is the hash to sign
+
+        >>> prepared = Account.prepare_digests(transactions)
+        >>> vrs_list = [key.sign_msg_hash(item.digest).vrs for item in prepared]
+        >>> signed = Account.attach_signatures(prepared, vrs_list)
+        """
+        return [prepare_transaction(transaction) for transaction in transactions]
+
+    @combomethod
+    def attach_signatures(
+        self,
+        prepared: Sequence[PreparedTransaction],
+        vrs_list: Sequence[Tuple[int, int, int]],
+    ) -> List[SignedTransaction]:
+        """
+        Second phase of two-phase signing: encodes the prepared transactions with their signatures.
+        Signatures are not verified, unless a transaction had a from field,
+        which is then checked against the signer recovered with :meth:`get_signing_backend`.
+
+        :param Sequence[PreparedTransaction] prepared: the results of :meth:`prepare_digests`
+        :param Sequence[Tuple[int,int,int]] vrs_list: a (v, r, s) signature of each digest, v being 0 or 1
+        :raises ValueError: the lengths do not match, a v is not 0 or 1
+            or a signer does not match the transaction's from field
+        :return List[SignedTransaction]: the signed transactions
+        """
+        if len(prepared) != len(vrs_list):
+            raise ValueError(
+                f"Expecting one signature per transaction, got {len(vrs_list)} signatures "
+                f"for {len(prepared)} transactions"
+            )
+        backend = self.get_signing_backend()
+        results = []
+        for item, (v, r, s) in zip(prepared, vrs_list):
+            results.append(to_signed_transaction(v, r, s, attach_signature(item, v, r, s, backend)))
+        return results
+
+    @combomethod
+    def resign(
+        self,
+        raw_transaction: Union[bytes, HexStr],
+        overrides: Mapping[str, Any],
+        private_key: Union[bytes, str, PrivateKey],
+    ) -> SignedTransaction:
+        """
+        Signs again a signed legacy or CIP-1559 transaction with some fields replaced,
+        e.g. to bump the gas price of a stuck transaction.
+        The fields which are not overridden are reused in their encoded form.
+        The original signature is discarded and not checked against private_key.
+
+        :param Union[bytes,HexStr] raw_transaction: the signed raw transaction
+        :param Mapping[str,Any] overrides: new field values, accepting the same formats as :meth:`sign_transaction`,
+            e.g. ``{"gasPrice": GDrip(2), "epochHeight": 1000}``
+        :param Union[bytes,str,PrivateKey] private_key: private_key to be used for signing
+        :raises ValueError: an overridden field is not a field of the transaction type
+        :return SignedTransaction: the re-signed transaction
+
+        >>> signed = Account.sign_transaction(transaction, key)
+        >>> bumped = Account.resign(signed.raw_transaction, {"gasPrice": transaction["gasPrice"] * 2}, key)
+        """
+        return self.resign_many([raw_transaction], overrides, private_key)[0]
+
+    @combomethod
+    def resign_many(
+        self,
+        raw_transactions: Sequence[Union[bytes, HexStr]],
+        overrides: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]],
+        private_key: Union[bytes, str, PrivateKey],
+    ) -> List[SignedTransaction]:
+        """
+        Bulk variant of :meth:`resign`.
+        The key is parsed once and shared overrides are formatted once.
+
+        :param Sequence[Union[bytes,HexStr]] raw_transactions: the signed raw transactions
+        :param overrides: overrides applied to every transaction, or a sequence of overrides, one per transaction
+        :param Union[bytes,str,PrivateKey] private_key: private_key to be used for signing
+        :raises ValueError: an overridden field is not a field of the transaction type,
+            or the number of overrides does not match the number of transactions
+        :return List[SignedTransaction]: the re-signed transactions in input order
+        """
+        if isinstance(overrides, Mapping):
+            formatted_overrides = [_format_overrides(overrides)] * len(raw_transactions)
+        else:
+            if len(overrides) != len(raw_transactions):
+                raise ValueError(
+                    f"Expecting one overrides mapping per transaction, got {len(overrides)} "
+                    f"for {len(raw_transactions)} transactions"
+                )
+            formatted_overrides = [_format_overrides(item) for item in overrides]
+        key = self._parse_private_key(private_key)
+        backend = self._signing_backend
+        results = []
+        for raw_transaction, transaction_overrides in zip(raw_transactions, formatted_overrides):
+            view = RawTransactionView(HexBytes(raw_transaction))
+            for field in transaction_overrides:
+                if field not in view.fields:
+                    raise ValueError(
+                        f"{field} is not a valid field of type {view.transaction_type} transactions: "
+                        f"expecting fields - {list(view.fields)}"
+                    )
+            payload = view.signing_payload(transaction_overrides)
+            (v, r, s) = sign_transaction_hash(key, payload.keccak(), backend)
+            raw = encode_signed_rlp(payload, v, r, s, payload.prefix)
+            results.append(to_signed_transaction(v, r, s, raw))
+        return results
 
     @combomethod
     def from_mnemonic(
@@ -242,7 +651,7 @@ class Account(EthAccount):
         seed = seed_from_mnemonic(mnemonic, passphrase)
         private_key = key_from_seed(seed, account_path)
         key = self._parse_private_key(private_key)
-        return LocalAccount(key, self, network_id or (self.w3 and self.w3.cfx.chain_id))
+        return LocalAccount(key, self, network_id or self._default_network_id())
 
     @combomethod
     def create_with_mnemonic(
@@ -280,7 +689,12 @@ class Account(EthAccount):
         kdf: Optional[Literal["scrypt", "pbkdf2"]] = None,
         iterations: Optional[int] = None,
     ) -> KeyfileDict:
-        return super().encrypt(private_key, password, kdf, iterations)  # type: ignore
+        timer = metrics.start("encrypt")
+        keyfile = super().encrypt(private_key, password, kdf, iterations)  # type: ignore
+        if timer:
+            timer.lap("encrypt")
+            timer.finish()
+        return keyfile  # type: ignore
 
     @staticmethod
     def decrypt(
@@ -293,7 +707,12 @@ class Account(EthAccount):
         :param str password: the password that was used to encrypt the key
         :return HexBytes: the hex private key
         """
-        return EthAccount.decrypt(keyfile_json, password)
+        timer = metrics.start("decrypt")
+        private_key = EthAccount.decrypt(keyfile_json, password)
+        if timer:
+            timer.lap("decrypt")
+            timer.finish()
+        return private_key
 
     @combomethod
     def recover_transaction(
@@ -311,11 +730,46 @@ class Account(EthAccount):
         >>> Account.recover_transaction(raw_transaction)
         '0x1c7536e3605d9c16a7a3d7b1898e529396a65c23'
         """
+        timer = metrics.start("recover_transaction")
         txn_bytes = HexBytes(serialized_transaction)
-        # TODO: replace with Transaction.from_bytes()
-        txn = LegacyTransaction.from_bytes(txn_bytes)
-        recovered_address = self._recover_hash(txn.hash(), vrs=txn.vrs())  # type: ignore
-        return to_checksum_address(eth_eoa_address_to_cfx_hex(recovered_address))
+        cache = self._recover_cache
+        if cache is not None:
+            cache_key = keccak(txn_bytes)
+            cached_address = cache.get(cache_key)
+            if timer:
+                timer.lap("cache_lookup")
+            if cached_address is not None:
+                if timer:
+                    timer.finish()
+                return cached_address
+        txn = Transaction.from_bytes(txn_bytes)
+        transaction_hash = txn.hash()
+        if timer:
+            timer.lap("decode")
+        recovered_address = self._recover_hash(transaction_hash, vrs=txn.vrs())  # type: ignore
+        if timer:
+            timer.lap("ecrecover")
+        address = to_checksum_address(eth_eoa_address_to_cfx_hex(recovered_address))
+        if cache is not None:
+            cache.put(cache_key, address)  # type: ignore
+        if timer:
+            timer.lap("address_format")
+            timer.finish()
+        return address
+
+    @combomethod
+    def decode_transactions_columnar(
+        self, raw_transactions: Iterable[BytesLike], recover_sender: bool = False
+    ) -> ColumnarTransactions:
+        """
+        Decodes many signed raw transactions into NumPy columns, recovering senders with :meth:`get_signing_backend`.
+        See :func:`~cfx_account.transactions.columnar.decode_transactions_columnar`, which requires numpy.
+
+        :param Iterable[BytesLike] raw_transactions: signed raw transactions
+        :param bool recover_sender: whether to fill the ``sender`` column, defaults to False
+        :return ColumnarTransactions: the decoded columns
+        """
+        return decode_transactions_columnar(raw_transactions, recover_sender, self.get_signing_backend())
 
     @combomethod
     def create(
@@ -342,17 +796,108 @@ class Account(EthAccount):
             acct.network_id = network_id
         return acct
 
+    @combomethod
+    def create_many(
+        self,
+        n: int,
+        extra_entropy: str = "",
+        network_id: Optional[int] = None,
+        stream: bool = False,
+        chunk_size: int = 10000,
+    ) -> Union[List[CompactLocalAccount], Iterator[CompactLocalAccount]]:
+        """
+        Creates ``n`` new private keys as :class:`~cfx_account.signers.local.CompactLocalAccount` objects.
+
+        The randomness for all keys is read at once and mixed with ``extra_entropy`` in a single hash,
+        public keys are derived with coincurve directly if it is installed and no key objects are kept.
+
+        :param int n: the number of accounts
+        :param str extra_entropy: Add extra randomness to the randomness provided by your OS, defaults to ''
+        :param Optional[int] network_id: the network id of the generated accounts, defaults to None
+        :param bool stream: return a generator creating ``chunk_size`` accounts at a time instead of a list,
+            defaults to False
+        :param int chunk_size: accounts created per chunk when streaming, defaults to 10000
+        :return: a list or a generator of accounts
+
+        >>> accounts = Account.create_many(1000, network_id=1029)
+        >>> store = CompactKeyStore.from_keys(acct.key for acct in Account.create_many(10**6, stream=True))
+        """
+        if n < 0 or chunk_size < 1:
+            raise ValueError("n should not be negative and chunk_size should be positive")
+        if network_id is not None:
+            validate_network_id(network_id)
+        accounts = self._create_chunks(n, extra_entropy, network_id, chunk_size if stream else max(n, 1))
+        if stream:
+            return accounts
+        return list(accounts)
+
+    @combomethod
+    def _create_chunks(
+        self, n: int, extra_entropy: str, network_id: Optional[int], chunk_size: int
+    ) -> Iterator[CompactLocalAccount]:
+        for offset in range(0, n, chunk_size):
+            private_keys = random_private_keys(min(chunk_size, n - offset), extra_entropy)
+            for private_key, address in zip(private_keys, derive_address_bytes(private_keys)):
+                yield CompactLocalAccount.from_key_and_address(
+                    private_key, to_checksum_address_bytes(address), self, network_id
+                )
+
+    @combomethod
+    def create_matching(
+        self,
+        predicate_or_prefix: Union[str, Callable[[str], bool]],
+        network_id: Optional[int] = None,
+        workers: Optional[int] = None,
+        batch_size: int = 1024,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+        progress: Optional[Callable[[int, float], None]] = None,
+        progress_interval: float = 1.0,
+    ) -> LocalAccount:
+        """
+        Generates random keys until one's address matches, e.g. a recognizable prefix for a hot wallet.
+
+        Prefixes are compared with the raw address bytes, so no address is encoded until one matches.
+        Every extra hex digit multiplies the expected number of attempts by 16, every base32 character by 32.
+
+        :param predicate_or_prefix: a hex prefix such as ``"0x1abc"`` or a base32 prefix such as ``"cfx:aat"``,
+            compared case-insensitively, or a predicate receiving the address of the account,
+            which has to be picklable if ``workers`` > 1
+        :param Optional[int] network_id: the network id of the account, implied by a base32 prefix, defaults to None
+        :param Optional[int] workers: search processes, 1 searches in a thread, defaults to the number of CPUs
+        :param int batch_size: keys generated per batch, defaults to 1024
+        :param Optional[float] timeout: seconds to search for, defaults to no limit
+        :param Optional[threading.Event] cancel: stops the search when set
+        :param progress: called with the number of attempts and attempts per second every ``progress_interval`` seconds,
+            and once when a key is found
+        :raises ValueError: the prefix is malformed or no user address can match it
+        :raises TimeoutError: no address matched within ``timeout`` seconds
+        :raises concurrent.futures.CancelledError: ``cancel`` was set
+        :return LocalAccount: the matching account
+
+        >>> acct = Account.create_matching("cfx:aak", workers=4)
+        >>> acct.address
+        'cfx:aakzmxwrn1rj9bckd1p5j4pb4wyszybb025wgr3cj9'
+        """
+        matcher, network_id = make_matcher(predicate_or_prefix, network_id)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or batch_size < 1:
+            raise ValueError("workers and batch_size should be positive")
+        private_key, _, _ = search(matcher, workers, batch_size, timeout, cancel, progress, progress_interval)
+        return self.from_key(private_key, network_id)
+
     @combomethod
     def sign_message(
         self,
         signable_message: SignableMessage,
-        private_key: Union[bytes, HexStr, int, keys.PrivateKey],
+        private_key: Union[bytes, HexStr, int, PrivateKey],
     ) -> SignedMessage:
         """
         Sign the provided encoded message. The message is encoded according to CIP-23_
 
         :param SignableMessage signable_message: an encoded message generated by `encode_defunct` or `encode_structured_data`
-        :param Union[bytes,HexStr,int,keys.PrivateKey] private_key: the private key used to sign message
+        :param Union[bytes,HexStr,int,PrivateKey] private_key: the private key used to sign message
         :return SignedMessage: a signed message object
 
         :examples:
@@ -395,5 +940,80 @@ class Account(EthAccount):
         :param Optional[bytes] signature: signature bytes concatenated as r+s+v, defaults to None
         :return ChecksumAddress: the checksum address of the account that signed the given message
         """
-        recovered_address = super().recover_message(signable_message, vrs, signature)
-        return to_checksum_address(eth_eoa_address_to_cfx_hex(recovered_address))
+        timer = metrics.start("recover_message")
+        message_hash = hash_signable_message(signable_message)
+        if timer:
+            timer.lap("message_hash")
+        cache = self._recover_cache
+        if cache is not None and (vrs is not None or signature is not None):
+            if vrs is not None:
+                cache_key: Any = (message_hash, *map(hexstr_if_str(to_int), vrs))  # type: ignore
+            else:
+                cache_key = (message_hash, bytes(HexBytes(signature)))  # type: ignore
+            cached_address = cache.get(cache_key)
+            if timer:
+                timer.lap("cache_lookup")
+            if cached_address is not None:
+                if timer:
+                    timer.finish()
+                return cached_address
+        else:
+            cache = None
+        recovered_address = self._recover_hash(message_hash, vrs, signature)
+        if timer:
+            timer.lap("ecrecover")
+        address = to_checksum_address(eth_eoa_address_to_cfx_hex(recovered_address))
+        if cache is not None:
+            cache.put(cache_key, address)  # type: ignore
+        if timer:
+            timer.lap("address_format")
+            timer.finish()
+        return address
+
+    @combomethod
+    def _sign_hash(
+        self,
+        message_hash: bytes,
+        private_key: Union[bytes, HexStr, int, PrivateKey],
+    ) -> SignedMessage:
+        backend = self._signing_backend
+        if backend is None:
+            warn_if_default_backend_is_slow()
+            return super()._sign_hash(message_hash, private_key)
+        msg_hash_bytes = HexBytes(message_hash)
+        if len(msg_hash_bytes) != 32:
+            raise ValueError("The message hash must be exactly 32-bytes")
+        key = self._parse_private_key(private_key)
+        (v_raw, r, s) = backend.sign(msg_hash_bytes, key)
+        v = to_eth_v(v_raw)
+        signature_bytes = r.to_bytes(32, "big") + s.to_bytes(32, "big") + to_bytes(v)
+        return SignedMessage(
+            message_hash=msg_hash_bytes,
+            r=r,
+            s=s,
+            v=v,
+            signature=HexBytes(signature_bytes),
+        )
+
+    @combomethod
+    def _recover_hash(
+        self,
+        message_hash: bytes,
+        vrs: Optional[Tuple[VRS, VRS, VRS]] = None,
+        signature: Optional[bytes] = None,
+    ) -> ChecksumAddress:
+        backend = self._signing_backend
+        if backend is None:
+            return super()._recover_hash(message_hash, vrs, signature)
+        hash_bytes = HexBytes(message_hash)
+        if len(hash_bytes) != 32:
+            raise ValueError("The message hash must be exactly 32-bytes")
+        if vrs is not None:
+            v, r, s = map(hexstr_if_str(to_int), vrs)
+            standard_vrs = (to_standard_v(v), r, s)
+        elif signature is not None:
+            signature_bytes = to_standard_signature_bytes(HexBytes(signature))
+            standard_vrs = keys.Signature(signature_bytes=signature_bytes).vrs
+        else:
+            raise TypeError("You must supply the vrs tuple or the signature bytes")
+        return backend.recover(bytes(hash_bytes), standard_vrs).to_checksum_address()
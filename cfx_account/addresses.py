@@ -0,0 +1,303 @@
+"""
+Bulk conversion between hex and CIP-37 base32 addresses.
+
+The results are the same as ``Base32Address(hex_address, network_id)`` and ``Base32Address(address).hex_address``,
+computed without building intermediate objects:
+
+ * the base32 checksum polymod is linear, so the contribution of every value of every address byte
+   is tabulated once, and the checksum of an address is 20 table lookups
+ * the network prefix part of the checksum is computed once per network
+ * hex checksums (EIP-55) are computed from the keccak hash bytes directly
+
+>>> to_base32_many(["0x1ecde7223747601823f7535d7968ba98b4881e09"], 1)
+['cfxtest:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4']
+>>> to_hex_many(["cfxtest:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4"])
+['0x1ECdE7223747601823f7535d7968Ba98b4881E09']
+
+Both functions accept an optional :class:`~cfx_account._utils.cache.LRUCache`
+for workloads converting the same addresses repeatedly.
+NumPy ``(N, 20)`` uint8 arrays of raw addresses are accepted by :func:`to_base32_many` and converted vectorized.
+"""
+import base64
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from cfx_address import Base32Address
+from cfx_address.utils import validate_network_id
+from cfx_utils.exceptions import InvalidBase32Address, InvalidConfluxHexAddress, InvalidHexAddress
+from cfx_utils.types import ChecksumAddress
+from eth_hash.auto import keccak
+
+from cfx_account._utils.cache import LRUCache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_STANDARD_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_ALPHABET = b"abcdefghjkmnprstuvwxyz0123456789"
+_TO_CUSTOM = bytes.maketrans(_STANDARD_ALPHABET, _ALPHABET)
+# base32 words as the digits of int(..., 32)
+_TO_DIGITS = str.maketrans(_ALPHABET.decode(), "0123456789abcdefghijklmnopqrstuv")
+_CHARACTERS = frozenset(_ALPHABET.decode())
+_TO_WORDS = bytes.maketrans(_STANDARD_ALPHABET, bytes(range(32)))
+_GENERATORS = (0x98F2BC8E61, 0x79B76D99E2, 0xF33E5FB3C4, 0xAE2EABE2A8, 0x1E4F43E470)
+_CHECKSUM_SHIFTS = (35, 30, 25, 20, 15, 10, 5, 0)
+# base32 words of the version byte and a 20-byte address
+_PAYLOAD_WORDS = 34
+_CHECKSUM_WORDS = 8
+
+AddressBytesLike = Union[str, bytes]
+
+
+def _poly_mod(state: int, words: Iterable[int]) -> int:
+    # Base32Address._poly_mod, from an arbitrary state
+    for word in words:
+        top = state >> 35
+        state = ((state & 0x07FFFFFFFF) << 5) ^ word
+        for bit, generator in enumerate(_GENERATORS):
+            if top >> bit & 1:
+                state ^= generator
+    return state
+
+
+def _payload_words(address: bytes) -> bytes:
+    return base64.b32encode(b"\x00" + address)[:_PAYLOAD_WORDS].translate(_TO_WORDS)
+
+
+# _byte_tables[i][v]: polymod contribution of value v at byte i of the address
+_byte_tables: Optional[List[List[int]]] = None
+
+
+def _checksum_tables() -> List[List[int]]:
+    global _byte_tables
+    if _byte_tables is None:
+        tables = []
+        for position in range(20):
+            bit_contributions = []
+            for bit in range(8):
+                address = bytearray(20)
+                address[position] = 1 << bit
+                bit_contributions.append(_poly_mod(0, _payload_words(bytes(address)) + bytes(_CHECKSUM_WORDS)))
+            table = [0] * 256
+            for value in range(1, 256):
+                lowest_bit = value & -value
+                table[value] = table[value ^ lowest_bit] ^ bit_contributions[lowest_bit.bit_length() - 1]
+            tables.append(table)
+        _byte_tables = tables
+    return _byte_tables
+
+
+# network prefix -> polymod of the prefix followed by an all-zero payload, with the final xor applied
+_prefix_states: Dict[str, int] = {}
+
+
+def _prefix_state(prefix: str) -> int:
+    state = _prefix_states.get(prefix)
+    if state is None:
+        prefix_words = bytes(character & 0x1F for character in prefix.encode("ascii"))
+        state = _poly_mod(1, prefix_words + bytes(1 + _PAYLOAD_WORDS + _CHECKSUM_WORDS)) ^ 1
+        _prefix_states[prefix] = state
+    return state
+
+
+def network_prefix(network_id: int) -> str:
+    """
+    Returns the CIP-37 network prefix of ``network_id``, e.g. ``cfx`` for 1029 or ``net8888`` for 8888.
+    Computed by cfx_address, which exposes no public function for it.
+
+    >>> network_prefix(1)
+    'cfxtest'
+    """
+    validate_network_id(network_id)
+    return Base32Address._encode_network_prefix(network_id)  # type: ignore
+
+
+def network_id_from_prefix(prefix: str) -> int:
+    """
+    Returns the network id of a CIP-37 network prefix, case-insensitively.
+    Computed by cfx_address, which exposes no public function for it.
+
+    :raises InvalidBase32Address: the prefix is not a valid network prefix
+    >>> network_id_from_prefix("net8888")
+    8888
+    """
+    return Base32Address._network_prefix_to_id(prefix)  # type: ignore
+
+
+def _checksum(prefix_state: int, address: bytes) -> bytes:
+    mod = prefix_state
+    for table, value in zip(_checksum_tables(), address):
+        mod ^= table[value]
+    return bytes(_ALPHABET[mod >> shift & 31] for shift in _CHECKSUM_SHIFTS)
+
+
+def _validate_type(address: bytes) -> None:
+    if address[0] & 0xF0 not in (0x00, 0x10, 0x80):
+        raise InvalidConfluxHexAddress(
+            f"The hex address should start with 0x0, 0x1 or 0x8, received 0x{address.hex()}"
+        )
+
+
+def _address_bytes(address: AddressBytesLike) -> bytes:
+    if isinstance(address, str):
+        if address[:2] not in ("0x", "0X") or len(address) != 42:
+            raise InvalidHexAddress(f"Expecting a 0x-prefixed 20-byte hex address, received {address}")
+        try:
+            return bytes.fromhex(address[2:])
+        except ValueError:
+            raise InvalidHexAddress(f"Expecting a 0x-prefixed 20-byte hex address, received {address}")
+    if isinstance(address, (bytes, bytearray, memoryview)) and len(address) == 20:
+        return bytes(address)
+    raise InvalidHexAddress(f"Expecting a hex address or 20 bytes, received {address!r}")
+
+
+def encode_base32(address: bytes, network_id: int) -> Base32Address:
+    """
+    Encodes one raw 20-byte address, see :func:`to_base32_many`.
+    """
+    _validate_type(address)
+    prefix = network_prefix(network_id)
+    payload = base64.b32encode(b"\x00" + address)[:_PAYLOAD_WORDS].translate(_TO_CUSTOM)
+    return Base32Address(
+        prefix + ":" + (payload + _checksum(_prefix_state(prefix), address)).decode(),
+        None, None, _from_trust=True,
+    )
+
+
+def to_checksum_address_bytes(address: bytes) -> ChecksumAddress:
+    """
+    The EIP-55 checksum hex address of a raw 20-byte address.
+    """
+    characters = bytearray(address.hex().encode())
+    hashed = keccak(bytes(characters))
+    for index, value in enumerate(hashed[:20]):
+        # the nibble of the hash decides the case of the character at the same position
+        if value & 0x80 and characters[2 * index] > 0x39:
+            characters[2 * index] ^= 0x20
+        if value & 0x08 and characters[2 * index + 1] > 0x39:
+            characters[2 * index + 1] ^= 0x20
+    return ("0x" + characters.decode())  # type: ignore
+
+
+def to_base32_many(
+    hex_addresses: Union[Iterable[AddressBytesLike], "np.ndarray"],
+    network_id: int,
+    cache: Optional[LRUCache[Base32Address]] = None,
+) -> List[Base32Address]:
+    """
+    Encodes addresses in base32 for ``network_id``.
+
+    :param hex_addresses: hex strings, raw 20-byte addresses, or a NumPy ``(N, 20)`` uint8 array
+    :param int network_id: target network id
+    :param Optional[LRUCache] cache: memoizes encoded addresses, not used for NumPy arrays
+    :raises InvalidHexAddress: an address is not a 20-byte hex address
+    :raises InvalidConfluxHexAddress: an address does not start with 0x0, 0x1 or 0x8
+    :return List[Base32Address]: the addresses in input order
+    """
+    prefix = network_prefix(network_id)
+    prefix_state = _prefix_state(prefix)
+    if type(hex_addresses).__module__ == "numpy":
+        return _to_base32_array(hex_addresses, prefix, prefix_state)  # type: ignore
+    tables = _checksum_tables()
+    head = prefix + ":"
+    results: List[Base32Address] = []
+    for hex_address in hex_addresses:  # type: ignore
+        address = _address_bytes(hex_address)
+        if cache is not None:
+            cached = cache.get((address, network_id))
+            if cached is not None:
+                results.append(cached)
+                continue
+        _validate_type(address)
+        payload = base64.b32encode(b"\x00" + address)[:_PAYLOAD_WORDS].translate(_TO_CUSTOM)
+        mod = prefix_state
+        for table, value in zip(tables, address):
+            mod ^= table[value]
+        checksum = bytes(_ALPHABET[mod >> shift & 31] for shift in _CHECKSUM_SHIFTS)
+        encoded = Base32Address(head + (payload + checksum).decode(), None, None, _from_trust=True)
+        if cache is not None:
+            cache.put((address, network_id), encoded)
+        results.append(encoded)
+    return results
+
+
+def to_hex_many(
+    base32_addresses: Iterable[str], cache: Optional[LRUCache[ChecksumAddress]] = None
+) -> List[ChecksumAddress]:
+    """
+    Decodes base32 addresses of any network to checksum hex addresses. Checksums are verified.
+
+    :param Iterable[str] base32_addresses: base32 addresses, verbose ones are accepted
+    :param Optional[LRUCache] cache: memoizes decoded addresses
+    :raises InvalidBase32Address: an address is not a valid base32 address
+    :return List[ChecksumAddress]: the hex addresses in input order
+    """
+    results: List[ChecksumAddress] = []
+    for base32_address in base32_addresses:
+        if cache is not None:
+            cached = cache.get(base32_address)
+            if cached is not None:
+                results.append(cached)
+                continue
+        hex_address = _decode_base32(base32_address)
+        if cache is not None:
+            cache.put(base32_address, hex_address)
+        results.append(hex_address)
+    return results
+
+
+def _decode_base32(base32_address: str) -> ChecksumAddress:
+    if not isinstance(base32_address, str):
+        raise InvalidBase32Address(f"Receives an argument of type {type(base32_address)}, expected a string")
+    prefix, _, payload = base32_address.partition(":")
+    if ":" in payload or not base32_address.islower() or len(payload) != _PAYLOAD_WORDS + _CHECKSUM_WORDS:
+        # verbose or malformed addresses: Base32Address raises the detailed error
+        return Base32Address.decode(base32_address)["hex_address"]
+    if prefix not in _prefix_states:
+        # raises InvalidBase32Address for unknown prefixes
+        network_id_from_prefix(prefix)
+    if not _CHARACTERS.issuperset(payload):
+        raise InvalidBase32Address(f"Invalid Base32 address: {base32_address}")
+    # version byte, address, 2 padding bits
+    address = (int(payload[:_PAYLOAD_WORDS].translate(_TO_DIGITS), 32) >> 2 & (1 << 160) - 1).to_bytes(20, "big")
+    if _checksum(_prefix_state(prefix), address) != payload[_PAYLOAD_WORDS:].encode():
+        raise InvalidBase32Address("Invalid Base32 address: checksum verification failed")
+    return to_checksum_address_bytes(address)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy input requires numpy, install it with `pip install cfx-account[columnar]`")
+    return numpy
+
+
+def _to_base32_array(addresses: "np.ndarray", prefix: str, prefix_state: int) -> List[Base32Address]:
+    np = _import_numpy()
+    addresses = np.ascontiguousarray(addresses, dtype=np.uint8)
+    if addresses.ndim != 2 or addresses.shape[1] != 20:
+        raise InvalidHexAddress(f"Expecting an (N, 20) array of addresses, received shape {addresses.shape}")
+    count = addresses.shape[0]
+    if count == 0:
+        return []
+    invalid = ~np.isin(addresses[:, 0] & 0xF0, (0x00, 0x10, 0x80))
+    if invalid.any():
+        _validate_type(addresses[int(np.argmax(invalid))].tobytes())
+
+    tables = np.array(_checksum_tables(), dtype=np.uint64)
+    mods = np.bitwise_xor.reduce(tables[np.arange(20), addresses], axis=1) ^ np.uint64(prefix_state)
+    # version byte, address bits, then 2 padding bits: 34 words of 5 bits
+    bits = np.zeros((count, _PAYLOAD_WORDS * 5), dtype=np.uint8)
+    bits[:, 8:168] = np.unpackbits(addresses, axis=1)
+    payload_words = bits.reshape(count, _PAYLOAD_WORDS, 5) @ np.array([16, 8, 4, 2, 1], dtype=np.uint8)
+    shifts = np.array(_CHECKSUM_SHIFTS, dtype=np.uint64)
+    checksum_words = (mods[:, None] >> shifts) & np.uint64(31)
+    alphabet = np.frombuffer(_ALPHABET, dtype=np.uint8)
+    characters = np.concatenate(
+        [alphabet[payload_words], alphabet[checksum_words.astype(np.intp)]], axis=1
+    )
+    head = prefix + ":"
+    return [
+        Base32Address(head + encoded.decode(), None, None, _from_trust=True)
+        for encoded in characters.view(f"S{_PAYLOAD_WORDS + _CHECKSUM_WORDS}").ravel().tolist()
+    ]
@@ -0,0 +1,218 @@
+"""
+Explicit secp256k1 backend selection for signing and recovery.
+
+By default ``eth_keys`` picks its backend: coincurve if it is importable,
+the pure-python implementation otherwise, which signs roughly 50 times slower.
+Signing with that fallback emits a RuntimeWarning once per process.
+:meth:`Account.set_signing_backend <cfx_account.account.Account.set_signing_backend>`
+makes the choice explicit and verifies it with a self-test.
+
+>>> from cfx_account import Account
+>>> Account.set_signing_backend("coincurve")  # raises ImportError if coincurve is missing
+<EthKeysBackend coincurve>
+>>> Account.set_signing_backend(None)  # back to the eth_keys default
+"""
+import warnings
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple, Union
+
+from eth_keys import keys
+from eth_keys.backends import CoinCurveECCBackend, NativeECCBackend
+from eth_keys.backends.base import BaseECCBackend
+from eth_keys.backends.coincurve import is_coincurve_available
+from eth_keys.datatypes import PrivateKey, PublicKey, Signature
+from eth_utils.crypto import keccak
+
+VRSTuple = Tuple[int, int, int]
+
+
+class BackendSelfTestError(RuntimeError):
+    """
+    Raised when a backend produces signatures or recovered keys that do not match the reference implementation.
+    """
+
+
+class SigningBackend(ABC):
+    """
+    Signs message hashes and recovers public keys. ``v`` is always the raw recovery id, 0 or 1.
+
+    ``releases_gil`` tells whether signing runs without holding the GIL,
+    so that threads sign in parallel, see :class:`cfx_account.signers.pool.ThreadPoolSigner`.
+    """
+
+    name: str
+    releases_gil: bool = False
+
+    @abstractmethod
+    def sign(self, msg_hash: bytes, private_key: PrivateKey) -> VRSTuple:
+        ...
+
+    @abstractmethod
+    def recover(self, msg_hash: bytes, vrs: VRSTuple) -> PublicKey:
+        ...
+
+    @abstractmethod
+    def private_key_to_public_key(self, private_key: PrivateKey) -> PublicKey:
+        ...
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class EthKeysBackend(SigningBackend):
+    """
+    Wraps an ``eth_keys`` ECC backend.
+    """
+
+    def __init__(self, backend: BaseECCBackend, name: Optional[str] = None):
+        self.backend = backend
+        if name is None:
+            if isinstance(backend, CoinCurveECCBackend):
+                name = "coincurve"
+            elif isinstance(backend, NativeECCBackend):
+                name = "pure-python"
+            else:
+                name = type(backend).__name__
+        self.name = name
+        # coincurve calls libsecp256k1 through cffi, which drops the GIL for the duration of the call
+        self.releases_gil = isinstance(backend, CoinCurveECCBackend)
+
+    def sign(self, msg_hash: bytes, private_key: PrivateKey) -> VRSTuple:
+        return self.backend.ecdsa_sign(msg_hash, private_key).vrs
+
+    def recover(self, msg_hash: bytes, vrs: VRSTuple) -> PublicKey:
+        return self.backend.ecdsa_recover(msg_hash, Signature(vrs=vrs, backend=self.backend))
+
+    def private_key_to_public_key(self, private_key: PrivateKey) -> PublicKey:
+        return self.backend.private_key_to_public_key(private_key)
+
+
+class CallableBackend(SigningBackend):
+    """
+    A user-supplied signer, e.g. a binding to a hardware module or a faster native library.
+
+    :param sign: ``sign(msg_hash, private_key_bytes) -> (v, r, s)`` with v being 0 or 1
+    :param recover: optional ``recover(msg_hash, (v, r, s)) -> 64-byte uncompressed public key``,
+        recovery and public key derivation fall back to ``fallback`` if omitted
+    :param fallback: backend used for the operations not supplied, defaults to the eth_keys default backend
+    :param releases_gil: whether ``sign`` releases the GIL, e.g. a C extension, defaults to False
+    """
+
+    def __init__(
+        self,
+        sign: Callable[[bytes, bytes], VRSTuple],
+        recover: Optional[Callable[[bytes, VRSTuple], bytes]] = None,
+        name: str = "custom",
+        fallback: Optional[SigningBackend] = None,
+        releases_gil: bool = False,
+    ):
+        self._sign = sign
+        self._recover = recover
+        self.name = name
+        self.releases_gil = releases_gil
+        self.fallback = fallback or default_backend()
+
+    def sign(self, msg_hash: bytes, private_key: PrivateKey) -> VRSTuple:
+        v, r, s = self._sign(msg_hash, private_key.to_bytes())
+        return (v, r, s)
+
+    def recover(self, msg_hash: bytes, vrs: VRSTuple) -> PublicKey:
+        if self._recover is None:
+            return self.fallback.recover(msg_hash, vrs)
+        return PublicKey(self._recover(msg_hash, vrs))
+
+    def private_key_to_public_key(self, private_key: PrivateKey) -> PublicKey:
+        return self.fallback.private_key_to_public_key(private_key)
+
+
+BackendSpec = Union[str, SigningBackend, BaseECCBackend, Callable[[bytes, bytes], VRSTuple]]
+
+
+_SLOW_BACKEND_WARNING = (
+    "coincurve is not installed, falling back to the pure-python secp256k1 backend, "
+    "which is much slower. Install it with `pip install coincurve`"
+)
+
+_default_backend_checked = False
+
+
+def warn_if_default_backend_is_slow() -> None:
+    """
+    Warns once per process if the eth_keys default backend, used when no backend is set, is the pure-python one.
+    """
+    global _default_backend_checked
+    if _default_backend_checked:
+        return
+    _default_backend_checked = True
+    if isinstance(keys.backend, NativeECCBackend):
+        warnings.warn(_SLOW_BACKEND_WARNING, RuntimeWarning, stacklevel=3)
+
+
+def default_backend() -> EthKeysBackend:
+    """
+    The backend ``eth_keys`` uses when none is configured.
+    """
+    return EthKeysBackend(keys.backend)
+
+
+def get_backend(spec: BackendSpec = "auto") -> SigningBackend:
+    """
+    Resolves a backend specification.
+
+    :param spec: one of
+
+        * ``"auto"``: coincurve if available, else pure-python with a RuntimeWarning
+        * ``"coincurve"``: raises ImportError if coincurve is not installed
+        * ``"pure-python"``
+        * a :class:`SigningBackend` or an ``eth_keys`` backend instance
+        * a callable ``sign(msg_hash, private_key_bytes) -> (v, r, s)``, see :class:`CallableBackend`
+    """
+    if isinstance(spec, SigningBackend):
+        return spec
+    if isinstance(spec, BaseECCBackend):
+        return EthKeysBackend(spec)
+    if spec == "auto":
+        if is_coincurve_available():
+            return EthKeysBackend(CoinCurveECCBackend())
+        warnings.warn(_SLOW_BACKEND_WARNING, RuntimeWarning, stacklevel=2)
+        return EthKeysBackend(NativeECCBackend())
+    if spec == "coincurve":
+        if not is_coincurve_available():
+            raise ImportError("The coincurve backend requires coincurve, install it with `pip install coincurve`")
+        return EthKeysBackend(CoinCurveECCBackend())
+    if spec in ("pure-python", "native"):
+        return EthKeysBackend(NativeECCBackend())
+    if callable(spec):
+        return CallableBackend(spec)
+    raise ValueError(f"Unknown signing backend: {spec!r}")
+
+
+_SELF_TEST_KEY_BYTES = keccak(b"cfx-account backend self test")
+_SELF_TEST_HASH = keccak(b"cfx-account backend self test message")
+
+
+def self_test(backend: SigningBackend) -> None:
+    """
+    Checks ``backend`` against the pure-python reference implementation:
+    its signatures must recover to the signing key, and it must recover
+    reference signatures to the same key.
+
+    :raises BackendSelfTestError: the backend is not consistent with the reference
+    """
+    reference = NativeECCBackend()
+    private_key = PrivateKey(_SELF_TEST_KEY_BYTES, backend=reference)
+    expected_public_key = private_key.public_key
+    try:
+        vrs = backend.sign(_SELF_TEST_HASH, private_key)
+        signature = Signature(vrs=vrs, backend=reference)
+        signed_correctly = reference.ecdsa_recover(_SELF_TEST_HASH, signature) == expected_public_key
+        reference_vrs = reference.ecdsa_sign(_SELF_TEST_HASH, private_key).vrs
+        recovered_correctly = backend.recover(_SELF_TEST_HASH, reference_vrs) == expected_public_key
+        derived_correctly = backend.private_key_to_public_key(private_key) == expected_public_key
+    except Exception as e:
+        raise BackendSelfTestError(f"Signing backend {backend.name} failed its self test: {e!r}") from e
+    if not (signed_correctly and recovered_correctly and derived_correctly):
+        raise BackendSelfTestError(
+            f"Signing backend {backend.name} failed its self test: "
+            f"sign={signed_correctly}, recover={recovered_correctly}, derive={derived_correctly}"
+        )
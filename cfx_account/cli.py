@@ -0,0 +1,176 @@
+"""
+Offline signing of newline-delimited JSON transactions.
+
+    python -m cfx_account sign --keyfile key.json --input payouts.ndjson --output signed.ndjson
+
+Each input line is a transaction dict as accepted by :meth:`Account.sign_transaction`,
+with hex strings in place of bytes. Each output line is ``{"hash": ..., "raw_transaction": ...}``,
+in input order. A line that can not be signed gives ``{"line": n, "error": ...}`` instead,
+and the command exits with status 1.
+
+The keyfile is decrypted once. Its password is read from ``--password-file``,
+the CFX_KEYFILE_PASSWORD environment variable, or prompted for.
+Lines are read and signed in chunks, at most two chunks per worker are in memory at once.
+"""
+import argparse
+import getpass
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import IO, Any, Deque, Iterator, List, Optional, Tuple
+
+from eth_keys.datatypes import PrivateKey
+
+from cfx_account.account import Account
+
+PASSWORD_ENV = "CFX_KEYFILE_PASSWORD"
+
+# key of the worker process, set by _init_worker
+_worker_key: Optional[PrivateKey] = None
+
+
+def _init_worker(private_key: bytes, backend: Optional[str]) -> None:
+    global _worker_key
+    if backend is not None:
+        Account.set_signing_backend(backend)
+    # parsed once, deriving the public key for every transaction would double the cost
+    _worker_key = Account.parse_private_key(private_key)
+
+
+def sign_lines(lines: List[Tuple[int, bytes]]) -> Tuple[bytes, int]:
+    """
+    Signs a chunk of numbered input lines with the worker's key.
+
+    :return Tuple[bytes, int]: the output lines and the number of lines which failed
+    """
+    output = []
+    errors = 0
+    for line_number, line in lines:
+        try:
+            transaction = json.loads(line)
+            signed = Account.sign_transaction(transaction, _worker_key)  # type: ignore
+            record: Any = {"hash": signed.hash.to_0x_hex(), "raw_transaction": signed.raw_transaction.to_0x_hex()}
+        except Exception as e:
+            errors += 1
+            record = {"line": line_number, "error": f"{type(e).__name__}: {e}"}
+        output.append(json.dumps(record))
+    return ("\n".join(output) + "\n").encode(), errors
+
+
+def _read_chunks(stream: IO[bytes], chunk_size: int) -> Iterator[List[Tuple[int, bytes]]]:
+    chunk: List[Tuple[int, bytes]] = []
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        chunk.append((line_number, line))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _InlineExecutor(Executor):
+    # runs tasks in the calling thread, for --workers 1
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def sign_stream(
+    input_stream: IO[bytes],
+    output_stream: IO[bytes],
+    private_key: bytes,
+    workers: int = 1,
+    chunk_size: int = 1000,
+    backend: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    Signs every line of ``input_stream`` and writes the results to ``output_stream`` in input order.
+
+    :return Tuple[int, int]: the number of lines read and the number of lines which failed
+    """
+    executor: Executor
+    if workers > 1:
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(private_key, backend))
+    else:
+        _init_worker(private_key, backend)
+        executor = _InlineExecutor()
+    total = errors = 0
+    in_flight: Deque["Future[Tuple[bytes, int]]"] = deque()
+    with executor:
+        for chunk in _read_chunks(input_stream, chunk_size):
+            total += len(chunk)
+            in_flight.append(executor.submit(sign_lines, chunk))
+            # bounds memory and keeps the output in input order
+            while len(in_flight) >= 2 * workers:
+                output, failed = in_flight.popleft().result()
+                output_stream.write(output)
+                errors += failed
+        while in_flight:
+            output, failed = in_flight.popleft().result()
+            output_stream.write(output)
+            errors += failed
+    output_stream.flush()
+    return total, errors
+
+
+def _read_password(password_file: Optional[str]) -> str:
+    if password_file is not None:
+        with open(password_file) as f:
+            return f.read().rstrip("\r\n")
+    if PASSWORD_ENV in os.environ:
+        return os.environ[PASSWORD_ENV]
+    return getpass.getpass("Keyfile password: ")
+
+
+def _sign_command(args: argparse.Namespace) -> int:
+    with open(args.keyfile) as f:
+        keyfile = json.load(f)
+    private_key = bytes(Account.decrypt(keyfile, _read_password(args.password_file)))
+    input_stream = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    output_stream = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    started = time.perf_counter()
+    try:
+        total, errors = sign_stream(
+            input_stream, output_stream, private_key, args.workers, args.chunk_size, args.backend
+        )
+    finally:
+        if input_stream is not sys.stdin.buffer:
+            input_stream.close()
+        if output_stream is not sys.stdout.buffer:
+            output_stream.close()
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed else 0.0
+    print(
+        f"signed {total - errors} of {total} transactions in {elapsed:.2f}s ({rate:.0f} tx/s), {errors} errors",
+        file=sys.stderr,
+    )
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cfx_account")
+    commands = parser.add_subparsers(dest="command", required=True)
+    sign = commands.add_parser(
+        "sign", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+        help="sign newline-delimited JSON transactions with a keyfile",
+    )
+    sign.add_argument("--keyfile", required=True, help="encrypted keyfile")
+    sign.add_argument("--password-file", help="file containing the keyfile password")
+    sign.add_argument("-i", "--input", default="-", help="input file, default stdin")
+    sign.add_argument("-o", "--output", default="-", help="output file, default stdout")
+    sign.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1,
+        help="signing processes, 1 signs in the main process, default the number of CPUs",
+    )
+    sign.add_argument("--chunk-size", type=int, default=1000, help="lines per task, default 1000")
+    sign.add_argument("--backend", help='signing backend, e.g. "coincurve", default the eth_keys default')
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size should be positive")
+    return _sign_command(args)
@@ -0,0 +1,66 @@
+from typing import Any, Optional
+
+from eth_account.datastructures import SignedTransaction
+from eth_hash.auto import keccak
+from hexbytes import HexBytes
+
+
+class CompactSignedTransaction:
+    """
+    A signed transaction holding only the raw bytes and the signature values, in slots.
+    Unlike :class:`~eth_account.datastructures.SignedTransaction`, the hash is computed on first access
+    and ``HexBytes`` values are created when read, not stored.
+
+    Compares equal to the :class:`~eth_account.datastructures.SignedTransaction` of the same transaction.
+    """
+
+    __slots__ = ("raw", "r", "s", "v", "_hash")
+
+    def __init__(self, raw: bytes, r: int, s: int, v: int, hash: Optional[bytes] = None):
+        self.raw = raw
+        self.r = r
+        self.s = s
+        self.v = v
+        self._hash = hash
+
+    @classmethod
+    def from_signed_transaction(cls, signed: SignedTransaction) -> "CompactSignedTransaction":
+        return cls(bytes(signed.raw_transaction), signed.r, signed.s, signed.v, bytes(signed.hash))
+
+    @property
+    def raw_transaction(self) -> HexBytes:
+        return HexBytes(self.raw)
+
+    @property
+    def hash(self) -> HexBytes:
+        if self._hash is None:
+            self._hash = keccak(self.raw)
+        return HexBytes(self._hash)
+
+    def to_signed_transaction(self) -> SignedTransaction:
+        return SignedTransaction(
+            raw_transaction=self.raw_transaction,
+            hash=self.hash,
+            r=self.r,
+            s=self.s,
+            v=self.v,
+        )
+
+    def __getitem__(self, name: str) -> Any:
+        # dict-style access, as SignedTransaction allows
+        if name not in ("raw_transaction", "hash", "r", "s", "v"):
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactSignedTransaction):
+            return (self.raw, self.r, self.s, self.v) == (other.raw, other.r, other.s, other.v)
+        if isinstance(other, SignedTransaction):
+            return (self.raw, self.r, self.s, self.v) == (bytes(other.raw_transaction), other.r, other.s, other.v)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+    def __repr__(self) -> str:
+        return f"CompactSignedTransaction(raw={self.raw_transaction.to_0x_hex()}, r={self.r}, s={self.s}, v={self.v})"
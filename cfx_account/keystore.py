@@ -0,0 +1,344 @@
+"""
+A compact in-memory or memory-mapped store for large numbers of private keys.
+
+A :class:`~cfx_account.signers.local.LocalAccount` holds ``eth_keys`` key objects and takes over 1 KB per key.
+:class:`CompactKeyStore` keeps 52 bytes per key: hex addresses in one sorted array of 20-byte records,
+looked up by binary search, and private keys in a parallel array of 32-byte records.
+Accounts are only created on demand.
+
+>>> store = CompactKeyStore.from_keys(private_keys)
+>>> store.save("deposit.keys")  # created with 0600 permissions
+>>> store = CompactKeyStore.load("deposit.keys")  # memory-mapped, read-only
+>>> store.sign_transaction({"from": address, ...})
+"""
+import io
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from cfx_address.utils import normalize_to
+from cfx_utils.types import ChecksumAddress, TxParam
+from eth_account.datastructures import SignedTransaction
+from eth_keys.datatypes import PrivateKey
+from eth_utils.address import to_checksum_address
+
+from cfx_account._utils.addresses import eth_eoa_address_bytes_to_cfx
+from cfx_account.account import Account
+from cfx_account.signers.local import LocalAccount
+
+ADDRESS_SIZE = 20
+KEY_SIZE = 32
+
+# magic, then the number of keys as a little-endian uint64,
+# then the sorted addresses, then the keys in the same order
+_MAGIC = b"CFXKEYS1"
+_HEADER = struct.Struct("<8sQ")
+
+PrivateKeyLike = Union[bytes, str, PrivateKey]
+
+
+def key_to_address_bytes(private_key: PrivateKeyLike) -> Tuple[bytes, bytes]:
+    """
+    Returns the 20-byte Conflux hex address and the 32-byte private key.
+    """
+    key_obj = Account.parse_private_key(private_key)
+    return eth_eoa_address_bytes_to_cfx(key_obj.public_key.to_canonical_address()), key_obj.to_bytes()
+
+
+class CompactKeyStore:
+    """
+    Private keys indexed by hex address, at 52 bytes per key. Create it with :meth:`from_keys` or :meth:`load`.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        # a bytearray, or the mmap of a file loaded with load(path, use_mmap=True)
+        self._addresses: Union[bytearray, mmap.mmap] = bytearray()
+        self._keys: Union[bytearray, mmap.mmap] = bytearray()
+        self._addresses_offset = 0
+        self._keys_offset = 0
+        self.read_only = False
+
+    @classmethod
+    def from_keys(cls, private_keys: Iterable[PrivateKeyLike]) -> "CompactKeyStore":
+        """
+        Builds a store from private keys. Repeated keys are stored once.
+        """
+        store = cls()
+        store._addresses, store._keys = _sorted_records(private_keys)
+        store._count = len(store._addresses) // ADDRESS_SIZE
+        return store
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True, check_permissions: bool = True) -> "CompactKeyStore":
+        """
+        Loads a file written by :meth:`save`.
+
+        :param bool use_mmap: map the file read-only instead of reading it into memory, defaults to True
+        :param bool check_permissions: refuse files accessible by group or others, defaults to True
+        :raises PermissionError: the file is accessible by group or others
+        :raises ValueError: the file is not a key store
+        """
+        # unbuffered, so that no key bytes are left in a read buffer
+        with open(path, "rb", buffering=0) as f:
+            file_stat = os.fstat(f.fileno())
+            if check_permissions and file_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                raise PermissionError(f"{path} is accessible by group or others, restrict it with chmod 600")
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{path} is not a key store")
+            magic, count = _HEADER.unpack(header)
+            if magic != _MAGIC or file_stat.st_size != _HEADER.size + count * (ADDRESS_SIZE + KEY_SIZE):
+                raise ValueError(f"{path} is not a key store")
+            store = cls()
+            store._count = count
+            if use_mmap:
+                store._addresses = store._keys = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                store._addresses_offset = _HEADER.size
+                store._keys_offset = _HEADER.size + count * ADDRESS_SIZE
+                store.read_only = True
+            else:
+                # read straight into the arrays the store keeps, the keys are never copied
+                store._addresses = bytearray(count * ADDRESS_SIZE)
+                store._keys = bytearray(count * KEY_SIZE)
+                _read_into(f, store._addresses)
+                _read_into(f, store._keys)
+        return store
+
+    def save(self, path: str) -> None:
+        """
+        Writes the store to ``path`` with 0600 permissions, replacing any existing file atomically.
+        """
+        # mkstemp creates the file with 0600 whatever the umask, an existing file at path keeps its mode
+        fd, temporary_path = tempfile.mkstemp(prefix=".keys-", dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, self._count))
+                f.write(self._address_block())
+                f.write(self._key_block())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def close(self) -> None:
+        """
+        Unmaps a loaded file or overwrites in-memory keys with zeros. The store is empty afterwards.
+        """
+        if isinstance(self._addresses, mmap.mmap):
+            self._addresses.close()
+        else:
+            self._keys[:] = bytes(len(self._keys))
+        self.__init__()  # type: ignore
+
+    def __enter__(self) -> "CompactKeyStore":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, address: object) -> bool:
+        try:
+            return self._find(address) is not None  # type: ignore
+        except ValueError:
+            return False
+
+    def __repr__(self) -> str:
+        return f"<CompactKeyStore keys={self._count}{' read-only' if self.read_only else ''}>"
+
+    def addresses(self) -> Iterator[ChecksumAddress]:
+        """
+        Yields the hex addresses in ascending order.
+        """
+        for index in range(self._count):
+            yield to_checksum_address(self._address_at(index))
+
+    def add(self, private_key: PrivateKeyLike) -> ChecksumAddress:
+        """
+        Inserts one key in place, returns its hex address.
+        The insertion moves every record after it, O(n) per call: use :meth:`add_many` for more than a few keys.
+
+        :raises TypeError: the store is memory-mapped
+        """
+        if self.read_only:
+            raise TypeError("Can not add keys to a memory-mapped key store, load it with use_mmap=False")
+        address, key = key_to_address_bytes(private_key)
+        index = self._search(address)
+        if index == self._count or self._address_at(index) != address:
+            self._addresses[index * ADDRESS_SIZE:index * ADDRESS_SIZE] = address  # type: ignore
+            self._keys[index * KEY_SIZE:index * KEY_SIZE] = key  # type: ignore
+            self._count += 1
+        return to_checksum_address(address)
+
+    def add_many(self, private_keys: Iterable[PrivateKeyLike]) -> List[ChecksumAddress]:
+        """
+        Adds keys, merging them into the sorted arrays in one pass, returns their hex addresses.
+
+        :raises TypeError: the store is memory-mapped
+        """
+        if self.read_only:
+            raise TypeError("Can not add keys to a memory-mapped key store, load it with use_mmap=False")
+        added: List[ChecksumAddress] = []
+        new_addresses, new_keys = _sorted_records(private_keys, added)
+        if new_addresses:
+            old_keys = self._keys
+            self._addresses, self._keys = _merge_records(
+                self._addresses, old_keys, new_addresses, new_keys  # type: ignore
+            )
+            self._count = len(self._addresses) // ADDRESS_SIZE
+            old_keys[:] = bytes(len(old_keys))
+            new_keys[:] = bytes(len(new_keys))
+        return added
+
+    def get_key(self, address: str) -> bytes:
+        """
+        :param str address: hex or base32 address
+        :raises KeyError: no key for address
+        """
+        index = self._find(address)
+        if index is None:
+            raise KeyError(address)
+        return self._key_at(index)
+
+    def get_account(self, address: str, network_id: Optional[int] = None) -> LocalAccount:
+        """
+        Creates a :class:`~cfx_account.signers.local.LocalAccount` for ``address``. It is not kept by the store.
+
+        :raises KeyError: no key for address
+        """
+        return Account.from_key(self.get_key(address), network_id)
+
+    def sign_transaction(self, transaction_dict: TxParam, address: Optional[str] = None) -> SignedTransaction:
+        """
+        Signs with the key of ``address``, defaults to the transaction's from field.
+
+        :raises KeyError: no key for address
+        :raises ValueError: no address and the transaction has no from field
+        """
+        if address is None:
+            if "from" not in transaction_dict:
+                raise ValueError("Specify the signing address or set the transaction's from field")
+            address = transaction_dict["from"]
+        return Account.sign_transaction(transaction_dict, self.get_key(address))  # type: ignore
+
+    def _find(self, address: str) -> Optional[int]:
+        target = bytes.fromhex(normalize_to(address, None)[2:])  # type: ignore
+        index = self._search(target)
+        if index < self._count and self._address_at(index) == target:
+            return index
+        return None
+
+    def _search(self, target: bytes) -> int:
+        # index of the first address not lower than target
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._address_at(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _address_at(self, index: int) -> bytes:
+        start = self._addresses_offset + index * ADDRESS_SIZE
+        return bytes(self._addresses[start:start + ADDRESS_SIZE])
+
+    def _key_at(self, index: int) -> bytes:
+        start = self._keys_offset + index * KEY_SIZE
+        return bytes(self._keys[start:start + KEY_SIZE])
+
+    def _address_block(self) -> bytes:
+        start = self._addresses_offset
+        return bytes(self._addresses[start:start + self._count * ADDRESS_SIZE])
+
+    def _key_block(self) -> bytes:
+        start = self._keys_offset
+        return bytes(self._keys[start:start + self._count * KEY_SIZE])
+
+
+
+# an address followed by the big-endian index of its key, sorting these sorts the keys by address
+# and keeps the first of repeated keys, at 24 bytes per key instead of an (address, key) tuple
+_SORT_RECORD = struct.Struct(">20sI")
+
+
+def _sorted_records(
+    private_keys: Iterable[PrivateKeyLike], added: Optional[List[ChecksumAddress]] = None
+) -> Tuple[bytearray, bytearray]:
+    """
+    Returns the addresses and keys sorted by address, without repeated keys.
+
+    :param added: the hex address of each key is appended in input order, defaults to None
+    """
+    input_keys = bytearray()
+    order: List[bytes] = []
+    for index, private_key in enumerate(private_keys):
+        address, key = key_to_address_bytes(private_key)
+        input_keys += key
+        order.append(_SORT_RECORD.pack(address, index))
+        if added is not None:
+            added.append(to_checksum_address(address))
+    order.sort()
+    addresses = bytearray(len(order) * ADDRESS_SIZE)
+    keys = bytearray(len(order) * KEY_SIZE)
+    count = 0
+    previous = None
+    for record in order:
+        address, index = _SORT_RECORD.unpack(record)
+        if address == previous:
+            continue
+        addresses[count * ADDRESS_SIZE:(count + 1) * ADDRESS_SIZE] = address
+        keys[count * KEY_SIZE:(count + 1) * KEY_SIZE] = input_keys[index * KEY_SIZE:(index + 1) * KEY_SIZE]
+        count += 1
+        previous = address
+    input_keys[:] = bytes(len(input_keys))
+    del addresses[count * ADDRESS_SIZE:]
+    del keys[count * KEY_SIZE:]
+    return addresses, keys
+
+
+def _merge_records(
+    addresses: bytearray, keys: bytearray, new_addresses: bytearray, new_keys: bytearray
+) -> Tuple[bytearray, bytearray]:
+    """
+    Merges two sorted runs of records into new arrays, an address in both is kept once.
+    """
+    count, new_count = len(addresses) // ADDRESS_SIZE, len(new_addresses) // ADDRESS_SIZE
+    merged_addresses = bytearray(len(addresses) + len(new_addresses))
+    merged_keys = bytearray(len(keys) + len(new_keys))
+    index = new_index = merged = 0
+    while index < count or new_index < new_count:
+        address = addresses[index * ADDRESS_SIZE:(index + 1) * ADDRESS_SIZE]
+        new_address = new_addresses[new_index * ADDRESS_SIZE:(new_index + 1) * ADDRESS_SIZE]
+        if new_index == new_count or (index < count and address <= new_address):
+            if address == new_address:
+                new_index += 1
+            source_addresses, source_keys, source = addresses, keys, index
+            index += 1
+        else:
+            source_addresses, source_keys, source = new_addresses, new_keys, new_index
+            new_index += 1
+        merged_addresses[merged * ADDRESS_SIZE:(merged + 1) * ADDRESS_SIZE] = \
+            source_addresses[source * ADDRESS_SIZE:(source + 1) * ADDRESS_SIZE]
+        merged_keys[merged * KEY_SIZE:(merged + 1) * KEY_SIZE] = source_keys[source * KEY_SIZE:(source + 1) * KEY_SIZE]
+        merged += 1
+    del merged_addresses[merged * ADDRESS_SIZE:]
+    del merged_keys[merged * KEY_SIZE:]
+    return merged_addresses, merged_keys
+
+
+def _read_into(f: io.FileIO, buffer: bytearray) -> None:
+    view = memoryview(buffer)
+    while view:
+        read = f.readinto(view)
+        if not read:
+            raise ValueError(f"{f.name} is truncated")
+        view = view[read:]
@@ -23,7 +23,8 @@ from cfx_account._utils.structured_data.eth_account_legacy_hashing import (
 )
 
 from eth_account.messages import (
-    SignableMessage
+    SignableMessage,
+    _hash_eip191_message,  # type: ignore
 )
 from cfx_account._utils.structured_data.hashing import (
     hash_domain,
@@ -98,3 +99,14 @@ def encode_defunct(
         b'onflux Signed Message:\n' + msg_length,
         message_bytes,
     )
+
+
+def hash_signable_message(signable_message: SignableMessage) -> bytes:
+    """
+    Returns the hash signed for an encoded message.
+    The hash is computed by eth_account, which exposes no public function for it.
+
+    :param SignableMessage signable_message: an encoded message generated by `encode_defunct` or `encode_structured_data`
+    :return bytes: the 32-byte message hash
+    """
+    return _hash_eip191_message(signable_message)  # type: ignore
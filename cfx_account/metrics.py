@@ -0,0 +1,203 @@
+"""
+Optional stage-level instrumentation of signing, recovery and keystore operations.
+
+Metrics are disabled by default. When no sink is set, each instrumented operation
+costs one global lookup and a ``None`` check per stage.
+
+>>> from cfx_account import Account
+>>> from cfx_account.metrics import InMemoryRecorder, set_metrics_sink
+>>> recorder = InMemoryRecorder()
+>>> set_metrics_sink(recorder)
+>>> Account.sign_transaction(transaction, key)
+>>> recorder.count("sign_transaction", "ecdsa")
+1
+>>> set_metrics_sink(None)
+
+Stages reported by operation:
+
+ * ``sign_transaction``: key_parse, from_check, drip_conversion, formatting, rlp_encode, keccak, ecdsa, build,
+   and cache_lookup if the sign cache is enabled
+ * ``recover_transaction``: cache_lookup (if the recover cache is enabled), decode, ecrecover, address_format
+ * ``recover_message``: message_hash, cache_lookup (if the recover cache is enabled), ecrecover, address_format
+ * ``encrypt``: encrypt
+ * ``decrypt``: decrypt
+
+Every operation also reports a ``total`` stage.
+"""
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class MetricsSink(ABC):
+    """
+    Receives one observation per stage of every instrumented operation.
+    Implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def observe(self, operation: str, stage: str, seconds: float) -> None:
+        ...
+
+
+class CallbackSink(MetricsSink):
+    """
+    Forwards every observation to ``callback(operation, stage, seconds)``.
+    """
+
+    def __init__(self, callback: Callable[[str, str, float], None]):
+        self.callback = callback
+
+    def observe(self, operation: str, stage: str, seconds: float) -> None:
+        self.callback(operation, stage, seconds)
+
+
+class Histogram:
+    """
+    Non-cumulative latency histogram: ``bucket_counts[i]`` counts observations
+    in ``(buckets[i-1], buckets[i]]``, the last slot counts observations above every bucket.
+    """
+
+    __slots__ = ("buckets", "bucket_counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.bucket_counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+
+class InMemoryRecorder(MetricsSink):
+    """
+    Keeps a counter and a latency histogram per (operation, stage).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get((operation, stage))
+            if histogram is None:
+                histogram = self._histograms[(operation, stage)] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def count(self, operation: str, stage: str = "total") -> int:
+        histogram = self._histograms.get((operation, stage))
+        return 0 if histogram is None else histogram.count
+
+    def total_seconds(self, operation: str, stage: str = "total") -> float:
+        histogram = self._histograms.get((operation, stage))
+        return 0.0 if histogram is None else histogram.sum
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        :return: ``{(operation, stage): {"count": ..., "sum": ..., "mean": ...}}``
+        """
+        with self._lock:
+            return {
+                key: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count,
+                }
+                for key, histogram in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+class PrometheusExporter(InMemoryRecorder):
+    """
+    An :class:`InMemoryRecorder` rendering its histograms in the Prometheus text exposition format,
+    e.g. to be served from an existing ``/metrics`` endpoint.
+    """
+
+    def __init__(self, name: str = "cfx_account_stage_seconds", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(buckets)
+        self.name = name
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} Latency of cfx_account operation stages in seconds.",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            for (operation, stage), histogram in sorted(self._histograms.items()):
+                labels = f'operation="{operation}",stage="{stage}"'
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f'{self.name}_bucket{{{labels},le="{bound!r}"}} {cumulative}')
+                lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{self.name}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{self.name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class StageTimer:
+    """
+    Times consecutive stages of one operation. Created by :func:`start`.
+    """
+
+    __slots__ = ("sink", "operation", "started", "last")
+
+    def __init__(self, sink: MetricsSink, operation: str):
+        self.sink = sink
+        self.operation = operation
+        self.started = self.last = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """
+        Reports the time elapsed since the previous lap (or the start) as ``stage``.
+        """
+        now = perf_counter()
+        self.sink.observe(self.operation, stage, now - self.last)
+        self.last = now
+
+    def finish(self) -> None:
+        """
+        Reports the time elapsed since the start as the ``total`` stage.
+        """
+        self.sink.observe(self.operation, "total", perf_counter() - self.started)
+
+
+_sink: Optional[MetricsSink] = None
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> None:
+    """
+    Enables metrics by setting the process-wide sink. Pass None to disable metrics.
+    """
+    global _sink
+    _sink = sink
+
+
+def get_metrics_sink() -> Optional[MetricsSink]:
+    return _sink
+
+
+def start(operation: str) -> Optional[StageTimer]:
+    """
+    Returns a timer for ``operation``, or None if metrics are disabled.
+    """
+    sink = _sink
+    if sink is None:
+        return None
+    return StageTimer(sink, operation)
@@ -0,0 +1,619 @@
+"""
+A local signing daemon holding unlocked accounts in memory, so that many worker processes
+share one set of decrypted keys instead of each running the keystore KDF.
+
+Requests are JSON-RPC 2.0 objects (or batch arrays), sent as newline-delimited JSON over a
+Unix domain socket or TCP connection, or as the body of an HTTP ``POST`` on localhost.
+Stream connections may pipeline requests, responses are written as they complete and matched by ``id``.
+
+Methods:
+
+ * ``cfx_accounts()``: hex addresses of the served accounts
+ * ``cfx_signTransaction(address, transaction)``: the transaction as accepted by :meth:`Account.sign_transaction`,
+   with hex strings in place of bytes
+ * ``cfx_signMessage(address, message)``: ``message`` is a :class:`SignableMessage` as ``{"version", "header", "body"}`` hex strings
+ * ``cfx_recoverTransaction(raw_transaction)``
+ * ``cfx_recoverMessage(message, signature)``
+
+TCP and HTTP clients authenticate with the server's bearer token, :attr:`SigningServer.auth_token`:
+on TCP, the first line is a JSON object with an ``"auth"`` field, either a request or ``{"auth": token}`` alone;
+over HTTP, every request carries an ``Authorization: Bearer <token>`` header.
+HTTP requests with an ``Origin`` header or a ``Host`` other than a loopback name are rejected,
+so web pages can not reach the server through cross-site requests or DNS rebinding.
+The Unix socket is created accessible to its owner only and needs no token.
+
+Concurrent sign and recover calls are queued and coalesced into micro-batches of at most ``max_batch_size``
+calls, waiting at most ``max_wait`` seconds for a batch to fill. Each batch runs as one task on a thread pool.
+When ``max_pending`` calls are queued, new calls are rejected with error code -32005 until the queue drains.
+
+>>> server = SigningServer([Account.from_key(key)], max_batch_size=64, max_wait=0.002)
+>>> async def main():
+...     unix_server = await server.serve_unix("/run/cfx-signer.sock")
+...     async with unix_server:
+...         await unix_server.serve_forever()
+>>> asyncio.run(main())
+"""
+import asyncio
+import functools
+import hmac
+import ipaddress
+import json
+import os
+import secrets
+import shutil
+import socket
+import stat
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from cfx_address import eth_eoa_address_to_cfx_hex
+from cfx_address.utils import normalize_to
+from cfx_utils.types import ChecksumAddress
+from collections.abc import Mapping
+from eth_account.datastructures import SignedMessage, SignedTransaction
+from eth_account.messages import SignableMessage
+from eth_keys.datatypes import PrivateKey
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+
+from cfx_account.account import Account, drop_matching_from, to_signed_transaction
+from cfx_account.backends import BackendSpec, SigningBackend, get_backend, self_test
+from cfx_account.messages import hash_signable_message
+from cfx_account.signers.local import LocalAccount
+from cfx_account._utils.signing import sign_transaction_dict
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+UNAUTHORIZED = -32001
+# EIP-1474 "limit exceeded"
+SERVER_BUSY = -32005
+
+# longest accepted request line or HTTP body
+MAX_REQUEST_SIZE = 1 << 22
+
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def signed_transaction_to_json(signed: SignedTransaction) -> Dict[str, Any]:
+    return {
+        "rawTransaction": signed.raw_transaction.to_0x_hex(),
+        "hash": signed.hash.to_0x_hex(),
+        "r": hex(signed.r),
+        "s": hex(signed.s),
+        "v": signed.v,
+    }
+
+
+def signed_transaction_from_json(result: Mapping[str, Any]) -> SignedTransaction:
+    return SignedTransaction(
+        raw_transaction=HexBytes(result["rawTransaction"]),
+        hash=HexBytes(result["hash"]),
+        r=int(result["r"], 16),
+        s=int(result["s"], 16),
+        v=result["v"],
+    )
+
+
+def signed_message_to_json(signed: SignedMessage) -> Dict[str, Any]:
+    return {
+        "messageHash": signed.message_hash.to_0x_hex(),
+        "r": hex(signed.r),
+        "s": hex(signed.s),
+        "v": signed.v,
+        "signature": signed.signature.to_0x_hex(),
+    }
+
+
+def signed_message_from_json(result: Mapping[str, Any]) -> SignedMessage:
+    return SignedMessage(
+        message_hash=HexBytes(result["messageHash"]),
+        r=int(result["r"], 16),
+        s=int(result["s"], 16),
+        v=result["v"],
+        signature=HexBytes(result["signature"]),
+    )
+
+
+def signable_message_to_json(message: SignableMessage) -> Dict[str, str]:
+    return {
+        "version": HexBytes(message.version).to_0x_hex(),
+        "header": HexBytes(message.header).to_0x_hex(),
+        "body": HexBytes(message.body).to_0x_hex(),
+    }
+
+
+def signable_message_from_json(message: Any) -> SignableMessage:
+    if not isinstance(message, Mapping):
+        raise RPCError(INVALID_PARAMS, "message should be an object with version, header and body")
+    try:
+        return SignableMessage(
+            HexBytes(message["version"]), HexBytes(message["header"]), HexBytes(message["body"])
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise RPCError(INVALID_PARAMS, f"invalid message: {e}")
+
+
+# a queued call: method, params, future resolved on the event loop
+_Call = Tuple[str, List[Any], "asyncio.Future[Any]"]
+# result of a call run in a batch: (result, None) or (None, error)
+_Outcome = Tuple[Any, Optional[RPCError]]
+
+
+class SigningServer:
+    """
+    Serves signing and recovery for ``accounts``, see the module documentation for the protocol.
+
+    :param Iterable[Union[LocalAccount, bytes, str]] accounts: unlocked accounts or private keys
+    :param int max_batch_size: most calls run per batch, defaults to 64
+    :param float max_wait: seconds the first call of a batch waits for more calls, defaults to 0.002
+    :param int max_pending: most queued calls before new calls are rejected, defaults to 4096
+    :param Optional[int] max_workers: threads running batches, defaults to the number of CPUs
+    :param BackendSpec backend: signing backend, see :func:`cfx_account.backends.get_backend`, defaults to "auto"
+    :param Optional[str] auth_token: token TCP and HTTP clients have to send, defaults to a random token
+    :param bool require_auth: whether TCP and HTTP clients have to send the token, defaults to True
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Union[LocalAccount, bytes, str]],
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        max_pending: int = 4096,
+        max_workers: Optional[int] = None,
+        backend: BackendSpec = "auto",
+        auth_token: Optional[str] = None,
+        require_auth: bool = True,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size should be positive, got {max_batch_size}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending should be positive, got {max_pending}")
+        if max_wait < 0:
+            raise ValueError(f"max_wait should not be negative, got {max_wait}")
+        # hex address -> key
+        self._keys: Dict[ChecksumAddress, PrivateKey] = {}
+        for account in accounts:
+            if not isinstance(account, LocalAccount):
+                account = Account.from_key(account)
+            self._keys[account.hex_address] = Account.parse_private_key(account.key)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backend: SigningBackend = get_backend(backend)
+        self.auth_token = auth_token or secrets.token_urlsafe(32)
+        self.require_auth = require_auth
+        self_test(self.backend)
+        # number of batches run and calls in them
+        self.batch_count = 0
+        self.call_count = 0
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="cfx-signing-server")
+        self._pending: Deque[_Call] = deque()
+        self._batcher: Optional["asyncio.Task[None]"] = None
+        self._servers: List[asyncio.AbstractServer] = []
+
+    @property
+    def addresses(self) -> List[ChecksumAddress]:
+        return list(self._keys)
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Listens on a Unix domain socket, which is created accessible to its owner only.
+        A stale socket file at ``path`` is replaced.
+
+        :raises FileExistsError: path exists and is not a socket
+        """
+        self._start()
+        serve = functools.partial(self._serve_stream, authenticate=False)
+        sock = _bind_private_unix_socket(path)
+        try:
+            server = await asyncio.start_unix_server(serve, sock=sock, limit=MAX_REQUEST_SIZE)
+        except BaseException:
+            sock.close()
+            raise
+        self._servers.append(server)
+        return server
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """
+        Listens for newline-delimited JSON on a loopback TCP address.
+        The first line of a connection has to carry the auth token unless ``require_auth`` is False.
+
+        :raises ValueError: host is not a loopback address
+        """
+        _ensure_loopback(host)
+        self._start()
+        serve = functools.partial(self._serve_stream, authenticate=self.require_auth)
+        server = await asyncio.start_server(serve, host, port, limit=MAX_REQUEST_SIZE)
+        self._servers.append(server)
+        return server
+
+    async def serve_http(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """
+        Listens for JSON-RPC over HTTP ``POST`` requests on a loopback address. Connections are kept alive.
+        Requests have to carry the auth token unless ``require_auth`` is False.
+
+        :raises ValueError: host is not a loopback address
+        """
+        _ensure_loopback(host)
+        self._start()
+        server = await asyncio.start_server(self._serve_http, host, port, limit=MAX_REQUEST_SIZE)
+        self._servers.append(server)
+        return server
+
+    async def aclose(self) -> None:
+        """
+        Stops listening, fails the queued calls and stops the worker threads.
+        """
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            self._batcher = None
+        _fail_calls(self._pending, RPCError(SERVER_ERROR, "server is shutting down"))
+        self._pending.clear()
+        # waiting for the running batches would block the event loop
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+
+    async def handle_request(self, request: Any) -> Any:
+        """
+        Handles one decoded JSON-RPC request or batch, returns the response or None for notifications.
+        """
+        self._start()
+        if isinstance(request, list):
+            if not request:
+                return _error_response(None, RPCError(INVALID_REQUEST, "empty batch"))
+            responses = await asyncio.gather(*(self._handle_single(item) for item in request))
+            return [response for response in responses if response is not None] or None
+        return await self._handle_single(request)
+
+    async def _handle_single(self, request: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(request, Mapping) or not isinstance(request.get("method"), str):
+            return _error_response(None, RPCError(INVALID_REQUEST, "invalid request"))
+        request_id = request.get("id")
+        params = request.get("params", [])
+        try:
+            if not isinstance(params, list):
+                raise RPCError(INVALID_PARAMS, "params should be an array")
+            result = await self.call(request["method"], params)
+        except RPCError as e:
+            return None if "id" not in request else _error_response(request_id, e)
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    async def call(self, method: str, params: List[Any]) -> Any:
+        """
+        Runs one call, batched with the other pending calls.
+
+        :raises RPCError: the call failed or the queue is full
+        """
+        if method == "cfx_accounts":
+            return self.addresses
+        if method not in self._methods:
+            raise RPCError(METHOD_NOT_FOUND, f"method not found: {method}")
+        if len(self._pending) >= self.max_pending:
+            raise RPCError(SERVER_BUSY, "too many pending requests")
+        self._start()
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._pending.append((method, params, future))
+        self._has_pending.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_full.set()
+        return await future
+
+    def _start(self) -> None:
+        if self._batcher is None:
+            self._has_pending = asyncio.Event()
+            self._batch_full = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._batcher = asyncio.get_running_loop().create_task(self._run_batcher())
+
+    async def _run_batcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        while True:
+            batch: List[_Call] = []
+            acquired = False
+            try:
+                await self._has_pending.wait()
+                if len(pending) < self.max_batch_size and self.max_wait:
+                    try:
+                        await asyncio.wait_for(self._batch_full.wait(), self.max_wait)
+                    except asyncio.TimeoutError:
+                        pass
+                # at most max_workers batches run at once, calls queue up meanwhile
+                await self._slots.acquire()
+                acquired = True
+                batch = [pending.popleft() for _ in range(min(len(pending), self.max_batch_size))]
+                if len(pending) < self.max_batch_size:
+                    self._batch_full.clear()
+                if not pending:
+                    self._has_pending.clear()
+                job = loop.run_in_executor(self._executor, self._run_batch, [call[:2] for call in batch])
+            except Exception as e:
+                # fail the queued calls rather than leave them waiting for a batcher which is gone
+                if acquired:
+                    self._slots.release()
+                error = RPCError(SERVER_ERROR, f"batching failed: {e}")
+                _fail_calls(batch, error)
+                _fail_calls(pending, error)
+                pending.clear()
+                self._has_pending.clear()
+                self._batch_full.clear()
+                continue
+            job.add_done_callback(lambda job, batch=batch: self._finish_batch(batch, job))  # type: ignore
+
+    def _finish_batch(self, batch: List[_Call], job: "asyncio.Future[List[_Outcome]]") -> None:
+        self._slots.release()
+        if job.cancelled() or job.exception() is not None:
+            error = RPCError(SERVER_ERROR, f"batch failed: {job.exception() if not job.cancelled() else 'cancelled'}")
+            outcomes: List[_Outcome] = [(None, error)] * len(batch)
+        else:
+            outcomes = job.result()
+            self.batch_count += 1
+            self.call_count += len(batch)
+        for (_, _, future), (result, error) in zip(batch, outcomes):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _run_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[_Outcome]:
+        # runs on a worker thread, one failing call does not fail the others
+        outcomes: List[_Outcome] = []
+        for method, params in calls:
+            try:
+                outcomes.append((self._methods[method](self, *params), None))
+            except RPCError as e:
+                outcomes.append((None, e))
+            except TypeError as e:
+                outcomes.append((None, RPCError(INVALID_PARAMS, str(e))))
+            except Exception as e:
+                outcomes.append((None, RPCError(SERVER_ERROR, str(e))))
+        return outcomes
+
+    def _get_key(self, address: Any) -> Tuple[PrivateKey, ChecksumAddress]:
+        try:
+            hex_address = normalize_to(address, None)
+        except Exception:
+            raise RPCError(INVALID_PARAMS, f"invalid address: {address!r}")
+        key = self._keys.get(hex_address)  # type: ignore
+        if key is None:
+            raise RPCError(INVALID_PARAMS, f"unknown account: {address}")
+        return key, hex_address  # type: ignore
+
+    def _sign_transaction(self, address: Any, transaction: Any) -> Dict[str, Any]:
+        key, hex_address = self._get_key(address)
+        if not isinstance(transaction, Mapping):
+            raise RPCError(INVALID_PARAMS, "transaction should be an object")
+        sanitized = drop_matching_from(transaction, hex_address)  # type: ignore
+        v, r, s, raw_transaction = sign_transaction_dict(key, sanitized, None, self.backend)
+        return signed_transaction_to_json(to_signed_transaction(v, r, s, raw_transaction))
+
+    def _sign_message(self, address: Any, message: Any) -> Dict[str, Any]:
+        key, _ = self._get_key(address)
+        message_hash = hash_signable_message(signable_message_from_json(message))
+        v_raw, r, s = self.backend.sign(message_hash, key)
+        v = v_raw + 27
+        return signed_message_to_json(SignedMessage(
+            message_hash=HexBytes(message_hash),
+            r=r,
+            s=s,
+            v=v,
+            signature=HexBytes(r.to_bytes(32, "big") + s.to_bytes(32, "big") + bytes([v])),
+        ))
+
+    def _recover_transaction(self, raw_transaction: Any) -> ChecksumAddress:
+        return Account.recover_transaction(raw_transaction)
+
+    def _recover_message(self, message: Any, signature: Any) -> ChecksumAddress:
+        signable_message = signable_message_from_json(message)
+        message_hash = hash_signable_message(signable_message)
+        signature_bytes = HexBytes(signature)
+        if len(signature_bytes) != 65:
+            raise RPCError(INVALID_PARAMS, "signature should be 65 bytes")
+        v = signature_bytes[64]
+        vrs = (v - 27 if v >= 27 else v, int.from_bytes(signature_bytes[:32], "big"), int.from_bytes(signature_bytes[32:64], "big"))
+        public_key = self.backend.recover(message_hash, vrs)
+        return to_checksum_address(eth_eoa_address_to_cfx_hex(public_key.to_checksum_address()))
+
+    _methods: Dict[str, Callable[..., Any]] = {
+        "cfx_signTransaction": _sign_transaction,
+        "cfx_signMessage": _sign_message,
+        "cfx_recoverTransaction": _recover_transaction,
+        "cfx_recoverMessage": _recover_message,
+    }
+
+    async def _handle_line(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response: Any = _error_response(None, RPCError(PARSE_ERROR, "parse error"))
+        else:
+            response = await self.handle_request(request)
+        if response is not None and not writer.is_closing():
+            writer.write(json.dumps(response).encode() + b"\n")
+
+    def _is_authorized(self, token: Any) -> bool:
+        return isinstance(token, str) and hmac.compare_digest(token.encode(), self.auth_token.encode())
+
+    async def _serve_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, authenticate: bool = True
+    ) -> None:
+        tasks = set()
+        authenticated = not authenticate
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # line longer than MAX_REQUEST_SIZE
+                    writer.write(json.dumps(_error_response(None, RPCError(INVALID_REQUEST, "request too large"))).encode() + b"\n")
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                if not authenticated:
+                    try:
+                        first: Any = json.loads(line)
+                    except ValueError:
+                        first = None
+                    if not isinstance(first, Mapping) or not self._is_authorized(first.get("auth")):
+                        error = _error_response(None, RPCError(UNAUTHORIZED, "unauthorized"))
+                        writer.write(json.dumps(error).encode() + b"\n")
+                        break
+                    authenticated = True
+                    if "method" not in first:
+                        # {"auth": token} alone
+                        continue
+                task = asyncio.ensure_future(self._handle_line(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                parts = request_line.decode("latin-1").split()
+                keep_alive = headers.get("connection", "").lower() != "close" and parts[-1:] == ["HTTP/1.1"]
+                if len(parts) != 3 or parts[0] != "POST":
+                    await _write_http(writer, 405, b"", keep_alive=False)
+                    break
+                if "origin" in headers or not _is_loopback_host(headers.get("host", "")):
+                    # a browser request, possibly from a page reaching localhost through DNS rebinding
+                    await _write_http(writer, 403, b"", keep_alive=False)
+                    break
+                scheme, _, token = headers.get("authorization", "").partition(" ")
+                if self.require_auth and (scheme.lower() != "bearer" or not self._is_authorized(token.strip())):
+                    await _write_http(writer, 401, b"", keep_alive=False)
+                    break
+                length = int(headers.get("content-length", "0"))
+                if length > MAX_REQUEST_SIZE:
+                    await _write_http(writer, 413, b"", keep_alive=False)
+                    break
+                body = await reader.readexactly(length)
+                try:
+                    request = json.loads(body)
+                except ValueError:
+                    response: Any = _error_response(None, RPCError(PARSE_ERROR, "parse error"))
+                else:
+                    response = await self.handle_request(request)
+                payload = b"" if response is None else json.dumps(response).encode()
+                await _write_http(writer, 200 if response is not None else 204, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+_HTTP_REASONS = {
+    200: "OK",
+    204: "No Content",
+    401: "Unauthorized",
+    403: "Forbidden",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+async def _write_http(writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool) -> None:
+    head = (
+        f"HTTP/1.1 {status} {_HTTP_REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+def _error_response(request_id: Any, error: RPCError) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": error.code, "message": error.message}}
+
+
+def _fail_calls(calls: Iterable[_Call], error: RPCError) -> None:
+    for _, _, future in calls:
+        if not future.done():
+            future.set_exception(error)
+
+
+def _bind_private_unix_socket(path: str) -> socket.socket:
+    # binding in a private directory and moving the socket into place afterwards,
+    # so that it is never reachable with a wider mode and the process umask is left alone
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise FileExistsError(f"{path} exists and is not a socket")
+    except FileNotFoundError:
+        pass
+    directory = tempfile.mkdtemp(prefix=".cfx-signer-", dir=os.path.dirname(os.path.abspath(path)))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        temporary_path = os.path.join(directory, "socket")
+        sock.bind(temporary_path)
+        os.chmod(temporary_path, 0o600)
+        os.replace(temporary_path, path)
+    except BaseException:
+        sock.close()
+        raise
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return sock
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _is_loopback_host(host_header: str) -> bool:
+    # a Host header: name, name:port, [ipv6] or [ipv6]:port
+    host = host_header.strip().lower()
+    if host.startswith("["):
+        host, _, _ = host[1:].partition("]")
+    elif host.count(":") == 1:
+        host, _, _ = host.partition(":")
+    return _is_loopback(host)
+
+
+def _ensure_loopback(host: str) -> None:
+    if not _is_loopback(host):
+        raise ValueError(f"The signing server only listens on loopback addresses, got {host}")
@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING, Any, Optional, Union, Type
 from typing_extensions import Literal
+from eth_keys.datatypes import PrivateKey
 from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from eth_account.signers.base import BaseAccount
 from eth_account.signers.local import LocalAccount as EthLocalAccount
 from eth_account.datastructures import (
     SignedMessage,
@@ -112,6 +115,13 @@ class LocalAccount(EthLocalAccount):
         Get the private key.
         """
         return super().key
+
+    @property
+    def key_obj(self) -> PrivateKey:
+        """
+        Get the private key as an :class:`eth_keys.datatypes.PrivateKey`.
+        """
+        return self._key_obj
     
     def get_base32_address(self, specific_network_id: int) -> Base32Address:
         """
@@ -146,3 +156,104 @@ class LocalAccount(EthLocalAccount):
     
     def __bytes__(self) -> bytes:
         return self.key
+
+
+class CompactLocalAccount:
+    """
+    A :class:`LocalAccount` keeping only the raw private key, hex address and network id, in slots.
+    ``eth_keys`` key objects are created for each signature instead of being kept,
+    so each account takes about a third of the memory of a :class:`LocalAccount` and signs slightly slower.
+    """
+
+    __slots__ = ("_private_key", "_hex_address", "_network_id", "_publicapi")
+
+    def __init__(self, key: Any, account: Union["Account", Type["Account"]], network_id: Optional[int]=None):
+        if network_id is not None:
+            validate_network_id(network_id)
+        key_obj = account.parse_private_key(key)
+        self._private_key: bytes = key_obj.to_bytes()
+        self._hex_address: ChecksumAddress = to_checksum_address(
+            eth_eoa_address_to_cfx_hex(key_obj.public_key.to_checksum_address())
+        )
+        self._network_id = network_id
+        self._publicapi = account
+
+    @classmethod
+    def from_key_and_address(
+        cls,
+        private_key: bytes,
+        hex_address: ChecksumAddress,
+        account: Union["Account", Type["Account"]],
+        network_id: Optional[int] = None,
+    ) -> "CompactLocalAccount":
+        """
+        Creates an account without deriving its address, for callers which derived it already.
+        Neither argument is validated: ``hex_address`` must be the address of ``private_key``.
+
+        :param bytes private_key: the raw 32-byte private key
+        :param ChecksumAddress hex_address: the checksum hex address of the key
+        :param Optional[int] network_id: target network of the account, defaults to None
+        """
+        instance = cls.__new__(cls)
+        instance._private_key = private_key
+        instance._hex_address = hex_address
+        instance._network_id = network_id
+        instance._publicapi = account
+        return instance
+
+    @classmethod
+    def from_local_account(cls, local_account: LocalAccount) -> "CompactLocalAccount":
+        return cls(local_account.key, local_account._publicapi, local_account.network_id)  # type: ignore
+
+    @property
+    def network_id(self) -> Union[int, None]:
+        return self._network_id
+
+    @network_id.setter
+    def network_id(self, new_network_id: Union[int, None]) -> None:
+        if new_network_id is not None:
+            validate_network_id(new_network_id)
+        self._network_id = new_network_id
+
+    @property
+    def address(self) -> Union[Base32Address, ChecksumAddress]:
+        if not self._network_id:
+            return self._hex_address
+        return Base32Address(self._hex_address, self._network_id)
+
+    @property
+    def hex_address(self) -> ChecksumAddress:
+        return self._hex_address
+
+    @property
+    def base32_address(self) -> Base32Address:
+        if not self._network_id:
+            raise ValueError("Network id is not set. Please set it using `account.network_id = <network_id>`")
+        return Base32Address(self._hex_address, self._network_id)
+
+    @property
+    def key(self) -> HexBytes:
+        return HexBytes(self._private_key)
+
+    def get_base32_address(self, specific_network_id: int) -> Base32Address:
+        return Base32Address(self._hex_address, specific_network_id)
+
+    def sign_transaction(self, transaction_dict: TxParam) -> SignedTransaction:
+        return self._publicapi.sign_transaction(transaction_dict, self._private_key)
+
+    def sign_message(self, signable_message: SignableMessage) -> SignedMessage:
+        return self._publicapi.sign_message(signable_message, self._private_key)
+
+    def encrypt(self, password: str, kdf: Optional[Literal['scrypt', 'pbkdf2']]=None, iterations: Optional[int]=None) -> KeyfileDict:
+        return self._publicapi.encrypt(self._private_key, password, kdf, iterations)
+
+    def __bytes__(self) -> bytes:
+        return self._private_key
+
+    def __repr__(self) -> str:
+        return f"<CompactLocalAccount {self.address}>"
+
+
+# isinstance checks against eth_account's BaseAccount accept compact accounts,
+# which can not subclass it without getting a __dict__
+BaseAccount.register(CompactLocalAccount)
@@ -0,0 +1,163 @@
+"""
+Batch signing on a thread pool, for runtimes where worker processes are not an option
+(no ``fork``, embedded interpreters) or not needed (free-threaded CPython).
+
+Threads only scale if the expensive parts of signing run without the GIL.
+With the coincurve backend, ECDSA runs in libsecp256k1 with the GIL released,
+leaving RLP encoding as the only GIL-bound stage.
+"""
+import os
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from typing_extensions import Self
+from collections.abc import Mapping
+from eth_account.datastructures import SignedTransaction
+from eth_keys.datatypes import PrivateKey
+from eth_utils.address import to_checksum_address
+
+from cfx_address import eth_eoa_address_to_cfx_hex
+from cfx_utils.types import ChecksumAddress, TxParam
+
+from cfx_account.account import Account, drop_matching_from, to_signed_transaction
+from cfx_account.datastructures import CompactSignedTransaction
+from cfx_account.backends import BackendSpec, SigningBackend, get_backend, self_test
+from cfx_account._utils.signing import sign_transaction_dict
+from cfx_account._utils.units import drip_units_to_int_many
+
+PrivateKeyLike = Union[bytes, str, PrivateKey]
+
+_SigningItem = Tuple[TxParam, PrivateKey, ChecksumAddress]
+
+
+def gil_enabled() -> bool:
+    """
+    False on free-threaded CPython builds running with the GIL disabled.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+class ThreadPoolSigner:
+    """
+    Signs batches of transactions on a pool of threads.
+    Results are identical to :meth:`Account.sign_transaction <cfx_account.account.Account.sign_transaction>`.
+
+    >>> with ThreadPoolSigner(max_workers=8) as signer:
+    ...     signed = signer.sign_transactions(transactions, key)
+
+    :param Optional[int] max_workers: number of threads, defaults to the number of CPUs
+    :param BackendSpec backend: signing backend, see :func:`cfx_account.backends.get_backend`, defaults to "auto"
+    :param Optional[int] chunksize: transactions signed per task, defaults to about 4 tasks per thread
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        backend: BackendSpec = "auto",
+        chunksize: Optional[int] = None,
+    ):
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize should be positive, got {chunksize}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.backend: SigningBackend = get_backend(backend)
+        self_test(self.backend)
+        if not self.backend.releases_gil and gil_enabled():
+            warnings.warn(
+                f"The {self.backend.name} signing backend holds the GIL, "
+                "signing will not scale with threads. Install coincurve or use processes",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="cfx-signer")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Waits for pending batches and stops the threads.
+        """
+        self._executor.shutdown(wait=True)
+
+    def sign_transactions(
+        self,
+        transactions: Sequence[TxParam],
+        private_key: Union[PrivateKeyLike, Sequence[PrivateKeyLike]],
+        compact: bool = False,
+    ) -> List[Union[SignedTransaction, CompactSignedTransaction]]:
+        """
+        Signs ``transactions`` in parallel. The transaction dicts are not modified.
+
+        :param Sequence[TxParam] transactions: transactions as accepted by :meth:`Account.sign_transaction`
+        :param private_key: one key signing every transaction, or a sequence of keys, one per transaction
+        :param bool compact: return :class:`~cfx_account.datastructures.CompactSignedTransaction` objects,
+            whose hashes are computed on first access, defaults to False
+        :raises TypeError: a transaction is not a dict-like object
+        :raises ValueError: a transaction's from field does not match its key,
+            or the number of keys does not match the number of transactions
+        :return List[SignedTransaction]: signed transactions in input order
+        """
+        if _is_single_key(private_key):
+            signer = _parse_key(private_key)  # type: ignore
+            signers = [signer] * len(transactions)
+        else:
+            if len(private_key) != len(transactions):  # type: ignore
+                raise ValueError(
+                    f"Expecting one private key per transaction, got {len(private_key)} keys "  # type: ignore
+                    f"for {len(transactions)} transactions"
+                )
+            parsed = {}
+            signers = []
+            for key in private_key:  # type: ignore
+                if key not in parsed:
+                    parsed[key] = _parse_key(key)
+                signers.append(parsed[key])
+        # token units shared across the batch are converted once
+        items = [
+            (transaction, key_obj, hex_address)
+            for transaction, (key_obj, hex_address) in zip(drip_units_to_int_many(transactions), signers)
+        ]
+        if not items:
+            return []
+        chunksize = self.chunksize or max(1, -(-len(items) // (self.max_workers * 4)))
+        chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+        futures = [self._executor.submit(self._sign_chunk, chunk, compact) for chunk in chunks]
+        results: List[Union[SignedTransaction, CompactSignedTransaction]] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _sign_chunk(
+        self, items: List[_SigningItem], compact: bool
+    ) -> List[Union[SignedTransaction, CompactSignedTransaction]]:
+        backend = self.backend
+        results: List[Union[SignedTransaction, CompactSignedTransaction]] = []
+        for transaction, key_obj, hex_address in items:
+            if not isinstance(transaction, Mapping):
+                raise TypeError("transaction_dict must be dict-like, got %r" % transaction)
+            sanitized = drop_matching_from(transaction, hex_address)  # type: ignore
+            v, r, s, raw_transaction = sign_transaction_dict(key_obj, sanitized, None, backend)
+            if compact:
+                results.append(CompactSignedTransaction(raw_transaction, r, s, v))
+            else:
+                results.append(to_signed_transaction(v, r, s, raw_transaction))
+        return results
+
+
+def _is_single_key(private_key: Any) -> bool:
+    return isinstance(private_key, (bytes, str, int, PrivateKey))
+
+
+def _parse_key(private_key: PrivateKeyLike) -> Tuple[PrivateKey, ChecksumAddress]:
+    key_obj: PrivateKey = Account.parse_private_key(private_key)
+    hex_address = to_checksum_address(
+        eth_eoa_address_to_cfx_hex(key_obj.public_key.to_checksum_address())
+    )
+    return key_obj, hex_address  # type: ignore
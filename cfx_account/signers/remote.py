@@ -0,0 +1,382 @@
+"""
+Accounts whose keys live in an external signer, e.g. :class:`cfx_account.server.SigningServer`
+or any endpoint answering the same JSON-RPC methods over newline-delimited JSON.
+
+Connections are opened once and kept in a pool. Each connection is shared by concurrent callers:
+requests are pipelined, and requests queued while another caller is writing are sent in the same write.
+
+>>> client = RemoteSignerClient("unix:///run/cfx-signer.sock", pool_size=4, timeout=5)
+>>> client = RemoteSignerClient("tcp://127.0.0.1:8546", auth_token=server.auth_token)
+>>> account = RemoteAccount.from_client(client, network_id=1029)
+>>> account.sign_transaction(transaction).raw_transaction
+"""
+import itertools
+import json
+import socket
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+from typing_extensions import Self
+from cfx_address import Base32Address
+from cfx_address.utils import normalize_to, validate_network_id
+from cfx_utils.token_unit import AbstractTokenUnit
+from cfx_utils.types import ChecksumAddress, TxParam
+from eth_account.datastructures import SignedMessage, SignedTransaction
+from eth_account.messages import SignableMessage
+
+from cfx_account._utils.units import to_int_if_drip_units
+from cfx_account.server import (
+    UNAUTHORIZED,
+    RPCError,
+    signable_message_to_json,
+    signed_message_from_json,
+    signed_transaction_from_json,
+)
+
+
+def to_json_value(value: Any) -> Any:
+    """
+    Converts a transaction, or any of its values, to JSON-serializable values:
+    bytes to hex strings and token units to ints in Drip.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "0x" + bytes(value).hex()
+    if isinstance(value, AbstractTokenUnit):
+        return to_int_if_drip_units(value)
+    if isinstance(value, Mapping):
+        return {key: to_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_value(item) for item in value]
+    return value
+
+
+class _Connection:
+    """
+    One persistent connection. Responses are read by a background thread and matched to requests by id.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self._pending: Dict[int, "Future[Any]"] = {}
+        self._pending_lock = threading.Lock()
+        # lines waiting to be written, flushed in one write by whichever caller holds _write_lock
+        self._outbox: List[bytes] = []
+        self._outbox_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.closed = False
+        self._error: BaseException = ConnectionError("connection to the remote signer is closed")
+        self._reader = threading.Thread(target=self._read_responses, name="cfx-remote-signer-reader", daemon=True)
+        self._reader.start()
+
+    def send(self, line: bytes, futures: Dict[int, "Future[Any]"]) -> None:
+        with self._pending_lock:
+            if self.closed:
+                # e.g. the RPCError of a rejected auth token
+                raise self._error
+            self._pending.update(futures)
+        with self._outbox_lock:
+            self._outbox.append(line)
+        with self._write_lock:
+            with self._outbox_lock:
+                lines, self._outbox = self._outbox, []
+            if not lines:
+                # flushed by the previous writer
+                return
+            try:
+                self._socket.sendall(b"".join(lines))
+            except OSError as e:
+                self._fail(e)
+
+    def forget(self, request_id: int) -> None:
+        with self._pending_lock:
+            self._pending.pop(request_id, None)
+
+    def close(self) -> None:
+        self._fail(ConnectionError("connection to the remote signer is closed"))
+
+    def _read_responses(self) -> None:
+        error: BaseException = ConnectionError("remote signer closed the connection")
+        try:
+            for line in self._socket.makefile("rb"):
+                response = json.loads(line)
+                for item in response if isinstance(response, list) else [response]:
+                    self._resolve(item)
+        except (OSError, ValueError) as e:
+            error = e if isinstance(e, OSError) else ConnectionError(f"invalid response from the remote signer: {e}")
+        self._fail(error)
+
+    def _resolve(self, response: Any) -> None:
+        if not isinstance(response, Mapping):
+            return
+        error = response.get("error")
+        if response.get("id") is None and isinstance(error, Mapping) and error.get("code") == UNAUTHORIZED:
+            # the signer rejected the auth token and closes the connection
+            self._fail(RPCError(UNAUTHORIZED, error.get("message", "unauthorized")))
+            return
+        with self._pending_lock:
+            future = self._pending.pop(response.get("id"), None)  # type: ignore
+        if future is None:
+            # timed out, or an error about an unparsable request
+            return
+        if error is not None:
+            future.set_exception(RPCError(error.get("code", 0), error.get("message", "")))
+        else:
+            future.set_result(response.get("result"))
+
+    def _fail(self, error: BaseException) -> None:
+        with self._pending_lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._error = error
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(error)
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+
+class RemoteSignerClient:
+    """
+    A pool of persistent connections to a JSON-RPC signer.
+
+    :param str endpoint: ``unix:///path/to/socket`` or ``tcp://host:port``
+    :param int pool_size: number of connections, calls are spread over them round-robin, defaults to 4
+    :param float timeout: default seconds to wait for a response, defaults to 10
+    :param float connect_timeout: seconds to wait for a connection, defaults to 5
+    :param Optional[str] auth_token: token sent on every TCP connection, see :attr:`SigningServer.auth_token`
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        pool_size: int = 4,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        auth_token: Optional[str] = None,
+    ):
+        if pool_size < 1:
+            raise ValueError(f"pool_size should be positive, got {pool_size}")
+        parsed = urlsplit(endpoint)
+        if parsed.scheme == "unix" and parsed.path:
+            self._address: Union[str, Tuple[str, int]] = parsed.path
+            self._family = socket.AF_UNIX
+        elif parsed.scheme == "tcp" and parsed.hostname and parsed.port:
+            self._address = (parsed.hostname, parsed.port)
+            self._family = socket.AF_INET6 if ":" in parsed.hostname else socket.AF_INET
+        else:
+            raise ValueError(f"endpoint should be unix:///path or tcp://host:port, got {endpoint}")
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.auth_token = auth_token
+        self._connections: List[Optional[_Connection]] = [None] * pool_size
+        self._connections_lock = threading.Lock()
+        self._next_connection: Iterator[int] = itertools.cycle(range(pool_size))
+        self._ids = itertools.count(1)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = [None] * len(connections)
+        for connection in connections:
+            if connection is not None:
+                connection.close()
+
+    def call(self, method: str, params: Sequence[Any], timeout: Optional[float] = None) -> Any:
+        """
+        :raises RPCError: the signer answered with an error
+        :raises TimeoutError: no response within ``timeout`` seconds
+        :raises ConnectionError: the connection was lost before the response arrived
+        """
+        result = self.call_many([(method, params)], timeout)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def call_many(
+        self, calls: Sequence[Tuple[str, Sequence[Any]]], timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Sends ``calls`` as one JSON-RPC batch.
+
+        :raises TimeoutError: not every response arrived within ``timeout`` seconds of sending the batch
+        :raises ConnectionError: the connection was lost before every response arrived
+        :return List[Any]: one result per call, or the :class:`RPCError` of each failed call
+        """
+        if not calls:
+            return []
+        timeout = self.timeout if timeout is None else timeout
+        requests = []
+        futures: Dict[int, "Future[Any]"] = {}
+        for method, params in calls:
+            request_id = next(self._ids)
+            requests.append({"jsonrpc": "2.0", "id": request_id, "method": method, "params": list(params)})
+            futures[request_id] = Future()
+        payload = requests[0] if len(requests) == 1 else requests
+        line = json.dumps(payload, separators=(",", ":")).encode() + b"\n"
+        connection = self._get_connection()
+        connection.send(line, futures)
+        # one deadline for the whole batch, not timeout per response
+        deadline = time.monotonic() + timeout
+        results: List[Any] = []
+        try:
+            for future in futures.values():
+                try:
+                    results.append(future.result(max(deadline - time.monotonic(), 0)))
+                except RPCError as e:
+                    results.append(e)
+        except FutureTimeoutError:
+            for request_id in futures:
+                connection.forget(request_id)
+            raise TimeoutError(f"the remote signer did not answer within {timeout} seconds")
+        return results
+
+    def _get_connection(self) -> _Connection:
+        with self._connections_lock:
+            index = next(self._next_connection)
+            connection = self._connections[index]
+        if connection is not None and not connection.closed:
+            return connection
+        # connects without holding the lock, a slow connect would stall callers of the other connections
+        new_connection = _Connection(self._connect())
+        with self._connections_lock:
+            connection = self._connections[index]
+            if connection is None or connection.closed:
+                self._connections[index] = new_connection
+                return new_connection
+        # another caller connected meanwhile
+        new_connection.close()
+        return connection
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        sock.settimeout(self.connect_timeout)
+        try:
+            sock.connect(self._address)
+            if self._family != socket.AF_UNIX:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if self.auth_token is not None:
+                    sock.sendall(json.dumps({"auth": self.auth_token}).encode() + b"\n")
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(None)
+        return sock
+
+
+class RemoteAccount:
+    """
+    Same interface as :class:`~cfx_account.signers.local.LocalAccount` for signing,
+    with the key held by a remote signer.
+
+    :param address: the account's address, hex or base32
+    :param RemoteSignerClient client: the connection pool, may be shared by several accounts
+    :param Optional[int] network_id: the network id of the account, which determines its address,
+        defaults to the network id of a base32 address, else None
+    """
+
+    def __init__(self, address: str, client: RemoteSignerClient, network_id: Optional[int] = None):
+        if network_id is None and Base32Address.is_valid_base32(address):
+            network_id = Base32Address(address).network_id
+        if network_id is not None:
+            validate_network_id(network_id)
+        self._hex_address: ChecksumAddress = normalize_to(address, None)  # type: ignore
+        self._network_id = network_id
+        self.client = client
+
+    @classmethod
+    def from_client(cls, client: RemoteSignerClient, network_id: Optional[int] = None) -> "RemoteAccount":
+        """
+        The account served by ``client``'s signer.
+
+        :raises ValueError: the signer does not serve exactly one account
+        """
+        addresses = client.call("cfx_accounts", [])
+        if len(addresses) != 1:
+            raise ValueError(f"The remote signer serves {len(addresses)} accounts, specify the address")
+        return cls(addresses[0], client, network_id)
+
+    @property
+    def network_id(self) -> Optional[int]:
+        return self._network_id
+
+    @network_id.setter
+    def network_id(self, new_network_id: Optional[int]) -> None:
+        if new_network_id is not None:
+            validate_network_id(new_network_id)
+        self._network_id = new_network_id
+
+    @property
+    def address(self) -> Union[Base32Address, ChecksumAddress]:
+        """
+        Returns a Base32Address if network id is not None, else the hex address.
+        """
+        if not self._network_id:
+            return self._hex_address
+        return Base32Address(self._hex_address, self._network_id)
+
+    @property
+    def hex_address(self) -> ChecksumAddress:
+        return self._hex_address
+
+    @property
+    def base32_address(self) -> Base32Address:
+        if not self._network_id:
+            raise ValueError("Network id is not set. Please set it using `account.network_id = <network_id>`")
+        return Base32Address(self._hex_address, self._network_id)
+
+    def sign_transaction(self, transaction_dict: TxParam, timeout: Optional[float] = None) -> SignedTransaction:
+        """
+        Signs a transaction remotely, see :meth:`Account.sign_transaction <cfx_account.account.Account.sign_transaction>`.
+
+        :raises RPCError: the signer rejected the transaction
+        :raises TimeoutError: no response within ``timeout`` seconds, defaults to the client's timeout
+        """
+        result = self.client.call(
+            "cfx_signTransaction", [self._hex_address, to_json_value(transaction_dict)], timeout
+        )
+        return signed_transaction_from_json(result)
+
+    def sign_transactions(
+        self, transactions: Sequence[TxParam], timeout: Optional[float] = None
+    ) -> List[SignedTransaction]:
+        """
+        Signs ``transactions`` in one batched request.
+
+        :raises RPCError: the signer rejected one of the transactions
+        :raises TimeoutError: not every response arrived within ``timeout`` seconds
+        """
+        results = self.client.call_many(
+            [("cfx_signTransaction", [self._hex_address, to_json_value(transaction)]) for transaction in transactions],
+            timeout,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return [signed_transaction_from_json(result) for result in results]
+
+    def sign_message(self, signable_message: SignableMessage, timeout: Optional[float] = None) -> SignedMessage:
+        """
+        Signs a message remotely, see :meth:`Account.sign_message <cfx_account.account.Account.sign_message>`.
+        """
+        result = self.client.call(
+            "cfx_signMessage", [self._hex_address, signable_message_to_json(signable_message)], timeout
+        )
+        return signed_message_from_json(result)
+
+    def __repr__(self) -> str:
+        return f"<RemoteAccount {self.address} via {self.client.endpoint}>"
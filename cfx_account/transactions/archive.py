@@ -0,0 +1,193 @@
+"""
+Memory-mapped reading of bulk raw transaction archives.
+
+Two on-disk layouts are supported:
+
+ * ``"concatenated"``: signed raw transactions written back to back. Records are delimited
+   by their own RLP headers (after the optional ``b'cfx' || 0x02`` prefix).
+ * ``"length-prefixed"``: every record is preceded by its length as a 4-byte big-endian integer.
+"""
+import mmap
+from typing import Iterator, List, Optional, Tuple, Union
+
+from rlp.exceptions import DecodingError
+from typing_extensions import Literal, Self
+
+from cfx_account.transactions.base import TransactionImplementation
+from cfx_account.transactions.cip1559_transactions import CIP1559_TRANSACTION_PREFIX
+from cfx_account.transactions.transactions import Transaction
+from cfx_account.transactions.views import RawTransactionView, consume_item
+
+ArchiveFormat = Literal["concatenated", "length-prefixed"]
+
+LENGTH_PREFIX_SIZE = 4
+
+
+class RawTransactionArchive:
+    """
+    Iterates over a file of signed raw transactions without reading it into Python ``bytes``.
+    Records are yielded as memoryview slices of the mapped file, as lazy
+    :class:`~cfx_account.transactions.views.RawTransactionView` objects or as decoded transactions.
+
+    Slices and views reference the mapping and are only valid until the archive is closed.
+
+    >>> with RawTransactionArchive("txs.bin") as archive:
+    ...     for view in archive.iter_views():
+    ...         print(view.nonce)
+
+    For parallel processing, :meth:`split` returns record-aligned byte ranges.
+    Each worker opens the archive itself and reads its range:
+
+    >>> ranges = RawTransactionArchive("txs.bin").split(4)
+    >>> # in worker i
+    >>> with RawTransactionArchive("txs.bin") as archive:
+    ...     nonces = [view.nonce for view in archive.iter_views(*ranges[i])]
+    """
+
+    def __init__(self, path: str, format: ArchiveFormat = "concatenated"):
+        if format not in ("concatenated", "length-prefixed"):
+            raise ValueError(f"Unknown archive format: {format}")
+        self.path = path
+        self.format = format
+        self._file = open(path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mmap)
+        except ValueError:
+            # empty files can not be mapped
+            self._buffer = memoryview(b"")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file.
+        Raises BufferError if record slices or views are still referenced: the file is closed anyway,
+        but the mapping stays readable until they are dropped and ``close`` is called again.
+        """
+        self._buffer.release()
+        try:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    self._buffer = memoryview(self._mmap)
+                    raise
+        finally:
+            # the mapping holds its own descriptor
+            self._file.close()
+
+    def __len__(self) -> int:
+        """
+        Size of the archive in bytes.
+        """
+        return len(self._buffer)
+
+    def _record_span(self, position: int) -> Tuple[int, int]:
+        # returns (record_start, record_end) of the record framed at position
+        buffer = self._buffer
+        if self.format == "length-prefixed":
+            record_start = position + LENGTH_PREFIX_SIZE
+            if record_start > len(buffer):
+                raise ValueError(f"Truncated length prefix at offset {position}")
+            record_end = record_start + int.from_bytes(buffer[position:record_start], "big")
+            if record_end > len(buffer):
+                raise ValueError(f"Truncated record at offset {position}")
+            return record_start, record_end
+        rlp_start = position
+        if buffer[position:position + len(CIP1559_TRANSACTION_PREFIX)].tobytes() == CIP1559_TRANSACTION_PREFIX:
+            rlp_start += len(CIP1559_TRANSACTION_PREFIX)
+        try:
+            _, _, record_end = consume_item(buffer, rlp_start)
+        except DecodingError as e:
+            raise ValueError(f"Malformed record at offset {position}: {e}") from e
+        return position, record_end
+
+    def iter_raw(self, start: int = 0, end: Optional[int] = None) -> Iterator[memoryview]:
+        """
+        Yields the records framed in ``[start, end)`` as memoryview slices of the mapped file.
+        ``start`` must be a record boundary, e.g. a value returned by :meth:`split`.
+
+        :raises ValueError: a record is truncated or its header is malformed
+        """
+        end = len(self._buffer) if end is None else end
+        position = start
+        while position < end:
+            record_start, record_end = self._record_span(position)
+            yield self._buffer[record_start:record_end]
+            position = record_end
+
+    def iter_views(self, start: int = 0, end: Optional[int] = None) -> Iterator[RawTransactionView]:
+        """
+        Yields lazy views of the records in ``[start, end)``.
+        """
+        for record in self.iter_raw(start, end):
+            yield RawTransactionView(record)
+
+    def iter_transactions(
+        self, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[TransactionImplementation]:
+        """
+        Yields fully decoded transactions of the records in ``[start, end)``,
+        using :meth:`~cfx_account.transactions.transactions.Transaction.from_bytes`.
+        """
+        for record in self.iter_raw(start, end):
+            # rlp decoding requires bytes, so this is the only copy of a record
+            yield Transaction.from_bytes(bytes(record))  # type: ignore
+
+    __iter__ = iter_views
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Splits the archive into at most ``parts`` contiguous, record-aligned byte ranges of similar size.
+        Only record headers are read to find the boundaries.
+
+        :param int parts: number of ranges wanted, usually the number of workers
+        :raises ValueError: a record is truncated or its header is malformed
+        :return List[Tuple[int, int]]: ``(start, end)`` ranges accepted by the iter_* methods
+        """
+        if parts < 1:
+            raise ValueError(f"parts should be positive, got {parts}")
+        total = len(self._buffer)
+        ranges: List[Tuple[int, int]] = []
+        range_start = position = 0
+        while position < total:
+            _, position = self._record_span(position)
+            if position >= total * (len(ranges) + 1) / parts and len(ranges) < parts - 1:
+                ranges.append((range_start, position))
+                range_start = position
+        if range_start < total:
+            ranges.append((range_start, total))
+        return ranges
+
+
+def iter_archive(
+    path: str,
+    format: ArchiveFormat = "concatenated",
+    byte_range: Optional[Tuple[int, int]] = None,
+    decode: bool = False,
+) -> Iterator[Union[RawTransactionView, TransactionImplementation]]:
+    """
+    Convenience generator for workers: opens ``path``, yields views (or decoded transactions
+    if ``decode`` is True) of the records in ``byte_range`` and closes the archive afterwards.
+    Views are only valid while the generator is not exhausted and should be dropped before:
+    the file is closed at the end either way, but the mapping stays until the last view is collected.
+    """
+    start, end = byte_range or (0, None)
+    archive = RawTransactionArchive(path, format)
+    try:
+        if decode:
+            yield from archive.iter_transactions(start, end)
+        else:
+            yield from archive.iter_views(start, end)
+    finally:
+        try:
+            archive.close()
+        except BufferError:
+            # views handed out are still alive, the mapping is released once they are collected
+            pass
@@ -3,6 +3,8 @@ from typing import Any, Dict, Tuple
 from typing_extensions import Self
 from cfx_utils.types import TxParam
 
+from cfx_account.transactions.encoding import RLPPayload
+
 class TransactionImplementation(ABC):
     """
     Abstract class that every type of transaction must implement.
@@ -11,6 +13,9 @@ class TransactionImplementation(ABC):
     
     transaction_type: int
 
+    # subclasses declare their instance attributes in __slots__, without a per-instance __dict__
+    __slots__ = ()
+
     # blob_data: Optional[BlobPooledTransactionData] = None
     
     @abstractmethod
@@ -40,3 +45,10 @@ class TransactionImplementation(ABC):
     @abstractmethod
     def encode(self, *, allow_unsigned: bool = False) -> bytes:
         pass
+
+    @abstractmethod
+    def signing_payload(self) -> RLPPayload:
+        """
+        The unjoined payload whose keccak is signed, ``hash()`` is ``signing_payload().keccak()``.
+        """
+        pass
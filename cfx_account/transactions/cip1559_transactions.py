@@ -1,25 +1,34 @@
-from typing import Any, ClassVar, Dict, Tuple
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
-import rlp
-from eth_account._utils.transaction_utils import transaction_rpc_to_rlp_structure
 from eth_rlp import HashableRLP
-from eth_utils import keccak
 from eth_utils.curried import apply_formatters_to_dict
-from hexbytes import HexBytes
 from rlp.sedes import Binary, big_endian_int, binary
-from toolz import dissoc, merge, partial, pipe
+from toolz import merge, partial, pipe
 from typing_extensions import Self
 
 from cfx_account.transactions.base import TransactionImplementation
+from cfx_account.transactions.encoding import (
+    RLPPayload,
+    cip1559_unsigned_payload,
+    encode_signed_rlp,
+)
 from cfx_account.transactions.transaction_utils import access_list_sede_type
 
 from .transaction_utils import TYPED_TRANSACTION_FORMATTERS
 
+# b'cfx' || 0x02
+CIP1559_TRANSACTION_PREFIX = b"cfx\x02"
+
 
 class CIP1559Transaction(TransactionImplementation):
 
+    __slots__ = ("_dictionary", "_unsigned_payload")
+
     transaction_type: ClassVar[int] = 2
 
+    # b'cfx' || 0x02 || rlp([nonce, ..., accessList]), computed on first use
+    _unsigned_payload: Optional[RLPPayload]
+
     unsigned_transaction_fields = (
         ("nonce", big_endian_int),
         ("maxPriorityFeePerGas", big_endian_int),
@@ -85,6 +94,7 @@ class CIP1559Transaction(TransactionImplementation):
         )
 
         self._dictionary = sanitized_dictionary
+        self._unsigned_payload = None
 
     def hash(self) -> bytes:
         """
@@ -94,7 +104,7 @@ class CIP1559Transaction(TransactionImplementation):
         ``keccak256(b'cfx' || 0x02 || rlp([nonce, maxPriorityFeePerGas,
         maxFeePerGas, gas, to, value, data, storageLimit, epochHeight, accessList]))``
         """
-        return keccak(self._encode_unsigned())
+        return self.signing_payload().keccak()
 
     def as_dict(self) -> Dict[str, Any]:
         return self._dictionary
@@ -114,18 +124,14 @@ class CIP1559Transaction(TransactionImplementation):
         self._dictionary.update({"v": v, "r": r, "s": s})
         return self
     
-    def _encode_unsigned(self) -> bytes:
-        transaction_without_signature_fields = dissoc(self._dictionary, "v", "r", "s")
-        rlp_structured_txn_without_sig_fields = transaction_rpc_to_rlp_structure(
-            transaction_without_signature_fields
-        )
-        rlp_serializer = self.__class__._unsigned_transaction_serializer
-        return pipe(
-            rlp_serializer.from_dict(rlp_structured_txn_without_sig_fields),  # type: ignore  # noqa: E501
-            lambda val: rlp.encode(val),  # type: ignore
-            # (b'cfx' || 0x02 || rlp([...]))
-            lambda val: HexBytes(b"cfx") + HexBytes("0x02") + HexBytes(val),  # type: ignore
-        )
+    def signing_payload(self) -> RLPPayload:
+        """
+        Returns b'cfx' || 0x02 || rlp([nonce, maxPriorityFeePerGas, ..., accessList]) as unjoined pieces.
+        The result is cached so that hashing and the signed encoding share one RLP pass.
+        """
+        if self._unsigned_payload is None:
+            self._unsigned_payload = cip1559_unsigned_payload(self._dictionary, CIP1559_TRANSACTION_PREFIX)
+        return self._unsigned_payload
 
     def encode(self, *, allow_unsigned: bool = False) -> bytes:
         """
@@ -136,26 +142,46 @@ class CIP1559Transaction(TransactionImplementation):
 
         The transaction payload is:
 
-            TransactionPayload = rlp([ nonce, maxPriorityFeePerGas,
-            maxFeePerGas, gasLimit, to, value, storageLimit, epochHeight
-            data, accessList, signatureYParity, signatureR, signatureS])
+            TransactionPayload = rlp([ rlp([nonce, maxPriorityFeePerGas,
+            maxFeePerGas, gasLimit, to, value, storageLimit, epochHeight,
+            chainId, data, accessList]), signatureYParity, signatureR, signatureS])
         """
         if not self.is_signed():
             if not allow_unsigned:
                 raise ValueError("attempting to encode an unsigned transaction without allow_unsigned=True")
-            return self._encode_unsigned()
-        rlp_serializer = self.__class__._signed_transaction_serializer
-        rlp_structured_dict = transaction_rpc_to_rlp_structure(self._dictionary)
-        tx_meta = dissoc(rlp_structured_dict, "v", "r", "s")
-        payload = rlp.encode(
-            rlp_serializer(
-                tx_meta=self._unsigned_transaction_serializer(**tx_meta),
-                v=self._dictionary["v"],
-                r=self._dictionary["r"],
-                s=self._dictionary["s"],
-            )
+            return self.signing_payload().to_bytes()
+        # wrap the cached unsigned pieces with v, r, s rather than re-serializing tx_meta
+        return encode_signed_rlp(
+            self.signing_payload(),
+            self._dictionary["v"],
+            self._dictionary["r"],
+            self._dictionary["s"],
+            CIP1559_TRANSACTION_PREFIX,
+        )
+
+    @classmethod
+    def from_bytes(cls, encoded_transaction: bytes) -> Self:
+        """
+        Decodes a signed b'cfx' || 0x02 || TransactionPayload transaction.
+        """
+        if encoded_transaction[:len(CIP1559_TRANSACTION_PREFIX)] != CIP1559_TRANSACTION_PREFIX:
+            raise ValueError("CIP-1559 transaction should start with b'cfx' || 0x02")
+        signed = cls._signed_transaction_serializer.from_bytes(
+            bytes(encoded_transaction[len(CIP1559_TRANSACTION_PREFIX):])
+        )
+        tx_meta = signed.tx_meta  # type: ignore
+        return cls(
+            {
+                **{field: tx_meta[field] for field, _ in cls.unsigned_transaction_fields},
+                "accessList": [
+                    {"address": address, "storageKeys": list(storage_keys)}
+                    for address, storage_keys in tx_meta.accessList
+                ],
+                "v": signed.v,  # type: ignore
+                "r": signed.r,  # type: ignore
+                "s": signed.s,  # type: ignore
+            }
         )
-        return HexBytes(b"cfx") + HexBytes("0x02") + payload
 
     @classmethod
     def ensure_no_fields_missing(cls, dictionary: Dict[str, Any]):
@@ -0,0 +1,150 @@
+"""
+Batch decoding of raw transactions into NumPy struct-of-arrays.
+
+NumPy is an optional dependency, install it with ``pip install cfx-account[columnar]``.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from cfx_account._utils.addresses import eth_eoa_address_bytes_to_cfx
+from cfx_account.backends import SigningBackend, default_backend
+from cfx_account.transactions.views import BytesLike, RawTransactionView
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# column name -> (legacy field, CIP-1559 field)
+_FIXED_WIDTH_COLUMNS = {
+    "nonce": ("nonce", "nonce"),
+    "gas": ("gas", "gas"),
+    "gas_price": ("gasPrice", "maxFeePerGas"),
+    "max_priority_fee_per_gas": ("gasPrice", "maxPriorityFeePerGas"),
+    "storage_limit": ("storageLimit", "storageLimit"),
+    "epoch_height": ("epochHeight", "epochHeight"),
+    "chain_id": ("chainId", "chainId"),
+    "v": ("v", "v"),
+}
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "decode_transactions_columnar requires numpy, install it with `pip install cfx-account[columnar]`"
+        )
+    return numpy
+
+
+class ColumnarTransactions:
+    """
+    Struct-of-arrays representation of a batch of signed transactions, row ``i`` being the ``i``-th input.
+
+    :var transaction_type: ``uint8`` array, 0 for legacy and 2 for CIP-1559 transactions
+    :var nonce, gas, storage_limit, epoch_height, chain_id: ``uint64`` arrays
+    :var gas_price: ``uint64`` array of ``gasPrice`` for legacy rows and ``maxFeePerGas`` for CIP-1559 rows
+    :var max_priority_fee_per_gas: ``uint64`` array of ``maxPriorityFeePerGas``, equal to ``gasPrice`` for legacy rows
+    :var v: ``uint64`` array of signature parities
+    :var value: ``object`` array of python ints, as values usually exceed 64 bits
+    :var to: ``(N, 20)`` ``uint8`` array of receiver hex addresses, zeros if ``has_to`` is False
+    :var has_to: ``bool`` array, False for contract creation
+    :var data: ``uint8`` array with the ``data`` of all rows concatenated
+    :var data_offsets: ``int64`` array of length N + 1, row ``i`` data is ``data[data_offsets[i]:data_offsets[i+1]]``
+    :var sender: ``(N, 20)`` ``uint8`` array of recovered sender hex addresses, or None if not requested
+
+    A fixed-width column falls back to ``object`` dtype if any of its values does not fit in 64 bits.
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        self.transaction_type: "np.ndarray" = columns["transaction_type"]
+        self.nonce: "np.ndarray" = columns["nonce"]
+        self.gas: "np.ndarray" = columns["gas"]
+        self.gas_price: "np.ndarray" = columns["gas_price"]
+        self.max_priority_fee_per_gas: "np.ndarray" = columns["max_priority_fee_per_gas"]
+        self.storage_limit: "np.ndarray" = columns["storage_limit"]
+        self.epoch_height: "np.ndarray" = columns["epoch_height"]
+        self.chain_id: "np.ndarray" = columns["chain_id"]
+        self.v: "np.ndarray" = columns["v"]
+        self.value: "np.ndarray" = columns["value"]
+        self.to: "np.ndarray" = columns["to"]
+        self.has_to: "np.ndarray" = columns["has_to"]
+        self.data: "np.ndarray" = columns["data"]
+        self.data_offsets: "np.ndarray" = columns["data_offsets"]
+        self.sender: Optional["np.ndarray"] = columns.get("sender")
+
+    def __len__(self) -> int:
+        return len(self.nonce)
+
+    def get_data(self, index: int) -> "np.ndarray":
+        """
+        Returns the ``data`` of row ``index`` as a view of :attr:`data`.
+        """
+        return self.data[self.data_offsets[index]:self.data_offsets[index + 1]]
+
+
+def decode_transactions_columnar(
+    raw_transactions: Iterable[BytesLike],
+    recover_sender: bool = False,
+    backend: Optional[SigningBackend] = None,
+) -> ColumnarTransactions:
+    """
+    Decodes many signed raw transactions (legacy or CIP-1559) into a :class:`ColumnarTransactions`.
+    Fields are read through :class:`~cfx_account.transactions.views.RawTransactionView`,
+    so no per-transaction dict or ``HashableRLP`` object is built.
+
+    :param Iterable[BytesLike] raw_transactions: signed raw transactions,
+        e.g. the records of a :class:`~cfx_account.transactions.archive.RawTransactionArchive`
+    :param bool recover_sender: whether to fill the ``sender`` column, which costs one
+        public key recovery per transaction, defaults to False
+    :param Optional[SigningBackend] backend: the backend recovering senders, defaults to the ``eth_keys`` default;
+        :meth:`Account.decode_transactions_columnar` passes the one configured with :meth:`Account.set_signing_backend`
+    :return ColumnarTransactions: the decoded columns
+    """
+    np = _import_numpy()
+
+    fixed_width: Dict[str, List[int]] = {column: [] for column in _FIXED_WIDTH_COLUMNS}
+    transaction_types: List[int] = []
+    values: List[int] = []
+    to = bytearray()
+    has_to: List[bool] = []
+    data = bytearray()
+    data_offsets = [0]
+    sender = bytearray() if recover_sender else None
+    if recover_sender and backend is None:
+        backend = default_backend()
+
+    for raw_transaction in raw_transactions:
+        view = RawTransactionView(raw_transaction)
+        field_index = 1 if view.transaction_type == 2 else 0
+        for column, fields in _FIXED_WIDTH_COLUMNS.items():
+            fixed_width[column].append(view[fields[field_index]])
+        transaction_types.append(view.transaction_type)
+        values.append(view.value)
+        receiver = view.to
+        has_to.append(len(receiver) != 0)
+        to += receiver if len(receiver) else bytes(20)
+        data += view.data
+        data_offsets.append(len(data))
+        if sender is not None and backend is not None:
+            public_key = backend.recover(view.signing_hash(), view.vrs())
+            sender += eth_eoa_address_bytes_to_cfx(public_key.to_canonical_address())
+
+    def uint64_or_object(column: List[int]) -> "np.ndarray":
+        try:
+            return np.array(column, dtype=np.uint64)
+        except OverflowError:
+            return np.array(column, dtype=object)
+
+    columns: Dict[str, Any] = {
+        column: uint64_or_object(column_values) for column, column_values in fixed_width.items()
+    }
+    columns.update(
+        transaction_type=np.array(transaction_types, dtype=np.uint8),
+        value=np.array(values, dtype=object),
+        to=np.frombuffer(to, dtype=np.uint8).reshape(-1, 20),
+        has_to=np.array(has_to, dtype=bool),
+        data=np.frombuffer(data, dtype=np.uint8),
+        data_offsets=np.array(data_offsets, dtype=np.int64),
+    )
+    if sender is not None:
+        columns["sender"] = np.frombuffer(sender, dtype=np.uint8).reshape(-1, 20)
+    return ColumnarTransactions(columns)
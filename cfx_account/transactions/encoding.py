@@ -0,0 +1,265 @@
+"""
+Specialized RLP encoders for the fixed Conflux transaction layouts.
+
+The generic path builds a ``HashableRLP`` object and lets ``rlp`` dispatch on every sedes.
+The layouts of Conflux transactions are fixed, so the encoders here collect the encoded
+pieces of each field and join them once into the output.
+Byte fields are referenced, not copied, until that final join, and :class:`RLPPayload`
+hashes the pieces without joining them at all.
+The output is byte-for-byte identical to the ``HashableRLP`` serializers.
+"""
+from typing import Any, List, Mapping, Sequence, Tuple, Union
+
+from eth_hash.auto import keccak
+from rlp.codec import length_prefix
+from rlp.exceptions import SerializationError
+
+_INT = 0
+_ADDRESS = 1
+_BYTES = 2
+_ACCESS_LIST = 3
+
+# keep the order in sync with LEGACY_UNSIGNED_TRANSACTION_FIELDS
+LEGACY_UNSIGNED_LAYOUT: Tuple[Tuple[str, int], ...] = (
+    ("nonce", _INT),
+    ("gasPrice", _INT),
+    ("gas", _INT),
+    ("to", _ADDRESS),
+    ("value", _INT),
+    ("storageLimit", _INT),
+    ("epochHeight", _INT),
+    ("chainId", _INT),
+    ("data", _BYTES),
+)
+
+# keep the order in sync with CIP1559Transaction.unsigned_transaction_fields
+CIP1559_UNSIGNED_LAYOUT: Tuple[Tuple[str, int], ...] = (
+    ("nonce", _INT),
+    ("maxPriorityFeePerGas", _INT),
+    ("maxFeePerGas", _INT),
+    ("gas", _INT),
+    ("to", _ADDRESS),
+    ("value", _INT),
+    ("storageLimit", _INT),
+    ("epochHeight", _INT),
+    ("chainId", _INT),
+    ("data", _BYTES),
+    ("accessList", _ACCESS_LIST),
+)
+
+Piece = Union[bytes, bytearray, memoryview]
+
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+# pieces at least this long are hashed in place, smaller ones are batched into one update
+_HASH_IN_PLACE_THRESHOLD = 4096
+
+
+def _encode_int(value: Any) -> bytes:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise SerializationError("Can only serialize non-negative integers", value)
+    if value == 0:
+        return b"\x80"
+    if value < 0x80:
+        return bytes((value,))
+    payload = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return length_prefix(len(payload), 0x80) + payload
+
+
+def _append_bytes(pieces: List[Piece], value: Piece) -> int:
+    length = len(value)
+    if length == 1 and value[0] < 0x80:
+        pieces.append(value)
+        return 1
+    header = length_prefix(length, 0x80)
+    pieces.append(header)
+    pieces.append(value)
+    return len(header) + length
+
+
+def _append_address(pieces: List[Piece], value: Any, allow_empty: bool) -> int:
+    if not isinstance(value, _BYTES_TYPES):
+        raise SerializationError("Address must be bytes", value)
+    if len(value) != 20 and not (allow_empty and len(value) == 0):
+        raise SerializationError(f"Address must be 20 bytes long, got {len(value)}", value)
+    return _append_bytes(pieces, value)
+
+
+def _storage_key_bytes(key: Any) -> Piece:
+    if isinstance(key, _BYTES_TYPES):
+        if len(key) != 32:
+            raise SerializationError(f"Storage key must be 32 bytes long, got {len(key)}", key)
+        return key
+    if isinstance(key, bool) or not isinstance(key, int) or key < 0:
+        raise SerializationError("Storage key must be a non-negative integer or 32 bytes", key)
+    try:
+        return key.to_bytes(32, "big")
+    except OverflowError:
+        raise SerializationError("Storage key is too large to fit in 32 bytes", key)
+
+
+def _append_list(pieces: List[Piece], item_pieces: List[Piece], item_length: int) -> int:
+    header = length_prefix(item_length, 0xC0)
+    pieces.append(header)
+    pieces.extend(item_pieces)
+    return len(header) + item_length
+
+
+def _append_access_list(pieces: List[Piece], access_list: Any) -> int:
+    entries_pieces: List[Piece] = []
+    entries_length = 0
+    for entry in access_list:
+        if isinstance(entry, Mapping):
+            address, storage_keys = entry["address"], entry["storageKeys"]  # type: ignore
+        else:
+            address, storage_keys = entry
+        keys_pieces: List[Piece] = []
+        for key in storage_keys:
+            keys_pieces.append(b"\xa0")
+            keys_pieces.append(_storage_key_bytes(key))
+        entry_pieces: List[Piece] = []
+        entry_length = _append_address(entry_pieces, address, allow_empty=False)
+        entry_length += _append_list(entry_pieces, keys_pieces, 33 * len(storage_keys))
+        entries_length += _append_list(entries_pieces, entry_pieces, entry_length)
+    return _append_list(pieces, entries_pieces, entries_length)
+
+
+def append_field(pieces: List[Piece], field: str, kind: int, value: Any) -> int:
+    """
+    Appends the encoding of one formatted field value to ``pieces``, ``kind`` being the field's layout kind.
+
+    :raises SerializationError: a bytes field has a value of another type
+    :return int: the number of bytes appended
+    """
+    if kind == _INT:
+        encoded = _encode_int(value)
+        pieces.append(encoded)
+        return len(encoded)
+    if kind == _BYTES:
+        if not isinstance(value, _BYTES_TYPES):
+            raise SerializationError(f"{field} must be bytes", value)
+        return _append_bytes(pieces, value)
+    if kind == _ADDRESS:
+        return _append_address(pieces, value, allow_empty=True)
+    return _append_access_list(pieces, value)
+
+
+def _append_fields(
+    pieces: List[Piece], layout: Sequence[Tuple[str, int]], transaction: Mapping[str, Any]
+) -> int:
+    length = 0
+    for field, kind in layout:
+        length += append_field(pieces, field, kind, transaction[field])
+    return length
+
+
+def _write(prefix: bytes, pieces: List[Piece], payload_length: int) -> bytes:
+    return b"".join((prefix, length_prefix(payload_length, 0xC0), *pieces))
+
+
+class RLPPayload:
+    """
+    An encoded RLP list, optionally prefixed, kept as the pieces of its encoding.
+    Large byte fields stay references to the caller's buffers until :meth:`to_bytes`
+    or :func:`encode_signed_rlp` copies them into the output.
+    """
+
+    __slots__ = ("prefix", "header", "pieces", "rlp_length")
+
+    def __init__(self, pieces: List[Piece], payload_length: int, prefix: bytes = b""):
+        self.prefix = prefix
+        self.header = length_prefix(payload_length, 0xC0)
+        self.pieces = pieces
+        # length of the RLP list, prefix excluded
+        self.rlp_length = len(self.header) + payload_length
+
+    def __len__(self) -> int:
+        return len(self.prefix) + self.rlp_length
+
+    def keccak(self) -> bytes:
+        """
+        keccak256 of ``prefix || rlp``, computed without joining the pieces.
+        """
+        hasher = keccak.new(self.prefix)
+        small = bytearray(self.header)
+        for piece in self.pieces:
+            if len(piece) < _HASH_IN_PLACE_THRESHOLD:
+                small += piece
+            else:
+                hasher.update(small)  # type: ignore
+                small.clear()
+                hasher.update(piece)  # type: ignore
+        hasher.update(small)  # type: ignore
+        return hasher.digest()
+
+    def to_bytes(self) -> bytes:
+        return b"".join((self.prefix, self.header, *self.pieces))
+
+
+def _unsigned_payload(
+    layout: Sequence[Tuple[str, int]], transaction: Mapping[str, Any], prefix: bytes
+) -> RLPPayload:
+    pieces: List[Piece] = []
+    payload_length = _append_fields(pieces, layout, transaction)
+    return RLPPayload(pieces, payload_length, prefix)
+
+
+def legacy_unsigned_payload(transaction: Mapping[str, Any]) -> RLPPayload:
+    """
+    Same as :func:`encode_legacy_unsigned_rlp`, but returns the unjoined :class:`RLPPayload`.
+    """
+    return _unsigned_payload(LEGACY_UNSIGNED_LAYOUT, transaction, b"")
+
+
+def cip1559_unsigned_payload(transaction: Mapping[str, Any], prefix: bytes = b"") -> RLPPayload:
+    """
+    Same as :func:`encode_cip1559_unsigned_rlp`, but returns the unjoined :class:`RLPPayload`.
+    """
+    return _unsigned_payload(CIP1559_UNSIGNED_LAYOUT, transaction, prefix)
+
+
+def encode_legacy_unsigned_rlp(transaction: Mapping[str, Any], prefix: bytes = b"") -> bytes:
+    """
+    Returns ``prefix || rlp([nonce, gasPrice, gas, to, value, storageLimit, epochHeight, chainId, data])``,
+    the payload hashed when signing a legacy transaction.
+
+    :param Mapping[str, Any] transaction: RLP-ready fields, i.e. ints and bytes-like objects.
+        Anything supporting ``transaction[field]`` works, including the ``HashableRLP`` impls
+    :param bytes prefix: bytes joined before the RLP list into the same output, defaults to b""
+    :raises rlp.exceptions.SerializationError: a field has an invalid type or value
+    """
+    return _unsigned_payload(LEGACY_UNSIGNED_LAYOUT, transaction, prefix).to_bytes()
+
+
+def encode_cip1559_unsigned_rlp(transaction: Mapping[str, Any], prefix: bytes = b"") -> bytes:
+    """
+    Returns ``prefix || rlp([nonce, maxPriorityFeePerGas, maxFeePerGas, gas, to, value,
+    storageLimit, epochHeight, chainId, data, accessList])``.
+    Pass ``b'cfx' || 0x02`` as prefix to get the payload hashed when signing.
+
+    :param Mapping[str, Any] transaction: RLP-ready fields, i.e. ints and bytes-like objects.
+        Access list entries can be ``{"address", "storageKeys"}`` dicts or ``(address, storage_keys)`` pairs
+    :param bytes prefix: bytes joined before the RLP list into the same output, defaults to b""
+    :raises rlp.exceptions.SerializationError: a field has an invalid type or value
+    """
+    return _unsigned_payload(CIP1559_UNSIGNED_LAYOUT, transaction, prefix).to_bytes()
+
+
+def encode_signed_rlp(
+    unsigned_rlp: Union[Piece, RLPPayload], v: int, r: int, s: int, prefix: bytes = b""
+) -> bytes:
+    """
+    Returns ``prefix || rlp([unsigned, v, r, s])`` where ``unsigned_rlp`` is an already encoded list.
+    ``prefix`` is empty for legacy transactions and ``b'cfx' || 0x02`` for CIP-1559 transactions.
+    If ``unsigned_rlp`` is an :class:`RLPPayload`, its own prefix is ignored
+    and its pieces are copied straight into the output.
+    """
+    signature_pieces = [_encode_int(v), _encode_int(r), _encode_int(s)]
+    if isinstance(unsigned_rlp, RLPPayload):
+        pieces: List[Piece] = [unsigned_rlp.header, *unsigned_rlp.pieces, *signature_pieces]
+        payload_length = unsigned_rlp.rlp_length
+    else:
+        pieces = [unsigned_rlp, *signature_pieces]
+        payload_length = len(unsigned_rlp)
+    payload_length += sum(len(piece) for piece in signature_pieces)
+    return _write(prefix, pieces, payload_length)
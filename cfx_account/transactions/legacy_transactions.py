@@ -1,4 +1,4 @@
-from typing import Any, Callable, ClassVar, Dict, Tuple, cast, Union
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, cast, Union
 
 import rlp
 from cfx_utils.types import TxParam
@@ -13,6 +13,11 @@ from eth_utils.curried import apply_formatters_to_dict
 from hexbytes import HexBytes
 from rlp.sedes import Binary, big_endian_int, binary
 
+from cfx_account.transactions.encoding import (
+    RLPPayload,
+    encode_signed_rlp,
+    legacy_unsigned_payload,
+)
 from cfx_account.transactions.transaction_utils import (
     LEGACY_TRANSACTION_FORMATTERS,
     is_empty_or_valid_base32_address,
@@ -48,12 +53,18 @@ class LegacyTransactionImpl(HashableRLP):
 
 class LegacyTransaction(TransactionImplementation):
 
+    __slots__ = ("ImplType", "impl", "_unsigned_payload")
+
     # ImplType: Type[HashableRLP]
     impl: Union[LegacyTransactionImpl, UnsignedLegacyTransactionImpl]
 
     transaction_type: ClassVar[int] = 0
 
+    # rlp([nonce, ..., data]) of the unsigned fields, computed on first use
+    _unsigned_payload: Optional[RLPPayload]
+
     def __init__(self, tx_dict: TxParam):
+        self._unsigned_payload = None
         if "type" in tx_dict:
             tx_dict.pop("type")  # type: ignore
 
@@ -74,10 +85,16 @@ class LegacyTransaction(TransactionImplementation):
             self.impl = serializable_unsigned_transaction_from_dict(tx_dict)
 
     def hash(self) -> bytes:
-        if self.ImplType is UnsignedLegacyTransactionImpl:
-            return self.impl.hash()
-        else:
-            return self.impl[0].hash() # type: ignore
+        return self.signing_payload().keccak()
+
+    def signing_payload(self) -> RLPPayload:
+        if self._unsigned_payload is None:
+            if self.ImplType is UnsignedLegacyTransactionImpl:
+                unsigned_impl = self.impl
+            else:
+                unsigned_impl = self.impl[0]  # type: ignore
+            self._unsigned_payload = legacy_unsigned_payload(unsigned_impl)  # type: ignore
+        return self._unsigned_payload
 
     def from_dict(self, tx_dict: TxParam) -> "LegacyTransaction":
         return LegacyTransaction(tx_dict)
@@ -88,7 +105,7 @@ class LegacyTransaction(TransactionImplementation):
         else:
             vrs = self.vrs()
             return {
-                **self.impl.as_dict()[0].as_dict(),  # type: ignore
+                **self.impl[0].as_dict(),  # type: ignore
                 "v": vrs[0],
                 "r": vrs[1],
                 "s": vrs[2],
@@ -106,10 +123,12 @@ class LegacyTransaction(TransactionImplementation):
         return self.ImplType is LegacyTransactionImpl
 
     def encode(self, *, allow_unsigned: bool = False) -> bytes:
-        if (not self.is_signed()) and (not allow_unsigned):
+        if not self.is_signed():
+            if not allow_unsigned:
                 raise ValueError("Transaction is not signed")
-       
-        return rlp.encode(self.impl)
+            return self.signing_payload().to_bytes()
+        (v, r, s) = self.vrs()
+        return encode_signed_rlp(self.signing_payload(), v, r, s)
 
     def vrs(self) -> Tuple[int, int, int]:
         if self.ImplType is LegacyTransactionImpl:
@@ -166,7 +185,7 @@ TRANSACTION_VALID_VALUES: Dict[str, Callable[[Any], bool]] = {
     "storageLimit": is_int_or_prefixed_hexstr,
     "epochHeight": is_int_or_prefixed_hexstr,
     "chainId": is_int_or_prefixed_hexstr,
-    "data": lambda val: isinstance(val, (int, str, bytes, bytearray)),  # type: ignore
+    "data": lambda val: isinstance(val, (int, str, bytes, bytearray, memoryview)),  # type: ignore
 }
 
 ALLOWED_TRANSACTION_KEYS = {
@@ -0,0 +1,81 @@
+"""
+Two-phase signing: transactions are formatted, encoded and hashed in one place,
+and the digests are signed somewhere else, e.g. in a separate key-holding process.
+
+>>> prepared = Account.prepare_digests(transactions)
+>>> vrs_list = key_holder.sign_digests([item.digest for item in prepared])
+>>> signed = Account.attach_signatures(prepared, vrs_list)
+"""
+from typing import NamedTuple, Optional
+
+from collections.abc import Mapping
+from cfx_address import eth_eoa_address_to_cfx_hex
+from cfx_address.utils import normalize_to
+from cfx_utils.types import ChecksumAddress, TxParam
+from cytoolz import dissoc  # type: ignore
+from eth_hash.auto import keccak
+from eth_utils.address import to_checksum_address
+
+from cfx_account._utils.units import drip_units_to_int
+from cfx_account.backends import SigningBackend, default_backend
+from cfx_account.transactions.cip1559_transactions import CIP1559_TRANSACTION_PREFIX
+from cfx_account.transactions.encoding import encode_signed_rlp
+from cfx_account.transactions.transactions import Transaction
+
+
+class PreparedTransaction(NamedTuple):
+    """
+    A transaction ready to be signed. Only made of plain values, so it can be pickled or serialized.
+    """
+
+    transaction_type: int
+    # the prefixed unsigned encoding, digest is its keccak
+    unsigned_payload: bytes
+    # the 32-byte hash to sign
+    digest: bytes
+    # hex address of the transaction's from field, None if it has none
+    sender: Optional[ChecksumAddress] = None
+
+
+def prepare_transaction(transaction_dict: TxParam) -> PreparedTransaction:
+    """
+    Formats and encodes a transaction as :meth:`Account.sign_transaction` would and computes its digest.
+
+    :raises TypeError: transaction_dict is not a dict-like object
+    """
+    if not isinstance(transaction_dict, Mapping):
+        raise TypeError("transaction_dict must be dict-like, got %r" % transaction_dict)
+    sender = None
+    if "from" in transaction_dict:
+        sender = normalize_to(transaction_dict["from"], None)
+        transaction_dict = dissoc(transaction_dict, "from")  # type: ignore
+    transaction = Transaction.from_dict(drip_units_to_int(transaction_dict))
+    unsigned_payload = transaction.signing_payload().to_bytes()
+    return PreparedTransaction(
+        transaction.transaction_type, unsigned_payload, keccak(unsigned_payload), sender  # type: ignore
+    )
+
+
+def attach_signature(
+    prepared: PreparedTransaction, v: int, r: int, s: int, backend: Optional[SigningBackend] = None
+) -> bytes:
+    """
+    Returns the signed raw transaction.
+
+    :param Optional[SigningBackend] backend: the backend recovering the signer of a transaction with a from field,
+        defaults to the ``eth_keys`` default, :meth:`Account.attach_signatures` passes the configured one
+    :raises ValueError: v is not 0 or 1, or the signature does not recover to the transaction's from field
+    """
+    if v not in (0, 1):
+        raise ValueError(f"v should be the recovery id 0 or 1, got {v}")
+    if prepared.sender is not None:
+        signer = (backend or default_backend()).recover(prepared.digest, (v, r, s))
+        signer_address = to_checksum_address(eth_eoa_address_to_cfx_hex(signer.to_checksum_address()))
+        if signer_address != prepared.sender:
+            raise ValueError(
+                "transaction[from] does not match the signer's hex address: "
+                f"from's hex address is {prepared.sender}, signer's hex address is {signer_address}"
+            )
+    prefix = CIP1559_TRANSACTION_PREFIX if prepared.transaction_type == 2 else b""
+    unsigned_rlp = memoryview(prepared.unsigned_payload)[len(prefix):]
+    return encode_signed_rlp(unsigned_rlp, v, r, s, prefix)
@@ -1,4 +1,6 @@
-from typing import Any, Dict
+import binascii
+from functools import partial
+from typing import Any, Dict, Iterable, List, Mapping, Union
 
 from cfx_address import Base32Address
 from cfx_utils.types import TxDict, TxParam
@@ -6,7 +8,6 @@ from eth_account._utils.validation import VALID_EMPTY_ADDRESSES, is_none
 from eth_utils.conversions import to_bytes, to_int
 from eth_utils.curried import (
     apply_formatter_to_array,
-    apply_formatters_to_dict,
     apply_one_of_formatters,
     hexstr_if_str,
 )
@@ -24,6 +25,31 @@ def is_empty_or_valid_base32_address(val: Any) -> bool:
         return Base32Address.is_valid_base32(val)
 
 
+# hex strings longer than this are decoded chunk by chunk
+_HEX_DECODE_CHUNK = 1 << 20
+
+
+def format_data(data: Any) -> Union[bytes, bytearray, memoryview]:
+    """
+    Formats the ``data`` field without copying bytes-like values.
+    ``0x`` prefixed hex strings are decoded in chunks into one buffer,
+    so large payloads are never held as an intermediate hex slice.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    if isinstance(data, memoryview):
+        return data if data.format == "B" and data.ndim == 1 else data.cast("B")
+    if isinstance(data, str) and data[:2] in ("0x", "0X") and len(data) % 2 == 0:
+        if len(data) <= _HEX_DECODE_CHUNK:
+            return binascii.unhexlify(data[2:])
+        decoded = bytearray((len(data) - 2) // 2)
+        for start in range(0, len(decoded), _HEX_DECODE_CHUNK // 2):
+            end = min(start + _HEX_DECODE_CHUNK // 2, len(decoded))
+            decoded[start:end] = binascii.unhexlify(data[2 + 2 * start:2 + 2 * end])
+        return decoded
+    return hexstr_if_str(to_bytes, data)
+
+
 LEGACY_TRANSACTION_FORMATTERS = {
     "nonce": hexstr_if_str(to_int),
     "gasPrice": hexstr_if_str(to_int),
@@ -40,31 +66,90 @@ LEGACY_TRANSACTION_FORMATTERS = {
     "storageLimit": hexstr_if_str(to_int),
     "epochHeight": hexstr_if_str(to_int),
     "chainId": hexstr_if_str(to_int),
-    "data": hexstr_if_str(to_bytes),
+    "data": format_data,
     "v": hexstr_if_str(to_int),
     "r": hexstr_if_str(to_int),
     "s": hexstr_if_str(to_int),
 }
 
+def _access_list_address(address: Any) -> bytes:
+    if isinstance(address, (bytes, bytearray)):
+        return address  # type: ignore
+    if isinstance(address, Base32Address):
+        return bytes.fromhex(address.hex_address[2:])
+    if isinstance(address, str):
+        if len(address) == 42 and address[:2] in ("0x", "0X"):
+            return bytes.fromhex(address[2:])
+        if Base32Address.is_valid_base32(address):
+            return bytes.fromhex(Base32Address(address).hex_address[2:])
+    return hexstr_if_str(to_bytes, address)
+
+
+def _storage_key(key: Any) -> Union[int, bytes]:
+    # 32-byte keys are kept as they are, the encoder writes them without an int round trip
+    if isinstance(key, str) and len(key) == 66 and key[:2] in ("0x", "0X"):
+        return bytes.fromhex(key[2:])
+    if isinstance(key, (bytes, bytearray)) and len(key) == 32:
+        return key  # type: ignore
+    return hexstr_if_str(to_int, key)  # type: ignore
+
+
+def normalize_access_list(access_list: Iterable[Any], deduplicate: bool = True) -> List[Dict[str, Any]]:
+    """
+    Converts an access list into the form accepted by the RLP encoder in a single pass:
+    addresses become 20 bytes, storage keys stay 32 bytes (or ints).
+    Hex and Base32 addresses and hex storage keys are accepted.
+
+    Deduplication is meant for callers building an access list before signing:
+    transactions are formatted with ``deduplicate=False``, as the signed access list is the one given.
+
+    :param Iterable[Any] access_list: ``{"address", "storageKeys"}`` dicts or ``(address, storage_keys)`` pairs
+    :param bool deduplicate: merge entries of the same address and drop repeated storage keys,
+        keeping the first occurrence, defaults to True
+    :return List[Dict[str, Any]]: ``[{"address": bytes, "storageKeys": [...]}, ...]``
+
+    >>> access_list = normalize_access_list([
+    ...     {"address": "0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441", "storageKeys": [1, 1]},
+    ...     ("0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441", ["0x" + "00" * 31 + "01", 2]),
+    ... ])
+    >>> access_list[0]["storageKeys"]
+    [1, 2]
+    """
+    normalized: List[Dict[str, Any]] = []
+    # address -> (storage keys, seen storage keys) of the merged entry
+    merged: Dict[bytes, Any] = {}
+    for entry in access_list:
+        if isinstance(entry, Mapping):
+            address, storage_keys = entry["address"], entry["storageKeys"]
+        else:
+            address, storage_keys = entry
+        address = _access_list_address(address)
+        if not deduplicate:
+            normalized.append({"address": address, "storageKeys": [_storage_key(key) for key in storage_keys]})
+            continue
+        address = bytes(address)
+        if address not in merged:
+            merged[address] = ([], set())
+            normalized.append({"address": address, "storageKeys": merged[address][0]})
+        keys, seen = merged[address]
+        for key in storage_keys:
+            key = _storage_key(key)
+            if isinstance(key, int):
+                identity_key = key.to_bytes(32, "big") if 0 <= key < 2 ** 256 else key
+            else:
+                identity_key = bytes(key)
+            if identity_key not in seen:
+                seen.add(identity_key)
+                keys.append(key)
+    return normalized
+
+
 TYPED_TRANSACTION_FORMATTERS = merge(
     LEGACY_TRANSACTION_FORMATTERS,
     {
         "chainId": hexstr_if_str(to_int),
         "type": hexstr_if_str(to_int),
-        "accessList": apply_formatter_to_array(
-            apply_formatters_to_dict(
-                {
-                    "address": apply_one_of_formatters(
-                        (
-                            (Base32Address.is_valid_base32, lambda val: HexBytes(Base32Address(val).hex_address)),  # type: ignore
-                            (is_string, hexstr_if_str(to_bytes)),
-                            (is_bytes, identity),
-                        )
-                    ),
-                    "storageKeys": apply_formatter_to_array(hexstr_if_str(to_int)),
-                }
-            ),
-        ),
+        "accessList": partial(normalize_access_list, deduplicate=False),
         "maxPriorityFeePerGas": hexstr_if_str(to_int),
         "maxFeePerGas": hexstr_if_str(to_int),
         "maxFeePerBlobGas": hexstr_if_str(to_int),
@@ -81,21 +166,24 @@ access_list_sede_type = CountableList(
 )
 
 
+# the type of a transaction dict without a 'type' field
+def infer_transaction_type(transaction_dict: Mapping[str, Any]) -> int:
+    if "gasPrice" in transaction_dict:
+        if "accessList" in transaction_dict:
+            # access list txn - type 1
+            return 1
+        return 0
+    # elif any(
+    #     type_2_arg in transaction_dict
+    #     for type_2_arg in ("maxFeePerGas", "maxPriorityFeePerGas")
+    # ):
+    return 2
+
+
 # returns a copy of the transaction dict with the 'type' field converted to int
 def copy_ensuring_int_transaction_type(transaction_dict: TxParam) -> Dict[str, Any]:
     if "type" not in transaction_dict:
-        if "gasPrice" in transaction_dict:
-            if "accessList" in transaction_dict:
-                # access list txn - type 1
-                return assoc(transaction_dict, "type", 1)
-            else:
-                return assoc(transaction_dict, "type", 0)
-        # elif any(
-        #     type_2_arg in transaction_dict
-        #     for type_2_arg in ("maxFeePerGas", "maxPriorityFeePerGas")
-        # ):
-        else:
-            return assoc(transaction_dict, "type", 2)
+        return assoc(transaction_dict, "type", infer_transaction_type(transaction_dict))
     cpy = transaction_dict.copy()
     if isinstance(cpy["type"], str):
         cpy["type"] = int(cpy["type"], 16)
@@ -1,10 +1,10 @@
-from typing import Type
+from typing import Type, Union
 
 from cfx_utils.types import TxParam
 from hexbytes import HexBytes
 
 from .base import TransactionImplementation
-from .cip1559_transactions import CIP1559Transaction
+from .cip1559_transactions import CIP1559_TRANSACTION_PREFIX, CIP1559Transaction
 from .legacy_transactions import LegacyTransaction
 from .transaction_utils import copy_ensuring_int_transaction_type
 
@@ -67,39 +67,18 @@ class Transaction:
         return transaction(dict_copy)
 
     @classmethod
-    def from_bytes(cls, encoded_transaction: HexBytes) -> "TransactionImplementation":
-        """Builds a TypedTransaction from a signed encoded transaction."""
-
-        if not isinstance(encoded_transaction, HexBytes):
-            raise TypeError(f"expected Hexbytes, got {type(encoded_transaction)}")
-        return LegacyTransaction.from_bytes(encoded_transaction)
-
-        # if not (len(encoded_transaction) > 0 and encoded_transaction[0] <= 0x7F):
-        #     raise ValueError("unexpected input")
-
-        # transaction: Union[
-        #     "DynamicFeeTransaction", "AccessListTransaction", "BlobTransaction"
-        # ]
-
-        # if encoded_transaction[0] == AccessListTransaction.transaction_type:
-        #     transaction_type = AccessListTransaction.transaction_type
-        #     transaction = AccessListTransaction.from_bytes(encoded_transaction)
-        # elif encoded_transaction[0] == DynamicFeeTransaction.transaction_type:
-        #     transaction_type = DynamicFeeTransaction.transaction_type
-        #     transaction = DynamicFeeTransaction.from_bytes(encoded_transaction)
-        # elif encoded_transaction[0] == BlobTransaction.transaction_type:
-        #     transaction_type = BlobTransaction.transaction_type
-        #     transaction = BlobTransaction.from_bytes(encoded_transaction)
-        # else:
-        #     # The only known transaction types should be explicit if/elif branches.
-        #     raise TypeError(
-        #         f"typed transaction has unknown type: {encoded_transaction[0]}"
-        #     )
-        # return cls(
-        #     transaction_type=transaction_type,
-        #     transaction=transaction,
-        # )
-        raise NotImplementedError
+    def from_bytes(cls, encoded_transaction: Union[bytes, bytearray]) -> "TransactionImplementation":
+        """
+        Builds a TypedTransaction from a signed encoded transaction.
+        CIP-1559 transactions are recognized by the b'cfx' || 0x02 prefix,
+        anything else is decoded as a legacy transaction.
+        """
+
+        if not isinstance(encoded_transaction, (bytes, bytearray)):
+            raise TypeError(f"expected bytes or bytearray, got {type(encoded_transaction)}")
+        if encoded_transaction[:len(CIP1559_TRANSACTION_PREFIX)] == CIP1559_TRANSACTION_PREFIX:
+            return CIP1559Transaction.from_bytes(bytes(encoded_transaction))
+        return LegacyTransaction.from_bytes(HexBytes(encoded_transaction))
 
     # def hash(self) -> bytes:
     #     """
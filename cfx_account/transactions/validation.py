@@ -0,0 +1,243 @@
+"""
+Validation of transaction batches without encoding, hashing or signing.
+
+The checks are the ones the signing path applies one transaction at a time
+(``assert_valid_fields`` for legacy transactions,
+``CIP1559Transaction.ensure_no_fields_missing``/``ensure_no_fields_extra`` and the field formatters
+for CIP-1559 transactions), but every problem of every row is reported.
+
+>>> report = validate_transactions(rows)
+>>> report.is_valid
+False
+>>> report.errors[0]
+TransactionValidationError(index=3, field='to', message='invalid value: ...')
+"""
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+from cfx_address import Base32Address
+from eth_account._utils.validation import is_int_or_prefixed_hexstr
+
+from cfx_account._utils.units import DRIP_UNIT_FIELDS, to_int_if_drip_units
+from cfx_account.transactions.cip1559_transactions import CIP1559Transaction
+from cfx_account.transactions.legacy_transactions import (
+    ALLOWED_TRANSACTION_KEYS,
+    REQUIRED_TRANSACITON_KEYS,
+    TRANSACTION_VALID_VALUES,
+)
+from cfx_account.transactions.transaction_utils import infer_transaction_type
+
+
+class TransactionValidationError(NamedTuple):
+    index: int  # type: ignore
+    # None if the error concerns the whole row
+    field: Optional[str]
+    message: str
+
+
+class ValidationReport:
+    """
+    Result of :func:`validate_transactions`.
+    """
+
+    def __init__(self, total: int, errors: List[TransactionValidationError]):
+        self.total = total
+        self.errors = errors
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_indices(self) -> List[int]:
+        """
+        Sorted indices of the rows with at least one error.
+        """
+        return sorted({error.index for error in self.errors})
+
+    def errors_by_row(self) -> Dict[int, List[TransactionValidationError]]:
+        rows: Dict[int, List[TransactionValidationError]] = {}
+        for error in self.errors:
+            rows.setdefault(error.index, []).append(error)
+        return rows
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        """
+        The errors as JSON-serializable dicts.
+        """
+        return [error._asdict() for error in self.errors]
+
+    def __repr__(self) -> str:
+        return f"<ValidationReport rows={self.total} invalid_rows={len(self.invalid_indices)} errors={len(self.errors)}>"
+
+
+# fields converted by sign_transaction_dict before formatting
+_DRIP_FIELDS = frozenset(DRIP_UNIT_FIELDS)
+
+_CIP1559_FIELDS = frozenset(
+    field
+    for field, _ in CIP1559Transaction.unsigned_transaction_fields + CIP1559Transaction.signature_fields
+)
+_CIP1559_REQUIRED = frozenset(
+    field
+    for field, _ in CIP1559Transaction.unsigned_transaction_fields
+    if field not in CIP1559Transaction.transaction_field_defaults
+)
+
+
+def _is_valid_hex_or_base32_address(value: Any) -> bool:
+    # what the CIP-1559 "to" formatter and the encoder accept
+    if value is None or value in (b"", ""):
+        return True
+    if isinstance(value, (bytes, bytearray)):
+        return len(value) == 20
+    if isinstance(value, str):
+        if len(value) == 42 and value[:2] in ("0x", "0X"):
+            try:
+                bytes.fromhex(value[2:])
+                return True
+            except ValueError:
+                return False
+        return Base32Address.is_valid_base32(value)
+    return False
+
+
+def _is_valid_access_list(value: Any) -> bool:
+    if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return False
+    for entry in value:
+        if isinstance(entry, Mapping):
+            if "address" not in entry or "storageKeys" not in entry:
+                return False
+            address, storage_keys = entry["address"], entry["storageKeys"]
+        elif isinstance(entry, (tuple, list)) and len(entry) == 2:
+            address, storage_keys = entry
+        else:
+            return False
+        if address in (None, b"", "") or not _is_valid_hex_or_base32_address(address):
+            return False
+        if isinstance(storage_keys, (str, bytes)):
+            return False
+        for key in storage_keys:
+            if isinstance(key, (bytes, bytearray)):
+                if len(key) != 32:
+                    return False
+            elif not is_int_or_prefixed_hexstr(key):
+                return False
+    return True
+
+
+_CIP1559_VALID_VALUES: Dict[str, Callable[[Any], bool]] = {
+    **{field: is_int_or_prefixed_hexstr for field, _ in CIP1559Transaction.unsigned_transaction_fields},
+    **{field: is_int_or_prefixed_hexstr for field, _ in CIP1559Transaction.signature_fields},
+    "to": _is_valid_hex_or_base32_address,
+    "data": TRANSACTION_VALID_VALUES["data"],
+    "accessList": _is_valid_access_list,
+}
+
+_MISSING = object()
+
+# values of exactly these types are validated once per batch,
+# bools and token units are not as True == 1 and Drip(1) == 1
+_CACHED_TYPES = (int, str, bytes)
+
+
+def _transaction_type(transaction: Mapping[str, Any]) -> Any:
+    # same rules as copy_ensuring_int_transaction_type
+    if "type" not in transaction:
+        return infer_transaction_type(transaction)
+    transaction_type = transaction["type"]
+    if isinstance(transaction_type, str):
+        try:
+            return int(transaction_type, 16)
+        except ValueError:
+            return transaction_type
+    return transaction_type
+
+
+def _key_errors(transaction_type: int, keys: FrozenSet[str]) -> List[Tuple[Optional[str], str]]:
+    errors: List[Tuple[Optional[str], str]] = []
+    if transaction_type == 0:
+        allowed, required = ALLOWED_TRANSACTION_KEYS, REQUIRED_TRANSACITON_KEYS
+    else:
+        allowed, required = _CIP1559_FIELDS, _CIP1559_REQUIRED
+        signature_fields = keys & {"v", "r", "s"}
+        if signature_fields and len(signature_fields) != 3:
+            for field in sorted({"v", "r", "s"} - signature_fields):
+                errors.append((field, "missing field"))
+    for field in sorted(required - keys):
+        errors.append((field, "missing field"))
+    for field in sorted(keys - allowed):
+        errors.append((field, "unrecognized field"))
+    return errors
+
+
+def validate_transactions(batch: Iterable[Any]) -> ValidationReport:
+    """
+    Checks every transaction of ``batch`` as :meth:`Account.sign_transaction` would,
+    without encoding, hashing or signing, and collects all errors instead of stopping at the first one.
+
+    Rows sharing the same set of keys are checked for missing or unrecognized fields once,
+    and values repeated across rows (e.g. the same receiver) are validated once.
+
+    ``from`` fields are only checked to be addresses: matching them against the key requires signing.
+
+    :param Iterable[Any] batch: transaction dicts
+    :return ValidationReport: the errors with the row index and field of each
+    """
+    errors: List[TransactionValidationError] = []
+    key_errors_cache: Dict[Tuple[int, FrozenSet[str]], List[Tuple[Optional[str], str]]] = {}
+    # (transaction type, field, value) -> error message or None
+    value_cache: Dict[Tuple[int, str, Hashable], Any] = {}
+    total = 0
+    for index, transaction in enumerate(batch):
+        total += 1
+        if not isinstance(transaction, Mapping):
+            errors.append(TransactionValidationError(index, None, f"transaction must be dict-like, got {type(transaction).__name__}"))
+            continue
+        transaction_type = _transaction_type(transaction)
+        if transaction_type not in (0, 2):
+            errors.append(TransactionValidationError(index, "type", f"unknown transaction type: {transaction_type!r}"))
+            continue
+
+        keys = frozenset(transaction.keys()) - {"type", "from"}
+        cache_key = (transaction_type, keys)
+        if cache_key not in key_errors_cache:
+            key_errors_cache[cache_key] = _key_errors(transaction_type, keys)
+        for field, message in key_errors_cache[cache_key]:
+            errors.append(TransactionValidationError(index, field, message))
+
+        validators = TRANSACTION_VALID_VALUES if transaction_type == 0 else _CIP1559_VALID_VALUES
+        for field, value in transaction.items():
+            if field == "from":
+                validator: Optional[Callable[[Any], bool]] = _is_valid_hex_or_base32_address
+            else:
+                validator = validators.get(field)
+            if validator is None:
+                continue
+            if type(value) in _CACHED_TYPES:
+                value_key = (transaction_type, field, value)
+                message = value_cache.get(value_key, _MISSING)
+                if message is _MISSING:
+                    message = value_cache[value_key] = _check_value(field, value, validator)
+            else:
+                # token units compare slowly and access lists are unhashable, check them every time
+                message = _check_value(field, value, validator)
+            if message is not None:
+                errors.append(TransactionValidationError(index, field, message))
+    return ValidationReport(total, errors)
+
+
+def _check_value(field: str, value: Any, validator: Callable[[Any], bool]) -> Optional[str]:
+    # returns an error message, None if value is valid
+    if field in _DRIP_FIELDS:
+        try:
+            value = to_int_if_drip_units(value)
+        except Exception as e:
+            return f"invalid token unit: {e}"
+    try:
+        if validator(value):
+            return None
+    except Exception:
+        pass
+    return f"invalid value: {value!r}"
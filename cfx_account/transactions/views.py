@@ -0,0 +1,256 @@
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import rlp
+from eth_utils import keccak
+from rlp.exceptions import DecodingError
+
+from cfx_account.transactions.cip1559_transactions import CIP1559_TRANSACTION_PREFIX
+from cfx_account.transactions.encoding import (
+    CIP1559_UNSIGNED_LAYOUT,
+    LEGACY_UNSIGNED_LAYOUT,
+    RLPPayload,
+    append_field,
+)
+from cfx_account.transactions.transaction_utils import access_list_sede_type
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_ADDRESS_FIELDS = {"to"}
+_BYTES_FIELDS = {"data"}
+_SIGNATURE_FIELDS = ("v", "r", "s")
+
+
+def consume_item(buffer: memoryview, start: int) -> Tuple[bool, int, int]:
+    """
+    Reads the RLP header at ``start``.
+
+    :return Tuple[bool, int, int]: (is_list, payload_start, item_end)
+    :raises rlp.exceptions.DecodingError: the header is malformed or the item exceeds the buffer
+    """
+    if start >= len(buffer):
+        raise DecodingError("RLP item starts beyond the end of the buffer", bytes(buffer[-1:]))
+    first_byte = buffer[start]
+    if first_byte < 0x80:
+        return False, start, start + 1
+    if first_byte < 0xB8:
+        is_list, payload_start, length = False, start + 1, first_byte - 0x80
+    elif first_byte < 0xC0:
+        is_list, length_of_length = False, first_byte - 0xB7
+        payload_start = start + 1 + length_of_length
+        length = int.from_bytes(buffer[start + 1:payload_start], "big")
+    elif first_byte < 0xF8:
+        is_list, payload_start, length = True, start + 1, first_byte - 0xC0
+    else:
+        is_list, length_of_length = True, first_byte - 0xF7
+        payload_start = start + 1 + length_of_length
+        length = int.from_bytes(buffer[start + 1:payload_start], "big")
+    end = payload_start + length
+    if end > len(buffer):
+        raise DecodingError("RLP item exceeds the end of the buffer", bytes(buffer[start:start + 1]))
+    return is_list, payload_start, end
+
+
+def _list_item_spans(buffer: memoryview, payload_start: int, end: int) -> List[Tuple[int, int, int]]:
+    # returns (item_start, payload_start, item_end) of each item in a list payload
+    spans: List[Tuple[int, int, int]] = []
+    position = payload_start
+    while position < end:
+        _, item_payload_start, item_end = consume_item(buffer, position)
+        spans.append((position, item_payload_start, item_end))
+        position = item_end
+    if position != end:
+        raise DecodingError("RLP list payload is not aligned with its items", None)
+    return spans
+
+
+class RawTransactionView:
+    """
+    A lazy, read-only view over a signed raw transaction.
+    Works for both legacy transactions and CIP-1559 (``b'cfx' || 0x02``) transactions.
+
+    Only the RLP list offsets are parsed on construction.
+    Integer fields are decoded when accessed and byte fields are returned as
+    ``memoryview`` slices of the underlying buffer, so no payload is copied.
+
+    >>> view = RawTransactionView(raw_transaction)
+    >>> view.nonce, view.transaction_type
+    (1, 0)
+    >>> bytes(view.to).hex()
+    '13d2ba4ed43542e7c54fbb6c5fccb9f269c1f94c'
+    >>> view["epochHeight"]
+    100
+    """
+
+    __slots__ = ("_buffer", "transaction_type", "_layout", "_unsigned_span", "_field_spans", "_signature_spans")
+
+    def __init__(self, raw_transaction: BytesLike):
+        buffer = memoryview(raw_transaction)
+        if buffer.format != "B" or buffer.ndim != 1:
+            buffer = buffer.cast("B")
+        self._buffer = buffer
+
+        if buffer[:len(CIP1559_TRANSACTION_PREFIX)].tobytes() == CIP1559_TRANSACTION_PREFIX:
+            self.transaction_type = 2
+            self._layout = CIP1559_UNSIGNED_LAYOUT
+            start = len(CIP1559_TRANSACTION_PREFIX)
+        else:
+            self.transaction_type = 0
+            self._layout = LEGACY_UNSIGNED_LAYOUT
+            start = 0
+
+        is_list, payload_start, end = consume_item(buffer, start)
+        if not is_list or end != len(buffer):
+            raise DecodingError("Raw transaction must be a single RLP list", bytes(buffer[:start + 1]))
+        outer_items = _list_item_spans(buffer, payload_start, end)
+        if len(outer_items) != 4:
+            raise DecodingError(
+                f"Signed transaction should have 4 items, got {len(outer_items)}", None
+            )
+        unsigned_start, unsigned_payload_start, unsigned_end = outer_items[0]
+        if buffer[unsigned_start] < 0xC0:
+            raise DecodingError("Unsigned transaction fields must be an RLP list", None)
+        self._unsigned_span = (unsigned_start, unsigned_end)
+        self._field_spans = {
+            field: span
+            for (field, _), span in zip(
+                self._layout,
+                self._checked_spans(_list_item_spans(buffer, unsigned_payload_start, unsigned_end)),
+            )
+        }
+        self._signature_spans = tuple(outer_items[1:])
+
+    def _checked_spans(self, spans: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        if len(spans) != len(self._layout):
+            raise DecodingError(
+                f"Expecting {len(self._layout)} transaction fields, got {len(spans)}", None
+            )
+        return spans
+
+    @property
+    def raw_transaction(self) -> memoryview:
+        return self._buffer
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """
+        Names of the unsigned fields of this transaction type, in encoding order.
+        """
+        return tuple(field for field, _ in self._layout)
+
+    def _int_at(self, span: Tuple[int, int, int]) -> int:
+        _, payload_start, end = span
+        return int.from_bytes(self._buffer[payload_start:end], "big")
+
+    def __getitem__(self, field: str) -> Any:
+        """
+        Returns a field by its transaction dict name, e.g. ``view["gasPrice"]``.
+        Byte fields (``to`` and ``data``) are returned as memoryview slices.
+        """
+        if field in _SIGNATURE_FIELDS:
+            return self._int_at(self._signature_spans[_SIGNATURE_FIELDS.index(field)])
+        try:
+            span = self._field_spans[field]
+        except KeyError:
+            raise KeyError(f"{field} is not a field of type {self.transaction_type} transactions")
+        if field in _ADDRESS_FIELDS or field in _BYTES_FIELDS:
+            return self._buffer[span[1]:span[2]]
+        if field == "accessList":
+            return rlp.decode(bytes(self._buffer[span[0]:span[2]]), access_list_sede_type)
+        return self._int_at(span)
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._field_spans or field in _SIGNATURE_FIELDS
+
+    @property
+    def nonce(self) -> int:
+        return self["nonce"]
+
+    @property
+    def gas(self) -> int:
+        return self["gas"]
+
+    @property
+    def to(self) -> memoryview:
+        """
+        The 20-byte hex address of the receiver, or an empty slice for contract creation.
+        """
+        return self["to"]
+
+    @property
+    def value(self) -> int:
+        return self["value"]
+
+    @property
+    def data(self) -> memoryview:
+        return self["data"]
+
+    @property
+    def v(self) -> int:
+        return self["v"]
+
+    @property
+    def r(self) -> int:
+        return self["r"]
+
+    @property
+    def s(self) -> int:
+        return self["s"]
+
+    def vrs(self) -> Tuple[int, int, int]:
+        return (self.v, self.r, self.s)
+
+    def hash(self) -> bytes:
+        """
+        The transaction hash, i.e. the keccak of the whole raw transaction.
+        """
+        return keccak(self._buffer)  # type: ignore
+
+    def signing_hash(self) -> bytes:
+        """
+        The hash that was signed, equal to ``TransactionImplementation.hash()`` of the decoded transaction.
+        """
+        unsigned_rlp = self._buffer[self._unsigned_span[0]:self._unsigned_span[1]]
+        if self.transaction_type == 2:
+            return keccak(CIP1559_TRANSACTION_PREFIX + unsigned_rlp)
+        return keccak(unsigned_rlp)  # type: ignore
+
+    def signing_payload(self, overrides: Optional[Mapping[str, Any]] = None) -> RLPPayload:
+        """
+        The unsigned payload of this transaction with some fields replaced.
+        Fields which are not overridden are reused as encoded slices of the raw transaction.
+
+        :param overrides: RLP-ready values (ints and bytes) by field name, e.g. ``{"gasPrice": 2}``
+        :raises KeyError: an overridden field is not a field of this transaction type
+        :raises rlp.exceptions.SerializationError: an overridden value has an invalid type
+        """
+        overrides = overrides or {}
+        for field in overrides:
+            if field not in self._field_spans:
+                raise KeyError(f"{field} is not a field of type {self.transaction_type} transactions")
+        pieces: List[Any] = []
+        payload_length = 0
+        for field, kind in self._layout:
+            if field in overrides:
+                payload_length += append_field(pieces, field, kind, overrides[field])
+            else:
+                item_start, _, end = self._field_spans[field]
+                pieces.append(self._buffer[item_start:end])
+                payload_length += end - item_start
+        prefix = CIP1559_TRANSACTION_PREFIX if self.transaction_type == 2 else b""
+        return RLPPayload(pieces, payload_length, prefix)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Decodes every field. Byte fields are copied into ``bytes``.
+        """
+        result: Dict[str, Any] = {}
+        for field in self.fields + _SIGNATURE_FIELDS:
+            value = self[field]
+            result[field] = bytes(value) if isinstance(value, memoryview) else value
+        return result
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(type={self.transaction_type}, nonce={self.nonce}, size={len(self._buffer)})"
@@ -6,8 +6,12 @@ LONG_DESCRIPTION = 'Conflux account that can sign a conflux transaction'
 extras_require = {
     'tester': [
         "pytest>8,<9",
+        "numpy",
         # "conflux-web3>=1.4.0",
     ],
+    'columnar': [
+        "numpy",
+    ],
     'linter': [
         # "black>=22.1.0,<23.0",
         # "flake8==3.8.3",
@@ -67,11 +71,11 @@ setup(
     author_email="wangpan@conflux-chain.org",
     description=DESCRIPTION,
     long_description=LONG_DESCRIPTION,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     package_data={'cfx_account': ['py.typed']},
     install_requires=[
-        "eth-account>=0.13.1",
-        "cfx-address>=1.2.0",
+        "eth-account>=0.13.1,<0.15",
+        "cfx-address>=1.2.0,<1.3",
         "cfx-utils>=1.0.5"
     ],  # add any additional packages that
     # needs to be installed along with your package. Eg: 'caer'
@@ -0,0 +1,72 @@
+import os
+
+import numpy as np
+import pytest
+from cfx_address import Base32Address
+from cfx_utils.exceptions import InvalidBase32Address, InvalidConfluxHexAddress, InvalidHexAddress
+
+from cfx_account._utils.cache import LRUCache
+from cfx_account.addresses import network_id_from_prefix, network_prefix, to_base32_many, to_hex_many
+
+
+def random_addresses(count):
+    addresses = []
+    for index in range(count):
+        address = bytearray(os.urandom(20))
+        address[0] = (address[0] & 0x0F) | (0x00, 0x10, 0x80)[index % 3]
+        addresses.append(bytes(address))
+    return addresses
+
+
+@pytest.mark.parametrize('network_id', [1, 1029, 8888])
+def test_to_base32_many_matches_base32_address(network_id):
+    addresses = random_addresses(30) + [bytes(20)]
+    expected = [Base32Address('0x' + address.hex(), network_id) for address in addresses]
+    assert to_base32_many(['0x' + address.hex() for address in addresses], network_id) == expected
+    assert to_base32_many(addresses, network_id) == expected
+    assert to_base32_many(np.frombuffer(b''.join(addresses), dtype=np.uint8).reshape(-1, 20), network_id) == expected
+    assert all(isinstance(address, Base32Address) for address in to_base32_many(addresses, network_id))
+
+
+def test_to_hex_many_matches_base32_address():
+    encoded = [Base32Address('0x' + address.hex(), 1) for address in random_addresses(30)]
+    verbose = [Base32Address(address, verbose=True) for address in encoded[:3]]
+    assert to_hex_many(encoded + verbose) == [address.hex_address for address in encoded + encoded[:3]]
+
+
+def test_invalid_addresses():
+    with pytest.raises(InvalidConfluxHexAddress):
+        to_base32_many(['0x2' + '0' * 39], 1)
+    with pytest.raises(InvalidConfluxHexAddress):
+        to_base32_many(np.full((2, 20), 0x20, dtype=np.uint8), 1)
+    with pytest.raises(InvalidHexAddress):
+        to_base32_many(['0x1234'], 1)
+    with pytest.raises(InvalidHexAddress):
+        to_base32_many(np.zeros((2, 19), dtype=np.uint8), 1)
+
+    address = Base32Address('0x1ecde7223747601823f7535d7968ba98b4881e09', 1)
+    for invalid in [address[:-1] + ('a' if address[-1] != 'a' else 'b'), address.replace('cfxtest', 'cfx'),
+                    address[:10] + 'i' + address[11:], 'foo:' + address.split(':')[1]]:
+        with pytest.raises(InvalidBase32Address):
+            to_hex_many([invalid])
+
+
+def test_conversion_cache():
+    cache = LRUCache(8)
+    address = '0x1ecde7223747601823f7535d7968ba98b4881e09'
+    first = to_base32_many([address], 1, cache=cache)
+    assert to_base32_many([address], 1, cache=cache) == first
+    assert to_base32_many([address], 1029, cache=cache) != first
+    assert to_hex_many(first * 2, cache=cache) == [Base32Address(first[0]).hex_address] * 2
+    assert (cache.info().hits, cache.info().currsize) == (2, 3)
+
+
+@pytest.mark.parametrize('network_id', [1, 1029, 8888])
+def test_network_prefix_round_trip(network_id):
+    prefix = network_prefix(network_id)
+    assert prefix == Base32Address.zero_address(network_id).split(':')[0]
+    assert network_id_from_prefix(prefix) == network_id
+    assert network_id_from_prefix(prefix.upper()) == network_id
+    for invalid in ['foo', 'net', 'netx1']:
+        with pytest.raises(InvalidBase32Address):
+            network_id_from_prefix(invalid)
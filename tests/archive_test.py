@@ -0,0 +1,114 @@
+import pytest
+from hexbytes import HexBytes
+
+from cfx_account import Account
+from cfx_account.transactions.archive import RawTransactionArchive, iter_archive
+
+from .test_utils import key, make_cip1559_transaction, make_transaction
+
+
+def signed_transactions(count):
+    raws = []
+    for nonce in range(count):
+        fields = {'gas': 21000, 'storageLimit': 0, 'data': b"\x01" * (nonce * 10)}
+        if nonce % 2:
+            transaction = make_transaction(nonce, **fields)
+        else:
+            transaction = make_cip1559_transaction(nonce, maxFeePerGas=2, **fields)
+        raws.append(bytes(Account.sign_transaction(transaction, key).raw_transaction))
+    return raws
+
+
+@pytest.fixture(scope="module")
+def raws():
+    return signed_transactions(12)
+
+
+def test_concatenated_archive(tmp_path, raws):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(b"".join(raws))
+    with RawTransactionArchive(str(path)) as archive:
+        assert [bytes(record) for record in archive.iter_raw()] == raws
+        assert [view.nonce for view in archive] == list(range(12))
+        assert [transaction.encode() for transaction in archive.iter_transactions()] == raws
+
+
+def test_length_prefixed_archive(tmp_path, raws):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(b"".join(len(raw).to_bytes(4, "big") + raw for raw in raws))
+    with RawTransactionArchive(str(path), "length-prefixed") as archive:
+        assert [bytes(record) for record in archive.iter_raw()] == raws
+        assert [view.transaction_type for view in archive.iter_views()] == [2, 0] * 6
+
+
+@pytest.mark.parametrize("parts", [1, 3, 5, 20])
+def test_split_covers_archive(tmp_path, raws, parts):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(b"".join(raws))
+    with RawTransactionArchive(str(path)) as archive:
+        ranges = archive.split(parts)
+    assert len(ranges) <= parts
+    assert ranges[0][0] == 0 and ranges[-1][1] == path.stat().st_size
+    nonces = []
+    for byte_range in ranges:
+        nonces.extend(view.nonce for view in iter_archive(str(path), byte_range=byte_range))
+    assert nonces == list(range(12))
+
+
+def test_empty_archive(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with RawTransactionArchive(str(path)) as archive:
+        assert list(archive) == []
+        assert archive.split(4) == []
+
+
+def test_recover_transaction_from_archive(tmp_path, raws):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(b"".join(raws))
+    senders = {
+        Account.recover_transaction(HexBytes(transaction.encode()))
+        for transaction in iter_archive(str(path), decode=True)
+    }
+    assert senders == {Account.from_key(key).address}
+
+
+def test_close_with_referenced_record(tmp_path, raws):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(b"".join(raws))
+    archive = RawTransactionArchive(str(path))
+    record = next(archive.iter_raw())
+    with pytest.raises(BufferError):
+        archive.close()
+    assert archive._file.closed
+    # the mapping is still readable
+    assert [bytes(record) for record in archive.iter_raw()] == raws
+    record.release()
+    archive.close()
+    assert archive._file.closed and archive._mmap.closed
+
+
+def test_iter_archive_closes_file_with_referenced_view(tmp_path, raws):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(b"".join(raws))
+    views = iter_archive(str(path))
+    first = next(views)
+    archive = views.gi_frame.f_locals["archive"]
+    assert len(list(views)) == 11
+    assert archive._file.closed
+    assert first.nonce == 0
+
+
+@pytest.mark.parametrize("format, data", [
+    ("concatenated", b"\xf8\xff" + b"\x00" * 10),
+    ("length-prefixed", b"\x00\x00\x01\x00" + b"\x00" * 10),
+    ("length-prefixed", b"\x00\x00"),
+])
+def test_malformed_archive_raises_value_error(tmp_path, format, data):
+    path = tmp_path / "txs.bin"
+    path.write_bytes(data)
+    with RawTransactionArchive(str(path), format) as archive:
+        with pytest.raises(ValueError):
+            list(archive.iter_raw())
+        with pytest.raises(ValueError):
+            archive.split(2)
@@ -0,0 +1,97 @@
+import warnings
+
+import pytest
+from eth_keys import keys
+from eth_keys.backends import NativeECCBackend
+from eth_keys.datatypes import PrivateKey
+
+from cfx_account import Account
+from cfx_account import backends
+from cfx_account.backends import BackendSelfTestError, get_backend, self_test
+from cfx_account.messages import encode_defunct
+
+from .test_utils import address, key, transaction
+
+
+@pytest.fixture
+def reset_backend():
+    yield
+    Account.set_signing_backend(None)
+
+
+def test_default_backend_unchanged():
+    assert Account.get_signing_backend().name in ("coincurve", "pure-python")
+
+
+@pytest.mark.parametrize("spec", ["pure-python", "coincurve"])
+def test_backends_produce_identical_signatures(spec, reset_backend):
+    if spec == "coincurve":
+        pytest.importorskip("coincurve")
+    expected_tx = Account.sign_transaction(transaction, key)
+    message = encode_defunct(text="Hello World")
+    expected_message = Account.sign_message(message, key)
+
+    assert Account.set_signing_backend(spec).name == spec
+    assert Account.sign_transaction(transaction, key) == expected_tx
+    signed_message = Account.sign_message(message, key)
+    assert signed_message == expected_message
+    assert Account.recover_transaction(expected_tx.raw_transaction) == address
+    assert Account.recover_message(message, signature=signed_message.signature) == address
+    assert Account.recover_message(message, vrs=(signed_message.v, signed_message.r, signed_message.s)) == address
+
+
+def test_callable_backend(reset_backend):
+    reference = NativeECCBackend()
+    calls = []
+
+    def sign(msg_hash, private_key_bytes):
+        calls.append(msg_hash)
+        return reference.ecdsa_sign(msg_hash, PrivateKey(private_key_bytes, backend=reference)).vrs
+
+    expected = Account.sign_transaction(transaction, key)
+    assert Account.set_signing_backend(sign).name == "custom"
+    assert Account.sign_transaction(transaction, key) == expected
+    # one call for the self test
+    assert len(calls) == 2
+
+
+def test_broken_backend_fails_self_test(reset_backend):
+    def sign(msg_hash, private_key_bytes):
+        return (0, 1, 1)
+
+    with pytest.raises(BackendSelfTestError):
+        self_test(get_backend(sign))
+    with pytest.raises(BackendSelfTestError):
+        Account.set_signing_backend(sign)
+    assert Account._signing_backend is None
+
+
+def test_auto_backend_without_coincurve(monkeypatch):
+    monkeypatch.setattr(backends, "is_coincurve_available", lambda: False)
+    with pytest.warns(RuntimeWarning):
+        assert get_backend("auto").name == "pure-python"
+    with pytest.raises(ImportError):
+        get_backend("coincurve")
+    with pytest.raises(ValueError):
+        get_backend("openssl")
+
+
+def test_incomplete_backend_fails_at_construction():
+    class SignOnly(backends.SigningBackend):
+        name = "sign-only"
+
+        def sign(self, msg_hash, private_key):
+            return (0, 1, 1)
+
+    with pytest.raises(TypeError):
+        SignOnly()
+
+
+def test_slow_default_backend_warns_once(monkeypatch):
+    monkeypatch.setattr(keys, "backend", NativeECCBackend())
+    monkeypatch.setattr(backends, "_default_backend_checked", False)
+    with pytest.warns(RuntimeWarning, match="pure-python"):
+        Account.sign_transaction(transaction, key)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Account.sign_transaction(transaction, key)
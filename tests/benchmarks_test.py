@@ -0,0 +1,30 @@
+import json
+
+from benchmarks.cases import CASES
+from benchmarks.run import compare, main, time_case
+
+
+def run_result(**best):
+    return {"results": {name: {"best": seconds} for name, seconds in best.items()}}
+
+
+def test_compare_flags_slowdowns_only():
+    baseline = run_result(a=1.0, b=1.0, c=1.0)
+    current = run_result(a=1.1, b=1.5, c=0.5, d=9.0)
+    assert compare(current, baseline, 0.2) == ["b: 1.50x the baseline"]
+    assert compare(current, baseline, 0.6) == []
+
+
+def test_time_case():
+    result = time_case(CASES["encode_defunct"](), min_time=0.01, repeat=2)
+    assert result["repeat"] == 2
+    assert 0 < result["best"] <= result["median"]
+
+
+def test_gate(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "encode_defunct", "--min-time", "0.01", "--repeat", "1"]
+    assert main(args + ["-o", str(baseline)]) == 0
+    assert main(args + ["-b", str(baseline), "--max-slowdown", "100"]) == 0
+    baseline.write_text(json.dumps(run_result(encode_defunct=1e-12)))
+    assert main(args + ["-b", str(baseline)]) == 1
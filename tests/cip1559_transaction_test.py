@@ -70,3 +70,25 @@ def test_signing_cip1559_transaction():
     acct = Account.create()
     raw_tx = acct.sign_transaction(unsigned_cip1559_transaction_dict).raw_transaction
     assert raw_tx
+
+def test_cip1559_signed_encoding_reuses_unsigned_rlp(monkeypatch):
+    from cfx_account.transactions import cip1559_transactions
+
+    calls = []
+    original = cip1559_transactions.cip1559_unsigned_payload
+    def counting_encoder(*args):
+        calls.append(args)
+        return original(*args)
+    monkeypatch.setattr(cip1559_transactions, "cip1559_unsigned_payload", counting_encoder)
+
+    cip1559_transaction = CIP1559Transaction(dict(unsigned_cip1559_transaction_dict))
+    assert_hex_equal(
+        cip1559_transaction.hash(),
+        "3da56dbe2b76c41135c2429f3035cd79b1abb68902cf588075c30d4912e71cf3"
+    )
+    cip1559_transaction.append_signature(v=0, r=1, s=1)
+    assert_hex_equal(
+        cip1559_transaction.encode(),
+        "63667802f869f864646464649419578cf3c71eab48cf810c78b5175d5c9e6ef441646464648c48656c6c6f2c20576f726c64f838f79419578cf3c71eab48cf810c78b5175d5c9e6ef441e1a01234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef800101"
+    )
+    assert len(calls) == 1
@@ -0,0 +1,47 @@
+import io
+import json
+
+import pytest
+
+from cfx_account import Account
+from cfx_account.cli import main, sign_stream
+
+from .test_utils import key, make_transaction
+
+
+def expected_record(nonce):
+    signed = Account.sign_transaction(make_transaction(nonce, data='0x1234'), key)
+    return {'hash': signed.hash.to_0x_hex(), 'raw_transaction': signed.raw_transaction.to_0x_hex()}
+
+
+def test_sign_stream_keeps_input_order():
+    lines = b''.join(json.dumps(make_transaction(nonce, data='0x1234')).encode() + b'\n' for nonce in range(7))
+    output = io.BytesIO()
+    assert sign_stream(io.BytesIO(lines + b'\n{"nonce": "bad"}\n'), output, bytes.fromhex(key[2:]), chunk_size=3) == (8, 1)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[:7] == [expected_record(nonce) for nonce in range(7)]
+    assert records[7]['line'] == 9 and 'error' in records[7]
+
+
+def test_sign_command_with_worker_processes(tmp_path, capsys):
+    keyfile = tmp_path / 'key.json'
+    keyfile.write_text(json.dumps(Account.encrypt(key, 'password', kdf='pbkdf2', iterations=2)))
+    password_file = tmp_path / 'password'
+    password_file.write_text('password\n')
+    input_file = tmp_path / 'input.ndjson'
+    input_file.write_text(''.join(json.dumps(make_transaction(nonce, data='0x1234')) + '\n' for nonce in range(20)))
+    output_file = tmp_path / 'output.ndjson'
+
+    status = main([
+        'sign', '--keyfile', str(keyfile), '--password-file', str(password_file),
+        '-i', str(input_file), '-o', str(output_file), '--workers', '2', '--chunk-size', '4',
+    ])
+    assert status == 0
+    records = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert records == [expected_record(nonce) for nonce in range(20)]
+    assert 'signed 20 of 20 transactions' in capsys.readouterr().err
+
+
+def test_sign_command_rejects_bad_options():
+    with pytest.raises(SystemExit):
+        main(['sign', '--keyfile', 'key.json', '--workers', '0'])
@@ -0,0 +1,97 @@
+import pytest
+from eth_keys.backends import NativeECCBackend
+
+from cfx_account import Account
+from cfx_account.backends import EthKeysBackend
+from cfx_account.transactions.columnar import decode_transactions_columnar
+from cfx_account.transactions.views import RawTransactionView
+
+from .test_utils import key, make_cip1559_transaction, make_transaction
+
+np = pytest.importorskip("numpy")
+
+
+def make_raws():
+    raws = []
+    for nonce in range(6):
+        fields = {
+            'value': 10**20 + nonce,
+            'gas': 21000 + nonce,
+            'storageLimit': nonce,
+            'epochHeight': 100 + nonce,
+            'data': bytes([nonce]) * nonce,
+        }
+        if nonce == 3:
+            fields['to'] = None
+        if nonce % 2:
+            transaction = make_transaction(nonce, gasPrice=10 + nonce, **fields)
+        else:
+            transaction = make_cip1559_transaction(nonce, maxFeePerGas=20 + nonce, maxPriorityFeePerGas=nonce, **fields)
+        raws.append(Account.sign_transaction(transaction, key).raw_transaction)
+    return raws
+
+
+def test_decode_transactions_columnar():
+    raws = make_raws()
+    columns = decode_transactions_columnar(raws, recover_sender=True)
+    assert len(columns) == 6
+    assert columns.nonce.dtype == np.uint64
+    assert columns.nonce.tolist() == list(range(6))
+    assert columns.gas_price.tolist() == [20, 11, 22, 13, 24, 15]
+    assert columns.max_priority_fee_per_gas.tolist() == [0, 11, 2, 13, 4, 15]
+    assert columns.transaction_type.tolist() == [2, 0, 2, 0, 2, 0]
+    assert columns.value.tolist() == [10**20 + nonce for nonce in range(6)]
+    assert columns.to.shape == (6, 20)
+    assert columns.has_to.tolist() == [True, True, True, False, True, True]
+    assert bytes(columns.to[0]) == bytes(RawTransactionView(raws[0]).to)
+    assert not columns.to[3].any()
+    for index in range(6):
+        assert bytes(columns.get_data(index)) == bytes([index]) * index
+        assert columns.v[index] == RawTransactionView(raws[index]).v
+    sender = "0x" + bytes(columns.sender[0]).hex()
+    assert sender == Account.from_key(key).address.lower()
+    assert not (columns.sender != columns.sender[0]).any()
+
+
+class CountingBackend(EthKeysBackend):
+    def __init__(self):
+        super().__init__(NativeECCBackend())
+        self.recovered = 0
+
+    def recover(self, msg_hash, vrs):
+        self.recovered += 1
+        return super().recover(msg_hash, vrs)
+
+
+def test_sender_recovery_uses_the_signing_backend():
+    raws = make_raws()
+    expected = decode_transactions_columnar(raws, recover_sender=True).sender
+    backend = CountingBackend()
+    assert (decode_transactions_columnar(raws, recover_sender=True, backend=backend).sender == expected).all()
+    assert backend.recovered == 6
+    Account.set_signing_backend(backend, run_self_test=False)
+    try:
+        assert (Account.decode_transactions_columnar(raws, recover_sender=True).sender == expected).all()
+        assert (decode_transactions_columnar(raws, recover_sender=True).sender == expected).all()
+    finally:
+        Account.set_signing_backend(None)
+    assert backend.recovered == 12
+
+
+def test_decode_without_sender():
+    columns = decode_transactions_columnar(make_raws()[:2])
+    assert columns.sender is None
+
+
+def test_wide_values_fall_back_to_object():
+    raw = Account.sign_transaction(make_transaction(2**70, to=None), key).raw_transaction
+    columns = decode_transactions_columnar([raw])
+    assert columns.nonce.dtype == object
+    assert columns.nonce[0] == 2**70
+    assert columns.gas.dtype == np.uint64
+
+
+def test_empty_batch():
+    columns = decode_transactions_columnar([])
+    assert len(columns) == 0
+    assert columns.to.shape == (0, 20)
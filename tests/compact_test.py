@@ -0,0 +1,58 @@
+import pytest
+from eth_account.signers.base import BaseAccount
+
+from cfx_account import Account
+from cfx_account.datastructures import CompactSignedTransaction
+from cfx_account.messages import encode_defunct
+from cfx_account.signers.local import CompactLocalAccount
+from cfx_account.signers.pool import ThreadPoolSigner
+from cfx_account.transactions.transactions import Transaction
+
+from .test_utils import key, transaction
+
+
+def test_transactions_have_no_instance_dict():
+    legacy = Transaction.from_dict(transaction)
+    cip1559_dict = dict(transaction, type=2, maxFeePerGas=2, maxPriorityFeePerGas=1)
+    del cip1559_dict['gasPrice']
+    cip1559 = Transaction.from_dict(cip1559_dict)
+    for instance in (legacy, cip1559):
+        assert not hasattr(instance, '__dict__')
+        with pytest.raises(AttributeError):
+            instance.extra = 1
+
+
+def test_compact_signed_transaction():
+    signed = Account.sign_transaction(transaction, key)
+    compact = CompactSignedTransaction(bytes(signed.raw_transaction), signed.r, signed.s, signed.v)
+    assert compact == signed and signed == compact
+    assert compact.hash == signed.hash
+    assert compact['raw_transaction'] == signed.raw_transaction
+    assert compact.to_signed_transaction() == signed
+    assert CompactSignedTransaction.from_signed_transaction(signed) == compact
+    assert not hasattr(compact, '__dict__')
+
+
+def test_compact_local_account_signs_like_local_account():
+    local = Account.from_key(key, network_id=1)
+    compact = CompactLocalAccount.from_local_account(local)
+    assert isinstance(compact, BaseAccount)
+    assert not hasattr(compact, '__dict__')
+    assert (compact.address, compact.hex_address, compact.key) == (local.address, local.hex_address, local.key)
+    assert type(compact.key) is type(local.key)
+    assert compact.sign_transaction(transaction) == local.sign_transaction(transaction)
+    message = encode_defunct(text='hello')
+    assert compact.sign_message(message) == local.sign_message(message)
+    compact.network_id = None
+    assert compact.address == local.hex_address
+    with pytest.raises(ValueError):
+        compact.base32_address
+
+
+def test_pool_returns_compact_results():
+    pytest.importorskip("coincurve")
+    transactions = [dict(transaction, nonce=nonce) for nonce in range(4)]
+    with ThreadPoolSigner(max_workers=2, backend="coincurve") as signer:
+        compact = signer.sign_transactions(transactions, key, compact=True)
+    assert all(isinstance(signed, CompactSignedTransaction) for signed in compact)
+    assert compact == [Account.sign_transaction(tx, key) for tx in transactions]
@@ -0,0 +1,178 @@
+import pytest
+import rlp
+from eth_utils import keccak
+from rlp.exceptions import SerializationError
+from hexbytes import HexBytes
+from eth_account._utils.transaction_utils import transaction_rpc_to_rlp_structure
+
+from cfx_account.transactions.cip1559_transactions import CIP1559Transaction
+from cfx_account import Account
+from cfx_account.transactions.encoding import (
+    CIP1559_UNSIGNED_LAYOUT,
+    LEGACY_UNSIGNED_LAYOUT,
+    encode_cip1559_unsigned_rlp,
+    encode_legacy_unsigned_rlp,
+    encode_signed_rlp,
+    legacy_unsigned_payload,
+)
+from cfx_account.transactions import transaction_utils
+from cfx_account.transactions.transaction_utils import format_data, normalize_access_list
+from cfx_account.transactions.legacy_transactions import (
+    LEGACY_UNSIGNED_TRANSACTION_FIELDS,
+    LegacyTransaction,
+    LegacyTransactionImpl,
+    UnsignedLegacyTransactionImpl,
+)
+
+from .test_utils import key
+
+address = bytes.fromhex("19578cf3c71eab48cf810c78b5175d5c9e6ef441")
+
+legacy_cases = [
+    {"nonce": 0, "gasPrice": 0, "gas": 0, "to": b"", "value": 0, "storageLimit": 0, "epochHeight": 0, "chainId": 0, "data": b""},
+    {"nonce": 1, "gasPrice": 127, "gas": 128, "to": address, "value": 10**18, "storageLimit": 255, "epochHeight": 2**64, "chainId": 1029, "data": b"\x01"},
+    {"nonce": 2**256 - 1, "gasPrice": 1, "gas": 21000, "to": address, "value": 1, "storageLimit": 0, "epochHeight": 1, "chainId": 1, "data": b"\x80"},
+    {"nonce": 3, "gasPrice": 1, "gas": 21000, "to": address, "value": 1, "storageLimit": 0, "epochHeight": 1, "chainId": 1, "data": b"a" * 55},
+    {"nonce": 4, "gasPrice": 1, "gas": 21000, "to": address, "value": 1, "storageLimit": 0, "epochHeight": 1, "chainId": 1, "data": bytes(range(256)) * 300},
+]
+
+access_lists = [
+    [],
+    [{"address": address, "storageKeys": []}],
+    [{"address": address, "storageKeys": [0, 1, 2**256 - 1]}, {"address": b"\x01" * 20, "storageKeys": [5]}],
+    [{"address": address, "storageKeys": list(range(100))}],
+]
+
+vrs_cases = [(0, 1, 1), (1, 2**256 - 1, 2**255), (0, 0x7F, 0x80)]
+
+
+def test_layouts_match_sedes_fields():
+    assert [field for field, _ in LEGACY_UNSIGNED_LAYOUT] == [field for field, _ in LEGACY_UNSIGNED_TRANSACTION_FIELDS]
+    assert [field for field, _ in CIP1559_UNSIGNED_LAYOUT] == [field for field, _ in CIP1559Transaction.unsigned_transaction_fields]
+
+
+@pytest.mark.parametrize("transaction", legacy_cases)
+def test_legacy_encoding_equivalence(transaction):
+    unsigned_impl = UnsignedLegacyTransactionImpl(**transaction)
+    assert encode_legacy_unsigned_rlp(transaction) == rlp.encode(unsigned_impl)
+    # impls are accepted as well
+    assert encode_legacy_unsigned_rlp(unsigned_impl) == rlp.encode(unsigned_impl)
+    for v, r, s in vrs_cases:
+        signed_impl = LegacyTransactionImpl(tx_meta=unsigned_impl, v=v, r=r, s=s)
+        assert encode_signed_rlp(encode_legacy_unsigned_rlp(transaction), v, r, s) == rlp.encode(signed_impl)
+
+
+@pytest.mark.parametrize("access_list", access_lists)
+@pytest.mark.parametrize("data", [b"", b"\x00", b"Hello, World", bytes(1000)])
+def test_cip1559_encoding_equivalence(access_list, data):
+    transaction = {
+        "nonce": 100,
+        "maxPriorityFeePerGas": 1,
+        "maxFeePerGas": 10**9,
+        "gas": 21000,
+        "to": address,
+        "value": 10**20,
+        "storageLimit": 0,
+        "epochHeight": 2**40,
+        "chainId": 1029,
+        "data": data,
+        "accessList": access_list,
+    }
+    serializer = CIP1559Transaction._unsigned_transaction_serializer
+    expected = rlp.encode(serializer.from_dict(transaction_rpc_to_rlp_structure(transaction)))
+    assert encode_cip1559_unsigned_rlp(transaction) == expected
+    assert encode_cip1559_unsigned_rlp(transaction, b"cfx\x02") == b"cfx\x02" + expected
+    for v, r, s in vrs_cases:
+        signed = CIP1559Transaction._signed_transaction_serializer(
+            tx_meta=serializer(**transaction_rpc_to_rlp_structure(transaction)), v=v, r=r, s=s
+        )
+        assert encode_signed_rlp(expected, v, r, s, b"cfx\x02") == b"cfx\x02" + rlp.encode(signed)
+
+
+def test_legacy_transaction_round_trip():
+    raw = bytes.fromhex("f861dd0101649413d2ba4ed43542e7c54fbb6c5fccb9f269c1f94c016464018080a0a52f639cbed11262a7b88d0a37aef909aa7dc2c36c40689a3d52b8bd1d9482dea054f3bdeb654f73704db4cbc12451fb4c9830ef62b0f24de1a40e4b6fe10f57b2")
+    transaction = LegacyTransaction.from_bytes(HexBytes(raw))
+    assert transaction.encode() == raw
+    assert transaction.hash() == LegacyTransactionImpl.from_bytes(raw)[0].hash()
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [("nonce", -1), ("nonce", "1"), ("nonce", True), ("to", b"\x01" * 19), ("data", "0x00")],
+)
+def test_invalid_values_raise(field, value):
+    transaction = dict(legacy_cases[1], **{field: value})
+    with pytest.raises(SerializationError):
+        encode_legacy_unsigned_rlp(transaction)
+
+
+def test_normalize_access_list():
+    hex_address = "0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441"
+    key_one = "0x" + "00" * 31 + "01"
+    access_list = [
+        {"address": hex_address, "storageKeys": [1, key_one, b"\x00" * 31 + b"\x02"]},
+        (b"\x01" * 20, [3]),
+        {"address": "cfx:aapztdhx26tm0wgtueghvrj1nzsk651yjemw6eew10", "storageKeys": [b"\x00" * 31 + b"\x02", 4]},
+    ]
+    deduplicated = normalize_access_list(access_list)
+    assert deduplicated == [
+        {"address": address, "storageKeys": [1, b"\x00" * 31 + b"\x02", 4]},
+        {"address": b"\x01" * 20, "storageKeys": [3]},
+    ]
+    raw = normalize_access_list(access_list, deduplicate=False)
+    assert [entry["address"] for entry in raw] == [address, b"\x01" * 20, address]
+    assert raw[0]["storageKeys"] == [1, bytes.fromhex(key_one[2:]), b"\x00" * 31 + b"\x02"]
+    # raw 32-byte keys encode like their int values
+    as_ints = [{"address": address, "storageKeys": [1, 1, 2]}, {"address": b"\x01" * 20, "storageKeys": [3]}, {"address": address, "storageKeys": [2, 4]}]
+    transaction = dict(legacy_cases[1], maxPriorityFeePerGas=1, maxFeePerGas=1)
+    del transaction["gasPrice"]
+    assert encode_cip1559_unsigned_rlp(dict(transaction, accessList=raw)) == \
+        encode_cip1559_unsigned_rlp(dict(transaction, accessList=as_ints))
+
+
+def test_normalize_access_list_deduplication():
+    key_two = b"\x00" * 31 + b"\x02"
+    access_list = [
+        # the same key as an int, a hex string and 32 bytes, an out-of-range int kept apart
+        (address, [2, "0x" + key_two.hex(), key_two, 2**256]),
+        ("0x" + address.hex(), [3, 2]),
+    ]
+    assert normalize_access_list(access_list) == [{"address": address, "storageKeys": [2, 2**256, 3]}]
+    assert normalize_access_list([]) == []
+    # signing keeps the access list as given
+    transaction = dict(legacy_cases[1], maxPriorityFeePerGas=1, maxFeePerGas=1, accessList=access_list[1:] * 2)
+    del transaction["gasPrice"]
+    signed = Account.sign_transaction(transaction, "0x" + "11" * 32)
+    assert len(CIP1559Transaction.from_bytes(signed.raw_transaction).as_dict()["accessList"]) == 2
+
+
+def test_unsigned_payload_hash_and_signed_encoding():
+    transaction = legacy_cases[4]
+    payload = legacy_unsigned_payload(transaction)
+    expected = encode_legacy_unsigned_rlp(transaction)
+    assert payload.to_bytes() == expected
+    assert len(payload) == len(expected)
+    assert payload.keccak() == keccak(expected)
+    assert encode_signed_rlp(payload, 0, 1, 1) == encode_signed_rlp(expected, 0, 1, 1)
+
+
+def test_format_data_does_not_copy(monkeypatch):
+    data = bytes(range(256)) * 10
+    assert format_data(data) is data
+    buffer = bytearray(data)
+    assert format_data(buffer) is buffer
+    assert format_data(memoryview(data)).obj is data
+    assert format_data(memoryview(data).cast("H")).format == "B"
+    monkeypatch.setattr(transaction_utils, "_HEX_DECODE_CHUNK", 64)
+    assert format_data("0x" + data.hex()) == data
+    assert format_data("0x123") == b"\x01\x23"
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, lambda data: "0x" + data.hex()])
+def test_sign_bytes_like_data(wrap):
+    data = bytes(range(256)) * 100
+    legacy = dict(legacy_cases[1], to="", data=data)
+    cip1559 = dict(legacy, maxFeePerGas=1, maxPriorityFeePerGas=1)
+    del cip1559["gasPrice"]
+    for transaction in (legacy, cip1559):
+        assert Account.sign_transaction(dict(transaction, data=wrap(data)), key) == Account.sign_transaction(transaction, key)
@@ -0,0 +1,37 @@
+import types
+
+import pytest
+
+from cfx_account import Account
+from cfx_account._utils.keygen import SECP256K1_N, derive_address_bytes, random_private_keys
+from cfx_account.signers.local import CompactLocalAccount
+
+
+def test_create_many_returns_valid_accounts():
+    accounts = Account.create_many(50, network_id=1029)
+    assert len(accounts) == 50 and len({acct.key for acct in accounts}) == 50
+    for acct in accounts:
+        assert isinstance(acct, CompactLocalAccount)
+        local_account = Account.from_key(acct.key, 1029)
+        assert (acct.hex_address, acct.address) == (local_account.hex_address, local_account.address)
+    assert Account.create_many(0) == []
+
+
+def test_create_many_stream():
+    accounts = Account.create_many(7, extra_entropy='some entropy', stream=True, chunk_size=3)
+    assert isinstance(accounts, types.GeneratorType)
+    accounts = list(accounts)
+    assert len(accounts) == 7
+    assert all(Account.from_key(acct.key).hex_address == acct.hex_address for acct in accounts)
+    with pytest.raises(ValueError):
+        Account.create_many(1, network_id=-1, stream=True)
+    with pytest.raises(ValueError):
+        Account.create_many(-1)
+
+
+def test_keygen_helpers():
+    private_keys = random_private_keys(20, b'extra')
+    assert all(len(key) == 32 and 0 < int.from_bytes(key, 'big') < SECP256K1_N for key in private_keys)
+    assert [address.hex() for address in derive_address_bytes(private_keys)] == [
+        Account.from_key(key).hex_address[2:].lower() for key in private_keys
+    ]
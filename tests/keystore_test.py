@@ -0,0 +1,96 @@
+import os
+import stat
+
+import pytest
+
+from cfx_account import Account
+from cfx_account.keystore import CompactKeyStore
+
+from .test_utils import transaction
+
+keys = ['0x' + bytes([i]).hex() * 32 for i in range(1, 9)]
+
+
+def test_store_looks_up_keys_by_address():
+    store = CompactKeyStore.from_keys(keys + keys[:2])
+    accounts = [Account.from_key(key) for key in keys]
+    assert len(store) == len(keys)
+    assert list(store.addresses()) == sorted((account.hex_address for account in accounts), key=str.lower)
+    for key, account in zip(keys, accounts):
+        assert store.get_key(account.hex_address) == bytes.fromhex(key[2:])
+        assert store.get_key(account.get_base32_address(1)) == bytes.fromhex(key[2:])
+        assert store.get_account(account.hex_address, network_id=1).address == account.get_base32_address(1)
+    assert '0x' + '10' * 20 not in store
+    assert 'not an address' not in store
+    with pytest.raises(KeyError):
+        store.get_key('0x' + '10' * 20)
+
+
+def test_store_signs_with_from_field():
+    store = CompactKeyStore.from_keys(keys)
+    account = Account.from_key(keys[3])
+    expected = account.sign_transaction(transaction)
+    assert store.sign_transaction(dict(transaction, **{'from': account.hex_address})) == expected
+    assert store.sign_transaction(transaction, account.get_base32_address(1)) == expected
+    with pytest.raises(ValueError):
+        store.sign_transaction(transaction)
+
+
+def test_store_adds_keys_in_order():
+    store = CompactKeyStore.from_keys(keys[:3])
+    store.add(keys[5])
+    store.add(keys[5])
+    assert store.add_many(keys[3:5]) == [Account.from_key(key).hex_address for key in keys[3:5]]
+    expected = CompactKeyStore.from_keys(keys[:6])
+    assert list(store.addresses()) == list(expected.addresses())
+    assert [store.get_key(address) for address in store.addresses()] == [
+        expected.get_key(address) for address in expected.addresses()
+    ]
+
+
+def test_store_merges_repeated_keys_once():
+    many_keys = ['0x' + bytes([i, 1]).hex() * 16 for i in range(1, 60)]
+    store = CompactKeyStore.from_keys(many_keys[::3] + many_keys[::3])
+    added = store.add_many(many_keys[::-1] + many_keys[:5])
+    assert added == [Account.from_key(key).hex_address for key in many_keys[::-1] + many_keys[:5]]
+    assert len(store) == len(many_keys)
+    assert list(store.addresses()) == sorted(set(added), key=lambda address: bytes.fromhex(address[2:]))
+    assert all(store.get_key(Account.from_key(key).hex_address) == bytes.fromhex(key[2:]) for key in many_keys)
+
+
+def test_store_saves_and_maps_files(tmp_path):
+    path = str(tmp_path / 'store.keys')
+    CompactKeyStore.from_keys(keys).save(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.path.getsize(path) == 16 + 52 * len(keys)
+    with CompactKeyStore.load(path) as store:
+        assert store.read_only and len(store) == len(keys)
+        address = Account.from_key(keys[0]).hex_address
+        assert store.get_key(address) == bytes.fromhex(keys[0][2:])
+        with pytest.raises(TypeError):
+            store.add(keys[0])
+    assert len(store) == 0
+
+    copy = CompactKeyStore.load(path, use_mmap=False)
+    assert not copy.read_only
+    assert list(copy.addresses()) == list(CompactKeyStore.from_keys(keys).addresses())
+    copy.add('0x' + '77' * 32)
+    assert len(copy) == len(keys) + 1
+
+    os.chmod(path, 0o644)
+    with pytest.raises(PermissionError):
+        CompactKeyStore.load(path)
+    with open(path, 'wb') as f:
+        f.write(b'garbage')
+    with pytest.raises(ValueError):
+        CompactKeyStore.load(path, check_permissions=False)
+
+
+def test_store_save_replaces_existing_file_with_private_one(tmp_path):
+    path = tmp_path / 'store.keys'
+    path.write_bytes(b'old contents')
+    os.chmod(path, 0o644)
+    CompactKeyStore.from_keys(keys).save(str(path))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert len(CompactKeyStore.load(str(path), use_mmap=False)) == len(keys)
+    assert os.listdir(tmp_path) == ['store.keys']
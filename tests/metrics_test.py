@@ -0,0 +1,74 @@
+import pytest
+
+from cfx_account import Account
+from cfx_account.messages import encode_defunct
+from cfx_account.metrics import (
+    CallbackSink,
+    InMemoryRecorder,
+    PrometheusExporter,
+    set_metrics_sink,
+    start,
+)
+
+from .test_utils import key, transaction
+
+SIGN_STAGES = ["key_parse", "from_check", "drip_conversion", "formatting", "rlp_encode", "keccak", "ecdsa", "build", "total"]
+
+
+@pytest.fixture
+def recorder():
+    recorder = InMemoryRecorder()
+    set_metrics_sink(recorder)
+    yield recorder
+    set_metrics_sink(None)
+
+
+def test_disabled_by_default():
+    assert start("sign_transaction") is None
+
+
+def test_sign_transaction_stages(recorder):
+    Account.sign_transaction(transaction, key)
+    Account.sign_transaction(transaction, key)
+    for stage in SIGN_STAGES:
+        assert recorder.count("sign_transaction", stage) == 2
+    stages_sum = sum(recorder.total_seconds("sign_transaction", stage) for stage in SIGN_STAGES[:-1])
+    assert stages_sum == pytest.approx(recorder.total_seconds("sign_transaction"), rel=0.05)
+
+
+def test_recover_and_keystore_stages(recorder):
+    raw_transaction = Account.sign_transaction(transaction, key).raw_transaction
+    Account.recover_transaction(raw_transaction)
+    message = encode_defunct(text="Hello World")
+    Account.recover_message(message, signature=Account.sign_message(message, key).signature)
+    Account.decrypt(Account.encrypt(key, "password", kdf="pbkdf2", iterations=2), "password")
+    for stage in ("decode", "ecrecover", "address_format", "total"):
+        assert recorder.count("recover_transaction", stage) == 1
+    for stage in ("message_hash", "ecrecover", "address_format", "total"):
+        assert recorder.count("recover_message", stage) == 1
+    assert recorder.count("encrypt") == recorder.count("decrypt") == 1
+
+
+def test_callback_sink():
+    observations = []
+    set_metrics_sink(CallbackSink(lambda *observation: observations.append(observation)))
+    try:
+        Account.sign_transaction(transaction, key)
+    finally:
+        set_metrics_sink(None)
+    assert [stage for _, stage, _ in observations] == SIGN_STAGES
+    assert all(operation == "sign_transaction" and seconds >= 0 for operation, _, seconds in observations)
+
+
+def test_prometheus_exporter():
+    exporter = PrometheusExporter(buckets=(0.1, 1.0))
+    exporter.observe("sign_transaction", "ecdsa", 0.05)
+    exporter.observe("sign_transaction", "ecdsa", 0.5)
+    exporter.observe("sign_transaction", "ecdsa", 5)
+    assert exporter.render().splitlines()[2:] == [
+        'cfx_account_stage_seconds_bucket{operation="sign_transaction",stage="ecdsa",le="0.1"} 1',
+        'cfx_account_stage_seconds_bucket{operation="sign_transaction",stage="ecdsa",le="1.0"} 2',
+        'cfx_account_stage_seconds_bucket{operation="sign_transaction",stage="ecdsa",le="+Inf"} 3',
+        'cfx_account_stage_seconds_sum{operation="sign_transaction",stage="ecdsa"} 5.55',
+        'cfx_account_stage_seconds_count{operation="sign_transaction",stage="ecdsa"} 3',
+    ]
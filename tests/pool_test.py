@@ -0,0 +1,48 @@
+import pytest
+from cfx_utils.token_unit import Drip
+
+from cfx_account import Account
+from cfx_account.signers.pool import ThreadPoolSigner
+
+from .test_utils import address, key, make_transaction, other_key
+
+
+@pytest.fixture
+def signer():
+    pytest.importorskip("coincurve")
+    with ThreadPoolSigner(max_workers=4, backend="coincurve", chunksize=3) as signer:
+        yield signer
+
+
+def test_pool_signs_like_account(signer):
+    transactions = [make_transaction(nonce, value=Drip(nonce)) for nonce in range(10)]
+    signed = signer.sign_transactions(transactions, key)
+    assert signed == [Account.sign_transaction(make_transaction(nonce, value=Drip(nonce)), key) for nonce in range(10)]
+    # the input dicts are left untouched
+    assert all(isinstance(transaction['value'], Drip) for transaction in transactions)
+    assert signer.sign_transactions([], key) == []
+
+
+def test_pool_signs_with_one_key_per_transaction(signer):
+    transactions = [make_transaction(nonce, value=Drip(nonce)) for nonce in range(4)]
+    keys = [key, other_key, key, other_key]
+    signed = signer.sign_transactions(transactions, keys)
+    assert signed == [Account.sign_transaction(tx, k) for tx, k in zip(transactions, keys)]
+    with pytest.raises(ValueError):
+        signer.sign_transactions(transactions, keys[:3])
+
+
+def test_pool_checks_from_field(signer):
+    transaction = make_transaction(1, value=Drip(1))
+    assert signer.sign_transactions([dict(transaction, **{'from': address})], key)[0] == \
+        Account.sign_transaction(transaction, key)
+    with pytest.raises(ValueError):
+        signer.sign_transactions([dict(transaction, **{'from': address})], other_key)
+    with pytest.raises(TypeError):
+        signer.sign_transactions([[1, 2]], key)
+
+
+def test_pool_warns_for_gil_bound_backend(monkeypatch):
+    monkeypatch.setattr("cfx_account.signers.pool.gil_enabled", lambda: True)
+    with pytest.warns(RuntimeWarning):
+        ThreadPoolSigner(max_workers=1, backend="pure-python").close()
@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+from eth_keys import keys
+from eth_keys.backends import NativeECCBackend
+
+from cfx_account import Account
+from cfx_account.backends import EthKeysBackend
+
+from .test_utils import address, key, make_cip1559_transaction, make_transaction
+
+legacy = make_transaction(1)
+cip1559 = make_cip1559_transaction(1)
+
+
+class MockSigner:
+    """
+    Stands for a separate process holding the key, it only sees digests.
+    """
+
+    def __init__(self, private_key):
+        self._key = keys.PrivateKey(bytes.fromhex(private_key[2:]))
+
+    def sign_digests(self, digests):
+        return [self._key.sign_msg_hash(digest).vrs for digest in digests]
+
+
+def test_two_phase_signing_matches_sign_transaction():
+    transactions = [legacy, cip1559, dict(legacy, nonce=2, **{'from': address})]
+    prepared = pickle.loads(pickle.dumps(Account.prepare_digests(transactions)))
+    vrs_list = MockSigner(key).sign_digests([item.digest for item in prepared])
+    signed = Account.attach_signatures(prepared, vrs_list)
+    expected = [Account.sign_transaction(transaction, key) for transaction in transactions]
+    assert signed == expected
+
+
+def test_attach_signatures_checks():
+    prepared = Account.prepare_digests([dict(legacy, **{'from': address})])
+    other_signer = MockSigner('0x' + '11' * 32)
+    with pytest.raises(ValueError):
+        Account.attach_signatures(prepared, other_signer.sign_digests([prepared[0].digest]))
+    with pytest.raises(ValueError):
+        Account.attach_signatures(prepared, [])
+    with pytest.raises(ValueError):
+        Account.attach_signatures(prepared, [(27, 1, 1)])
+    with pytest.raises(TypeError):
+        Account.prepare_digests([[1]])
+
+
+class CountingBackend(EthKeysBackend):
+    def __init__(self):
+        super().__init__(NativeECCBackend())
+        self.recovered = 0
+
+    def recover(self, msg_hash, vrs):
+        self.recovered += 1
+        return super().recover(msg_hash, vrs)
+
+
+def test_attach_signatures_recovers_with_the_signing_backend():
+    prepared = Account.prepare_digests([legacy, dict(legacy, **{'from': address})])
+    vrs_list = MockSigner(key).sign_digests([item.digest for item in prepared])
+    backend = CountingBackend()
+    Account.set_signing_backend(backend, run_self_test=False)
+    try:
+        assert Account.attach_signatures(prepared, vrs_list) == [
+            Account.sign_transaction(legacy, key), Account.sign_transaction(legacy, key)
+        ]
+    finally:
+        Account.set_signing_backend(None)
+    # only the transaction with a from field is checked
+    assert backend.recovered == 1
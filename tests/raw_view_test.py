@@ -0,0 +1,54 @@
+import pytest
+from hexbytes import HexBytes
+from rlp.exceptions import DecodingError
+
+from cfx_account.transactions.cip1559_transactions import CIP1559Transaction
+from cfx_account.transactions.legacy_transactions import LegacyTransaction
+from cfx_account.transactions.views import RawTransactionView
+
+legacy_raw = HexBytes("0xf861dd0101649413d2ba4ed43542e7c54fbb6c5fccb9f269c1f94c016464018080a0a52f639cbed11262a7b88d0a37aef909aa7dc2c36c40689a3d52b8bd1d9482dea054f3bdeb654f73704db4cbc12451fb4c9830ef62b0f24de1a40e4b6fe10f57b2")
+cip1559_raw = HexBytes("0x63667802f869f864646464649419578cf3c71eab48cf810c78b5175d5c9e6ef441646464648c48656c6c6f2c20576f726c64f838f79419578cf3c71eab48cf810c78b5175d5c9e6ef441e1a01234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef800101")
+
+
+def test_legacy_view():
+    view = RawTransactionView(legacy_raw)
+    assert view.transaction_type == 0
+    assert view.as_dict() == LegacyTransaction.from_bytes(legacy_raw).as_dict()
+    assert view.nonce == 1
+    assert bytes(view.to) == bytes.fromhex("13d2ba4ed43542e7c54fbb6c5fccb9f269c1f94c")
+    assert view["gasPrice"] == 1
+    assert view.signing_hash() == LegacyTransaction.from_bytes(legacy_raw).hash()
+    assert HexBytes(view.hash()) == HexBytes("0x692a0ea530a264f4e80ce39f393233e90638ef929c8706802e15299fd0b042b9")
+    with pytest.raises(KeyError):
+        view["maxFeePerGas"]
+
+
+def test_cip1559_view():
+    view = RawTransactionView(cip1559_raw)
+    assert view.transaction_type == 2
+    assert view.nonce == 100
+    assert view["maxFeePerGas"] == 100
+    assert bytes(view.data) == b"Hello, World"
+    assert view.vrs() == (0, 1, 1)
+    assert view["accessList"] == (
+        (
+            bytes.fromhex("19578cf3c71eab48cf810c78b5175d5c9e6ef441"),
+            (0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef,),
+        ),
+    )
+    assert HexBytes(view.signing_hash()) == HexBytes("3da56dbe2b76c41135c2429f3035cd79b1abb68902cf588075c30d4912e71cf3")
+
+
+def test_view_does_not_copy():
+    buffer = bytearray(legacy_raw)
+    view = RawTransactionView(memoryview(buffer))
+    to = view.to
+    to_offset = bytes(buffer).index(bytes(to))
+    buffer[to_offset] ^= 0xFF
+    assert to[0] == buffer[to_offset]
+
+
+@pytest.mark.parametrize("raw", [legacy_raw[:-1], legacy_raw + b"\x00", b"cfx\x02" + bytes(legacy_raw[:5]), b"\x80"])
+def test_malformed_raw_transaction(raw):
+    with pytest.raises(DecodingError):
+        RawTransactionView(raw)
@@ -0,0 +1,50 @@
+import pytest
+from hexbytes import HexBytes
+
+from cfx_account import Account
+from cfx_account.messages import encode_defunct, hash_signable_message
+
+from .test_utils import address, key
+
+raw_tx = '0xf861dd0101649413d2ba4ed43542e7c54fbb6c5fccb9f269c1f94c016464018080a0a52f639cbed11262a7b88d0a37aef909aa7dc2c36c40689a3d52b8bd1d9482dea054f3bdeb654f73704db4cbc12451fb4c9830ef62b0f24de1a40e4b6fe10f57b2'
+
+
+@pytest.fixture
+def recover_cache():
+    Account.enable_recover_cache(maxsize=2)
+    yield
+    Account.disable_recover_cache()
+
+
+def test_recover_cache_disabled_by_default():
+    assert Account.recover_cache_info() is None
+    assert Account.recover_transaction(raw_tx) == address
+
+
+def test_recover_transaction_cache(recover_cache):
+    assert Account.recover_transaction(raw_tx) == address
+    assert Account.recover_transaction(HexBytes(raw_tx)) == address
+    info = Account.recover_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_recover_message_cache(recover_cache):
+    message = encode_defunct(text="Hello World")
+    signed = Account.sign_message(message, key)
+    assert Account.recover_message(message, signature=signed.signature) == address
+    assert Account.recover_message(message, signature=signed.signature) == address
+    assert Account.recover_message(message, vrs=(signed.v, signed.r, signed.s)) == address
+    assert Account.recover_message(message, vrs=(hex(signed.v), hex(signed.r), hex(signed.s))) == address
+    info = Account.recover_cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    # the least recently used entry is evicted
+    assert Account.recover_transaction(raw_tx) == address
+    assert Account.recover_cache_info().currsize == 2
+    with pytest.raises(TypeError):
+        Account.recover_message(message)
+
+
+def test_hash_signable_message():
+    # the hash comes from eth_account, pinned in setup.py: a change upstream fails here
+    message_hash = hash_signable_message(encode_defunct(text="Hello World"))
+    assert message_hash == bytes.fromhex("ea52b915019abc34917e3ea25acc1283fbc5841fd554baf6b0fbf21877a0fd34")
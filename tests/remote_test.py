@@ -0,0 +1,155 @@
+import asyncio
+import json
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cfx_utils.token_unit import Drip
+
+from cfx_account import Account
+from cfx_account.messages import encode_defunct
+from cfx_account.server import UNAUTHORIZED, RPCError, SigningServer
+from cfx_account.signers.remote import RemoteAccount, RemoteSignerClient
+
+from .test_utils import address, key, make_transaction
+
+
+def make_remote_transaction(nonce):
+    # token units and bytes go through the client's JSON encoding
+    return make_transaction(nonce, value=Drip(nonce), data=b'\x01\x02')
+
+
+@pytest.fixture
+def endpoint(tmp_path):
+    # a SigningServer running on its own event loop thread
+    path = str(tmp_path / 'signer.sock')
+    loop = asyncio.new_event_loop()
+    server = SigningServer([key], backend='pure-python')
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.serve_unix(path))
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait(5)
+    yield 'unix://' + path
+    asyncio.run_coroutine_threadsafe(server.aclose(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+class StandInHandler(socketserver.StreamRequestHandler):
+    # answers cfx_accounts only, stays silent on anything else
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            if request['method'] == 'cfx_accounts':
+                response = {'jsonrpc': '2.0', 'id': request['id'], 'result': [address]}
+                self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+class SlowHandler(socketserver.StreamRequestHandler):
+    # answers each call of a batch separately, 0.15 seconds apart
+    def handle(self):
+        for line in self.rfile:
+            for request in json.loads(line):
+                time.sleep(0.15)
+                response = {'jsonrpc': '2.0', 'id': request['id'], 'result': [address]}
+                self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+def test_remote_account_signs_like_local_account(endpoint):
+    with RemoteSignerClient(endpoint, pool_size=2) as client:
+        account = RemoteAccount.from_client(client, network_id=1)
+        local = Account.from_key(key, network_id=1)
+        assert account.address == local.address
+        assert account.hex_address == address
+        assert account.sign_transaction(make_remote_transaction(0)) == local.sign_transaction(make_remote_transaction(0))
+        message = encode_defunct(text='hello')
+        assert account.sign_message(message) == local.sign_message(message)
+        transactions = [make_remote_transaction(nonce) for nonce in range(5)]
+        assert account.sign_transactions(transactions) == [local.sign_transaction(tx) for tx in transactions]
+
+
+def test_remote_account_reports_signer_errors(endpoint):
+    with RemoteSignerClient(endpoint) as client:
+        with pytest.raises(RPCError):
+            RemoteAccount('0x' + '10' * 20, client).sign_transaction(make_remote_transaction(0))
+        with pytest.raises(RPCError):
+            RemoteAccount(address, client).sign_transaction(dict(make_remote_transaction(0), nonce='nope'))
+
+
+def test_remote_account_pipelines_concurrent_calls(endpoint):
+    local = Account.from_key(key)
+    with RemoteSignerClient(endpoint, pool_size=2) as client:
+        account = RemoteAccount(address, client)
+        with ThreadPoolExecutor(8) as executor:
+            signed = list(executor.map(account.sign_transaction, [make_remote_transaction(nonce) for nonce in range(24)]))
+        # connections are reused rather than opened per call
+        assert len([connection for connection in client._connections if connection is not None]) == 2
+    assert signed == [local.sign_transaction(make_remote_transaction(nonce)) for nonce in range(24)]
+
+
+def test_remote_client_with_stand_in_signer_and_timeout(tmp_path):
+    path = str(tmp_path / 'stand-in.sock')
+    server = socketserver.ThreadingUnixStreamServer(path, StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with RemoteSignerClient('unix://' + path, pool_size=1, timeout=0.2) as client:
+            account = RemoteAccount.from_client(client)
+            assert account.address == address
+            with pytest.raises(TimeoutError):
+                account.sign_transaction(make_remote_transaction(0))
+            # the connection stays usable after a timeout
+            assert client.call('cfx_accounts', []) == [address]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_remote_client_timeout_covers_the_whole_batch(tmp_path):
+    path = str(tmp_path / 'slow.sock')
+    server = socketserver.ThreadingUnixStreamServer(path, SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with RemoteSignerClient('unix://' + path, pool_size=1) as client:
+            assert client.call_many([('cfx_accounts', [])] * 2, timeout=1) == [[address]] * 2
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                # every response arrives within the timeout of the previous one, the batch does not
+                client.call_many([('cfx_accounts', [])] * 4, timeout=0.3)
+            assert time.monotonic() - started < 0.5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_remote_client_sends_auth_token_over_tcp():
+    loop = asyncio.new_event_loop()
+    server = SigningServer([key], backend='pure-python', auth_token='secret')
+    tcp_server = loop.run_until_complete(server.serve_tcp())
+    port = tcp_server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        with RemoteSignerClient(f'tcp://127.0.0.1:{port}', auth_token='secret') as client:
+            assert client.call('cfx_accounts', []) == [address]
+        with RemoteSignerClient(f'tcp://127.0.0.1:{port}', auth_token='wrong', timeout=2) as client:
+            with pytest.raises(RPCError) as e:
+                client.call('cfx_accounts', [])
+            assert e.value.code == UNAUTHORIZED
+    finally:
+        asyncio.run_coroutine_threadsafe(server.aclose(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+
+
+def test_remote_client_rejects_unknown_endpoints():
+    with pytest.raises(ValueError):
+        RemoteSignerClient('http://localhost:8545')
@@ -0,0 +1,47 @@
+import pytest
+from cfx_utils.token_unit import GDrip
+
+from cfx_account import Account
+
+from .test_utils import key, make_cip1559_transaction, make_transaction, other_key
+
+legacy = make_transaction(1, data=b'\x01\x02')
+cip1559 = make_cip1559_transaction(
+    1, accessList=[{'address': '0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441', 'storageKeys': [1]}]
+)
+
+
+@pytest.mark.parametrize(
+    'transaction,overrides',
+    [
+        (legacy, {'gasPrice': GDrip(2), 'epochHeight': '0x1000'}),
+        (legacy, {}),
+        (cip1559, {'maxFeePerGas': 20, 'maxPriorityFeePerGas': GDrip(1)}),
+        (cip1559, {'to': '0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441', 'accessList': []}),
+    ],
+)
+def test_resign_matches_sign_transaction(transaction, overrides):
+    signed = Account.sign_transaction(transaction, other_key)
+    resigned = Account.resign(signed.raw_transaction, overrides, key)
+    assert resigned == Account.sign_transaction(dict(transaction, **overrides), key)
+    assert Account.recover_transaction(resigned.raw_transaction) == Account.from_key(key).hex_address
+
+
+def test_resign_many():
+    raw_transactions = [
+        Account.sign_transaction(dict(legacy, nonce=nonce), key).raw_transaction.hex() for nonce in range(3)
+    ]
+    shared = Account.resign_many(raw_transactions, {'gasPrice': 5}, key)
+    assert shared == [Account.sign_transaction(dict(legacy, nonce=nonce, gasPrice=5), key) for nonce in range(3)]
+    per_transaction = Account.resign_many(raw_transactions, [{'gasPrice': nonce + 2} for nonce in range(3)], key)
+    assert per_transaction == [
+        Account.sign_transaction(dict(legacy, nonce=nonce, gasPrice=nonce + 2), key) for nonce in range(3)
+    ]
+    with pytest.raises(ValueError):
+        Account.resign_many(raw_transactions, [{}], key)
+
+
+def test_resign_rejects_unknown_fields():
+    raw_transaction = Account.sign_transaction(legacy, key).raw_transaction
+    with pytest.raises(ValueError):
+        Account.resign(raw_transaction, {'maxFeePerGas': 1}, key)
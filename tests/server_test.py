@@ -0,0 +1,287 @@
+import asyncio
+import json
+import os
+import stat
+
+import pytest
+
+from cfx_account import Account
+from cfx_account.messages import encode_defunct
+from cfx_account.server import (
+    SERVER_BUSY,
+    SERVER_ERROR,
+    UNAUTHORIZED,
+    RPCError,
+    SigningServer,
+    signable_message_to_json,
+    signed_message_from_json,
+    signed_transaction_from_json,
+)
+
+from .test_utils import address, key, make_transaction
+
+
+def make_server(**kwargs):
+    kwargs.setdefault('backend', 'pure-python')
+    return SigningServer([key], **kwargs)
+
+
+def request(request_id, method, *params):
+    return {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': list(params)}
+
+
+def test_server_signs_like_account():
+    async def main():
+        server = make_server()
+        try:
+            assert await server.handle_request(request(1, 'cfx_accounts')) == {'jsonrpc': '2.0', 'id': 1, 'result': [address]}
+            response = await server.handle_request(request(2, 'cfx_signTransaction', address, make_transaction(0)))
+            assert signed_transaction_from_json(response['result']) == Account.sign_transaction(make_transaction(0), key)
+
+            message = encode_defunct(text='hello')
+            response = await server.handle_request(request(3, 'cfx_signMessage', address, signable_message_to_json(message)))
+            signed = signed_message_from_json(response['result'])
+            assert signed == Account.sign_message(message, key)
+
+            response = await server.handle_request(
+                request(4, 'cfx_recoverMessage', signable_message_to_json(message), signed.signature.to_0x_hex())
+            )
+            assert response['result'] == address
+            raw = Account.sign_transaction(make_transaction(0), key).raw_transaction.to_0x_hex()
+            assert (await server.handle_request(request(5, 'cfx_recoverTransaction', raw)))['result'] == address
+        finally:
+            await server.aclose()
+
+    asyncio.run(main())
+
+
+def test_server_reports_errors():
+    async def main():
+        server = make_server()
+        try:
+            response = await server.handle_request(request(1, 'cfx_nope'))
+            assert response['error']['code'] == -32601
+            response = await server.handle_request(request(2, 'cfx_signTransaction', '0x' + '00' * 20, make_transaction(0)))
+            assert response['error']['code'] == -32602
+            # a failing call does not fail the others of its batch
+            responses = await server.handle_request([
+                request(3, 'cfx_signTransaction', address, dict(make_transaction(0), nonce='nope')),
+                request(4, 'cfx_signTransaction', address, make_transaction(1)),
+            ])
+            assert 'error' in responses[0] and 'result' in responses[1]
+            assert await server.handle_request({'jsonrpc': '2.0', 'method': 'cfx_accounts'}) is None
+        finally:
+            await server.aclose()
+
+    asyncio.run(main())
+
+
+def test_server_batches_concurrent_calls():
+    async def main():
+        server = make_server(max_batch_size=8, max_wait=0.5, max_workers=1)
+        try:
+            calls = [server.call('cfx_signTransaction', [address, make_transaction(nonce)]) for nonce in range(16)]
+            results = await asyncio.gather(*calls)
+        finally:
+            await server.aclose()
+        assert [signed_transaction_from_json(result) for result in results] == [
+            Account.sign_transaction(make_transaction(nonce), key) for nonce in range(16)
+        ]
+        # full batches do not wait for max_wait
+        assert (server.batch_count, server.call_count) == (2, 16)
+
+    asyncio.run(main())
+
+
+def test_server_rejects_calls_when_queue_is_full():
+    async def main():
+        server = make_server(max_batch_size=1, max_pending=2, max_wait=0, max_workers=1)
+        try:
+            calls = [server.call('cfx_signTransaction', [address, make_transaction(nonce)]) for nonce in range(8)]
+            results = await asyncio.gather(*calls, return_exceptions=True)
+        finally:
+            await server.aclose()
+        rejected = [result for result in results if isinstance(result, Exception)]
+        assert rejected and all(error.code == SERVER_BUSY for error in rejected)
+        assert len(rejected) < len(results)
+
+    asyncio.run(main())
+
+
+def test_server_over_unix_socket(tmp_path):
+    path = str(tmp_path / 'signer.sock')
+
+    async def main():
+        server = make_server()
+        await server.serve_unix(path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            # pipelined requests, answered by id
+            for nonce in range(3):
+                writer.write(json.dumps(request(nonce, 'cfx_signTransaction', address, make_transaction(nonce))).encode() + b'\n')
+            writer.write(b'not json\n')
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(4)]
+            writer.close()
+        finally:
+            await server.aclose()
+        errors = [response for response in responses if 'error' in response]
+        assert len(errors) == 1 and errors[0]['error']['code'] == -32700
+        by_id = {response['id']: response['result'] for response in responses if 'result' in response}
+        for nonce in range(3):
+            assert signed_transaction_from_json(by_id[nonce]) == Account.sign_transaction(make_transaction(nonce), key)
+
+    asyncio.run(main())
+
+
+async def post(reader, writer, body, headers):
+    writer.write(
+        b'POST / HTTP/1.1\r\n' + b''.join(b'%s: %s\r\n' % (name.encode(), value.encode()) for name, value in headers.items())
+        + b'Content-Type: application/json\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    response_headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b'\r\n':
+            break
+        name, _, value = line.decode().partition(':')
+        response_headers[name.lower()] = value.strip()
+    response_body = await reader.readexactly(int(response_headers['content-length']))
+    return status, json.loads(response_body) if response_body else None
+
+
+def test_server_over_http():
+    async def main():
+        server = make_server()
+        http_server = await server.serve_http()
+        port = http_server.sockets[0].getsockname()[1]
+        headers = {'Host': f'localhost:{port}', 'Authorization': f'Bearer {server.auth_token}'}
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            bodies = []
+            # two requests on one kept-alive connection
+            for request_id in range(2):
+                status, body = await post(reader, writer, json.dumps(request(request_id, 'cfx_accounts')).encode(), headers)
+                assert status == 200
+                bodies.append(body)
+            writer.close()
+        finally:
+            await server.aclose()
+        assert [body['result'] for body in bodies] == [[address], [address]]
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize('headers, expected_status', [
+    ({'Host': '127.0.0.1'}, 401),
+    ({'Host': '127.0.0.1', 'Authorization': 'Bearer wrong'}, 401),
+    ({'Host': 'evil.example:8545', 'Authorization': 'Bearer {token}'}, 403),
+    ({'Authorization': 'Bearer {token}'}, 403),
+    ({'Host': '[::1]', 'Origin': 'https://evil.example', 'Authorization': 'Bearer {token}'}, 403),
+])
+def test_server_over_http_rejects_unauthorized_requests(headers, expected_status):
+    async def main():
+        server = make_server()
+        http_server = await server.serve_http()
+        port = http_server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            sent = {name: value.format(token=server.auth_token) for name, value in headers.items()}
+            status, body = await post(reader, writer, json.dumps(request(1, 'cfx_accounts')).encode(), sent)
+            writer.close()
+        finally:
+            await server.aclose()
+        assert (status, body) == (expected_status, None)
+
+    asyncio.run(main())
+
+
+def test_server_over_tcp_requires_token():
+    async def main():
+        server = make_server(auth_token='secret')
+        tcp_server = await server.serve_tcp()
+        port = tcp_server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(json.dumps(request(1, 'cfx_accounts')).encode() + b'\n')
+            rejected = json.loads(await reader.readline())
+            assert await reader.readline() == b''
+            writer.close()
+
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'{"auth": "secret"}\n' + json.dumps(request(2, 'cfx_accounts')).encode() + b'\n')
+            accepted = json.loads(await reader.readline())
+            writer.close()
+        finally:
+            await server.aclose()
+        assert rejected['error']['code'] == UNAUTHORIZED
+        assert accepted['result'] == [address]
+
+    asyncio.run(main())
+
+
+def test_server_unix_socket_is_private(tmp_path):
+    path = str(tmp_path / 'signer.sock')
+
+    async def main():
+        server = make_server()
+        umask = os.umask(0)
+        try:
+            await server.serve_unix(path)
+            assert os.umask(0) == 0
+        finally:
+            os.umask(umask)
+            await server.aclose()
+        # a stale socket is replaced
+        server = make_server()
+        await server.serve_unix(path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(json.dumps(request(0, 'cfx_accounts')).encode() + b'\n')
+            assert json.loads(await reader.readline())['result'] == [address]
+            writer.close()
+        finally:
+            await server.aclose()
+
+    asyncio.run(main())
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.listdir(tmp_path) == ['signer.sock']
+
+
+def test_server_unix_socket_keeps_other_files(tmp_path):
+    path = tmp_path / 'signer.sock'
+    path.write_bytes(b'not a socket')
+
+    async def main():
+        server = make_server()
+        try:
+            with pytest.raises(FileExistsError):
+                await server.serve_unix(str(path))
+        finally:
+            await server.aclose()
+
+    asyncio.run(main())
+    assert path.read_bytes() == b'not a socket'
+
+
+def test_server_fails_queued_calls_when_batching_fails():
+    async def main():
+        server = make_server()
+        # run_in_executor raises on a shut down executor
+        server._executor.shutdown()
+        try:
+            with pytest.raises(RPCError) as e:
+                await asyncio.wait_for(server.call('cfx_signTransaction', [address, make_transaction(0)]), 5)
+            assert e.value.code == SERVER_ERROR
+        finally:
+            await server.aclose()
+
+    asyncio.run(main())
+
+
+def test_server_only_listens_on_loopback():
+    server = make_server()
+    with pytest.raises(ValueError):
+        asyncio.run(server.serve_tcp('0.0.0.0'))
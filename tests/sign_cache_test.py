@@ -0,0 +1,59 @@
+import pytest
+from cfx_utils.token_unit import Drip, GDrip
+
+from cfx_account import Account
+from cfx_account._utils.cache import LRUCache
+
+from .test_utils import address, key, make_transaction, other_key
+
+transaction = make_transaction(1, gasPrice=10**9)
+
+
+@pytest.fixture
+def sign_cache():
+    Account.enable_sign_cache(maxsize=4)
+    yield
+    Account.disable_sign_cache()
+
+
+def test_sign_cache_disabled_by_default():
+    assert Account.sign_cache_info() is None
+
+
+def test_sign_cache_returns_identical_results(sign_cache):
+    expected = Account.sign_transaction(transaction, key)
+    # differently formatted dicts of the same transaction share an entry
+    same_transaction = dict(transaction, value=Drip(1), gasPrice=GDrip(1), **{'from': address})
+    assert Account.sign_transaction(same_transaction, key) == expected
+    assert Account.sign_transaction(transaction, Account.parse_private_key(key)) == expected
+    info = Account.sign_cache_info()
+    # the plain dict is cached by its items and by its signing hash, the dict with units by its signing hash only
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    Account.disable_sign_cache()
+    assert Account.sign_transaction(transaction, key) == expected
+
+
+def test_sign_cache_separates_keys_and_checks_from(sign_cache):
+    signed = Account.sign_transaction(transaction, key)
+    other = Account.sign_transaction(transaction, other_key)
+    assert signed != other
+    assert Account.sign_transaction(transaction, other_key) == other
+    with pytest.raises(ValueError):
+        # cached entry, from field of another key
+        Account.sign_transaction(dict(transaction, **{'from': address}), other_key)
+    with pytest.raises(ValueError):
+        Account.sign_transaction(transaction, '0x1234')
+
+
+def test_lru_cache_ttl():
+    now = [0.0]
+    cache = LRUCache(2, ttl=10, clock=lambda: now[0])
+    cache.put('a', 1)
+    now[0] = 9.9
+    assert cache.get('a') == 1
+    now[0] = 10
+    assert cache.get('a') is None
+    assert cache.info().currsize == 0
+    with pytest.raises(ValueError):
+        LRUCache(2, ttl=0)
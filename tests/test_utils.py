@@ -1,4 +1,34 @@
 from hexbytes import HexBytes
 
+key = '0xcc7939276283a32f60d2fad7d16cac972300308fe99ec98d0e63765d02e24863'
+address = '0x1b981f81568eDD843DcB5b407ff0DD2e25618622'
+other_key = '0x' + '11' * 32
+
+transaction = {
+    'to': 'cfxtest:aak7fsws4u4yf38fk870218p1h3gxut3ku00u1k1da',
+    'nonce': 1,
+    'value': 1,
+    'gas': 100,
+    'gasPrice': 1,
+    'storageLimit': 100,
+    'epochHeight': 100,
+    'chainId': 1,
+}
+
 def assert_hex_equal(a, b):
     assert HexBytes(a) == HexBytes(b), f"{HexBytes(a).hex()} != {HexBytes(b).hex()}"
+
+def make_transaction(nonce, **fields):
+    """
+    A copy of ``transaction`` with ``nonce``, fields are added or replaced.
+    """
+    return dict(transaction, nonce=nonce, **fields)
+
+def make_cip1559_transaction(nonce, **fields):
+    """
+    ``make_transaction`` as a CIP-1559 transaction, with maxFeePerGas 10 and maxPriorityFeePerGas 1.
+    """
+    cip1559 = make_transaction(nonce, maxFeePerGas=10, maxPriorityFeePerGas=1)
+    del cip1559['gasPrice']
+    cip1559.update(fields)
+    return cip1559
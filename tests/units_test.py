@@ -0,0 +1,42 @@
+import decimal
+
+import pytest
+from cfx_utils.exceptions import InvalidTokenValuePrecision
+from cfx_utils.token_unit import CFX, Drip, GDrip
+from cfx_utils.token_unit import to_int_if_drip_units as reference_to_int_if_drip_units
+
+from cfx_account._utils.units import drip_units_to_int, drip_units_to_int_many, to_int_if_drip_units
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, 10**18, "0x10", None, b"\x01", Drip(5), CFX(1), CFX(decimal.Decimal("0.1")), GDrip(3),
+     CFX(decimal.Decimal("123456789.000000000000000001"))],
+)
+def test_to_int_if_drip_units_matches_cfx_utils(value):
+    assert to_int_if_drip_units(value) == reference_to_int_if_drip_units(value)
+
+
+def test_to_int_if_drip_units_rejects_fractional_drip():
+    value = CFX(1)
+    value._value = decimal.Decimal("0.0000000000000000001")
+    with pytest.raises(InvalidTokenValuePrecision):
+        to_int_if_drip_units(value)
+
+
+def test_drip_units_to_int_copies_only_when_needed():
+    plain = {"gasPrice": 1, "value": "0x1", "nonce": 1}
+    assert drip_units_to_int(plain) is plain
+    with_units = {"gasPrice": GDrip(1), "value": CFX(1), "nonce": 1}
+    converted = drip_units_to_int(with_units)
+    assert converted == {"gasPrice": 10**9, "value": 10**18, "nonce": 1}
+    assert isinstance(with_units["value"], CFX)
+
+
+def test_drip_units_to_int_many():
+    gas_price = GDrip(2)
+    batch = [{"gasPrice": gas_price, "value": CFX(index)} for index in range(3)] + [{"gasPrice": 1}, [1]]
+    converted = drip_units_to_int_many(batch)
+    assert converted[:3] == [{"gasPrice": 2 * 10**9, "value": index * 10**18} for index in range(3)]
+    assert converted[3] is batch[3]
+    assert converted[4] is batch[4]
@@ -0,0 +1,62 @@
+import pytest
+from cfx_utils.token_unit import CFX, Drip
+
+from cfx_account import Account
+from cfx_account.transactions.validation import TransactionValidationError, validate_transactions
+
+from .test_utils import make_cip1559_transaction, make_transaction
+
+legacy = make_transaction(1, value=CFX(1), gasPrice=Drip(1))
+cip1559 = make_cip1559_transaction(
+    1,
+    to='0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441',
+    maxFeePerGas=1,
+    maxPriorityFeePerGas='0x1',
+    accessList=[{'address': '0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441', 'storageKeys': [1, '0x02']}],
+)
+
+
+def test_valid_batch():
+    report = validate_transactions([legacy, cip1559, dict(legacy, type=0, data='0x1234'), dict(cip1559, type='0x2')])
+    assert report.is_valid
+    assert report.total == 4
+
+
+def test_all_errors_are_reported():
+    rows = [
+        legacy,
+        # legacy transactions only accept base32 receivers
+        dict(legacy, to='0x19578CF3c71eaB48cF810c78B5175d5c9E6Ef441'),
+        dict(legacy, nonce='1', extra=1),
+        {key: value for key, value in cip1559.items() if key != 'gas'},
+        dict(cip1559, accessList=[{'address': b'\x01' * 19, 'storageKeys': []}], data=1.5),
+        dict(cip1559, type=5),
+        [1, 2],
+        dict(legacy, value='a'),
+    ]
+    report = validate_transactions(rows)
+    assert not report.is_valid
+    assert report.invalid_indices == [1, 2, 3, 4, 5, 6, 7]
+    by_row = report.errors_by_row()
+    assert [error.field for error in by_row[1]] == ['to']
+    assert sorted(error.field for error in by_row[2]) == ['extra', 'nonce']
+    assert by_row[3] == [TransactionValidationError(3, 'gas', 'missing field')]
+    assert sorted(error.field for error in by_row[4]) == ['accessList', 'data']
+    assert by_row[5][0].field == 'type'
+    assert by_row[6][0].field is None
+    assert by_row[7][0].field == 'value'
+    assert report.as_dicts()[0] == {'index': 1, 'field': 'to', 'message': by_row[1][0].message}
+
+
+def test_repeated_values_are_distinguished_by_type():
+    report = validate_transactions([legacy, dict(legacy, nonce=True), dict(legacy, nonce=1)])
+    assert report.invalid_indices == [1]
+
+
+def test_gas_price_and_access_list_is_typed_like_signing():
+    transaction = dict(legacy, accessList=[])
+    # signing infers type 1, which it does not support
+    with pytest.raises(TypeError):
+        Account.sign_transaction(transaction, '0x' + '11' * 32)
+    report = validate_transactions([transaction])
+    assert report.errors == [TransactionValidationError(0, 'type', 'unknown transaction type: 1')]
@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from cfx_account import Account
+from cfx_account._utils.vanity import parse_prefix
+
+
+def is_odd(address):
+    return int(address[-1], 16) % 2 == 1
+
+
+def test_create_matching_hex_prefix():
+    acct = Account.create_matching('0x1AB', workers=1)
+    assert acct.hex_address.lower().startswith('0x1ab')
+    assert acct.network_id is None
+    assert Account.from_key(acct.key).hex_address == acct.hex_address
+
+
+def test_create_matching_base32_prefix_in_processes():
+    reports = []
+    acct = Account.create_matching('CFXTEST:AAT', workers=2, progress=lambda *report: reports.append(report))
+    assert acct.address.startswith('cfxtest:aat')
+    assert acct.network_id == 1
+    attempts, rate = reports[-1]
+    assert attempts > 0 and rate > 0
+
+
+def test_create_matching_predicate():
+    acct = Account.create_matching(is_odd, workers=2)
+    assert is_odd(acct.address)
+    acct = Account.create_matching(lambda address: address.endswith('a'), network_id=1029, workers=1)
+    assert acct.address.startswith('cfx:') and acct.address.endswith('a')
+
+
+def test_create_matching_stops():
+    with pytest.raises(TimeoutError):
+        Account.create_matching('0x1' + '0' * 39, workers=1, timeout=0.2)
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    with pytest.raises(CancelledError):
+        Account.create_matching('0x1' + '0' * 39, workers=2, cancel=cancel)
+    with pytest.raises(ZeroDivisionError):
+        Account.create_matching(lambda address: 1 / 0, workers=1)
+
+
+@pytest.mark.parametrize('prefix', ['0x2', '0x', '0x1g', 'cfx:b', 'cfx:aaz', 'cfx:aai', 'aat', 'foo:aat'])
+def test_invalid_prefixes(prefix):
+    with pytest.raises(ValueError):
+        parse_prefix(prefix, None)
+
+
+def test_prefix_matcher():
+    matcher, network_id = parse_prefix('cfx:aa', 1029)
+    assert network_id == 1029 and matcher(bytes.fromhex('1' + '0' * 39))
+    matcher, _ = parse_prefix('0x1a2', None)
+    assert matcher(bytes.fromhex('1a2' + 'f' * 37)) and not matcher(bytes.fromhex('1a3' + '0' * 37))
+    with pytest.raises(ValueError):
+        parse_prefix('cfx:aat', 1)